@@ -23,11 +23,15 @@ class TextAsDefault(NamedTuple):
     text: str
 
 
+def _loaded(key):
+    return {name: entry_point.load() for name, entry_point in ComponentBuilder.entry_points_for(key).items()}
+
+
 CUSTOM = {
-    "discovery": ComponentBuilder.entry_points_for("virtualenv.discovery"),
-    "creator": ComponentBuilder.entry_points_for("virtualenv.create"),
-    "seeder": ComponentBuilder.entry_points_for("virtualenv.seed"),
-    "activators": ComponentBuilder.entry_points_for("virtualenv.activate"),
+    "discovery": _loaded("virtualenv.discovery"),
+    "creator": _loaded("virtualenv.create"),
+    "seeder": _loaded("virtualenv.seed"),
+    "activators": _loaded("virtualenv.activate"),
 }
 
 
@@ -44,6 +44,9 @@ class LogSession:
 
         if self.session.activators:
             lines.append(f"  activators {','.join(i.__class__.__name__ for i in self.session.activators)}")
+        if self.session.verbosity > 2:  # noqa: PLR2004 # only in verbose mode
+            lines.append("  timings")
+            lines.extend(f"    {name} {elapsed * 1000:.0f}ms" for name, elapsed in self.session.timings.items())
         return "\n".join(lines)
 
 
@@ -1,67 +1,83 @@
 from __future__ import annotations
+
 import os
 import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
 from .activator import Activator
+
 if sys.version_info >= (3, 10):
     from importlib.resources import files
+
+    def read_binary(module_name: str, filename: str) -> bytes:
+        return (files(module_name) / filename).read_bytes()
+
 else:
     from importlib.resources import read_binary
 
+
 class ViaTemplateActivator(Activator, ABC):
     @abstractmethod
     def templates(self):
-        """
-        Return a list of templates to use for generating activation scripts.
-        
-        :return: A list of template names
-        """
         raise NotImplementedError
 
     def generate(self, creator):
         dest_folder = creator.bin_dir
-        for template in self.templates():
-            content = self.read_template(template)
-            dest = os.path.join(dest_folder, template)
-            with open(dest, 'wb') as file_handler:
-                file_handler.write(content)
-
-    def read_template(self, template):
-        """
-        Read the content of a template file.
-        
-        :param template: The name of the template file
-        :return: The content of the template file
-        """
-        package = self.__class__.__module__
-        if sys.version_info >= (3, 10):
-            content = files(package).joinpath(template).read_bytes()
-        else:
-            content = read_binary(package, template)
-        return self.instantiate_template(content, template, self.replacements(self.creator, self.dest_folder))
+        replacements = self.replacements(creator, dest_folder)
+        generated = self._generate(replacements, self.templates(), dest_folder, creator)
+        if self.flag_prompt is not None:
+            creator.pyenv_cfg["prompt"] = self.flag_prompt
+        return generated
 
-    @abstractmethod
-    def replacements(self, creator, dest_folder):
-        """
-        Generate replacements for the template.
-        
-        :param creator: The creator object
-        :param dest_folder: The destination folder
-        :return: A dictionary of replacements
-        """
-        raise NotImplementedError
+    def replacements(self, creator, dest_folder):  # noqa: ARG002
+        return {
+            "__VIRTUAL_PROMPT__": "" if self.flag_prompt is None else self.flag_prompt,
+            "__VIRTUAL_ENV__": str(creator.dest),
+            "__VIRTUAL_NAME__": creator.env_name,
+            "__BIN_NAME__": str(creator.bin_dir.relative_to(creator.dest)),
+            "__PATH_SEP__": os.pathsep,
+        }
+
+    def _generate(self, replacements, templates, to_folder, creator):
+        generated = []
+        for template in templates:
+            text = self.instantiate_template(replacements, template, creator)
+            dest = to_folder / self.as_name(template)
+            # remove the file if it already exists - this prevents permission
+            # errors when the dest is not writable
+            if dest.exists():
+                dest.unlink()
+            # Powershell assumes Windows 1252 encoding when reading files without BOM
+            encoding = "utf-8-sig" if str(template).endswith(".ps1") else "utf-8"
+            # use write_bytes to avoid platform specific line normalization (\n -> \r\n)
+            dest.write_bytes(text.encode(encoding))
+            generated.append(dest)
+        return generated
 
-    def instantiate_template(self, content, template, replacements):
-        """
-        Replace placeholders in the template with actual values.
-        
-        :param content: The template content
-        :param template: The template name
-        :param replacements: A dictionary of replacements
-        :return: The instantiated template content
-        """
+    def as_name(self, template):
+        return template
+
+    def instantiate_template(self, replacements, template, creator):
+        # read content as binary to avoid platform specific line normalization (\n -> \r\n)
+        binary = _read_template(self.__module__, template)
+        text = binary.decode("utf-8", errors="strict")
         for key, value in replacements.items():
-            content = content.replace(key.encode(), value.encode())
-        return content
+            value_uni = self._repr_unicode(creator, value)
+            text = text.replace(key, value_uni)
+        return text
+
+    @staticmethod
+    def _repr_unicode(creator, value):  # noqa: ARG004
+        return value  # by default, we just let it be unicode
+
+
+@lru_cache(maxsize=None)
+def _read_template(module_name, template):
+    # the templates ship with the package, so creating many environments in one process only needs to read them once
+    return read_binary(module_name, template)
+
 
-__all__ = ['ViaTemplateActivator']
+__all__ = [
+    "ViaTemplateActivator",
+]
@@ -8,6 +8,7 @@ import os
 from platformdirs import user_data_dir
 
 from .na import AppDataDisabled
+from .overlay import OverlayAppData
 from .read_only import ReadOnlyAppData
 from .via_disk_folder import AppDataDiskFolder
 from .via_tempdir import TempAppData
@@ -23,6 +24,8 @@ def _default_app_data_dir(env):
 def make_app_data(folder, **kwargs):
     is_read_only = kwargs.pop("read_only")
     env = kwargs.pop("env")
+    shared = kwargs.pop("shared", None)
+    max_size = kwargs.pop("max_size", None)
     if kwargs:  # py3+ kwonly
         msg = "unexpected keywords: {}"
         raise TypeError(msg)
@@ -42,7 +45,12 @@ def make_app_data(folder, **kwargs):
             logging.info("could not create app data folder %s due to %r", folder, exception)
 
     if os.access(folder, os.W_OK):
-        return AppDataDiskFolder(folder)
+        if shared is not None:
+            shared = os.path.abspath(shared)
+            if os.path.isdir(shared) and shared != folder:
+                return OverlayAppData(folder, shared, max_size)
+            logging.info("ignore shared app data folder %s as it is not a directory (or the app data itself)", shared)
+        return AppDataDiskFolder(folder, max_size)
     logging.debug("app data folder %s has no write access", folder)
     return TempAppData()
 
@@ -50,6 +58,7 @@ def make_app_data(folder, **kwargs):
 __all__ = (
     "AppDataDisabled",
     "AppDataDiskFolder",
+    "OverlayAppData",
     "ReadOnlyAppData",
     "TempAppData",
     "make_app_data",
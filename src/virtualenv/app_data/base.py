@@ -17,6 +17,12 @@ class AppData(ABC):
         """Called when the user passes in the reset app data."""
         raise NotImplementedError("Subclasses must implement this method")
 
+    @property
+    @abstractmethod
+    def py_info_index(self):
+        """:return: the index of interpreter information, keyed by the executable fingerprint"""
+        raise NotImplementedError
+
     @contextmanager
     def ensure_extracted(self, path, to_folder=None):
         """Some paths might be within the zipapp, unzip these to a path on the disk."""
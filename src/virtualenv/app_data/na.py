@@ -33,8 +33,34 @@ class AppDataDisabled(AppData):
         """Do nothing as there's no Python info to clear."""
         return
 
+    def plugins(self):
+        return ContentStoreNA()
+
+    def wheel_image(self, for_py_version, name):
+        raise self.error
+
+    def wheel_store(self):
+        raise self.error
+
+    def wheel_index(self, folder):  # noqa: ARG002
+        return ContentStoreNA()
+
+    def path_listing(self):
+        return ContentStoreNA()
+
+    @property
+    def py_info_index(self):
+        return PyInfoIndexNA()
+
 class ContentStoreNA(ContentStore):
 
+    def exists(self):
+        return False
+
+    @contextmanager
+    def locked(self):
+        yield
+
     def read(self):
         """Return None as there's nothing to read."""
         return None
@@ -46,4 +72,25 @@ class ContentStoreNA(ContentStore):
     def remove(self):
         """Do nothing as there's nothing to remove."""
         return
-__all__ = ['AppDataDisabled', 'ContentStoreNA']
+
+class PyInfoIndexNA:
+    def validate(self, paths):  # noqa: ARG002
+        return {}
+
+    def get(self, path):  # noqa: ARG002
+        return None
+
+    def put(self, path, content):
+        pass
+
+    def remove(self, path):
+        pass
+
+    def clear(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+__all__ = ['AppDataDisabled', 'ContentStoreNA', 'PyInfoIndexNA']
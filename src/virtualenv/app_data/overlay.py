@@ -0,0 +1,151 @@
+"""
+A writable application data folder stacked upon a shared, read-only one.
+
+On machines with many users a system wide application data folder can be pre-warmed (wheel images, interpreter
+information, extracted files) and mounted read-only. Lookups try that shared tier first and fall through to the
+per-user writable folder on a miss, so that only what's missing from the shared tier is ever written per user.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+from virtualenv.info import IS_ZIPAPP
+from virtualenv.version import __version__
+
+from .base import ContentStore
+from .read_only import ReadOnlyAppData
+from .via_disk_folder import AppDataDiskFolder
+
+
+class OverlayAppData(AppDataDiskFolder):
+    """A per user application data folder, that falls back to a shared read-only one only where it misses content."""
+
+    def __init__(self, folder, shared, max_size=None) -> None:
+        """
+        Create.
+
+        :param folder: the per user, writable application data folder
+        :param shared: the shared, read-only application data folder
+        :param max_size: the size budget of the per user folder in bytes
+        """
+        super().__init__(folder, max_size)
+        self.shared = ReadOnlyAppData(shared)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.lock.path}, shared={self.shared.lock.path})"
+
+    def plugins(self):
+        return _ContentStoreOverlay(self.shared.plugins(), super().plugins())
+
+    def wheel_image(self, for_py_version, name):
+        shared = self.shared.wheel_image(for_py_version, name)
+        if shared.exists():
+            return shared
+        return super().wheel_image(for_py_version, name)
+
+    def path_listing(self):
+        return _ContentStoreOverlay(self.shared.path_listing(), super().path_listing())
+
+    def wheel_index(self, folder):
+        return _ContentStoreOverlay(self.shared.wheel_index(folder), super().wheel_index(folder))
+
+    def wheel_store(self):
+        return _WheelContentStoreOverlay(self.shared.wheel_store(), super().wheel_store())
+
+    @property
+    def py_info_index(self):
+        if self._py_info_index is None:
+            self._py_info_index = _PyInfoIndexOverlay(self.shared.py_info_index, super().py_info_index)
+        return self._py_info_index
+
+    @contextmanager
+    def ensure_extracted(self, path, to_folder=None):
+        shared = self.shared.lock.path / "unzip" / __version__ / Path(path).name
+        if IS_ZIPAPP and to_folder is None and shared.exists():
+            yield shared
+        else:
+            with super().ensure_extracted(path, to_folder) as result:
+                yield result
+
+
+class _ContentStoreOverlay(ContentStore):
+    """Read from the user store if it has been written, otherwise from the shared store, write to the user one."""
+
+    def __init__(self, shared, user) -> None:
+        self.shared = shared
+        self.user = user
+
+    def _reader(self):
+        return self.user if self.user.exists() else self.shared
+
+    def exists(self):
+        return self.user.exists() or self.shared.exists()
+
+    def read(self):
+        return self._reader().read()
+
+    def write(self, content):
+        self.user.write(content)
+
+    def remove(self):
+        if self.user.exists():
+            self.user.remove()
+
+    @contextmanager
+    def locked(self):
+        with self.user.locked():
+            yield
+
+
+class _WheelContentStoreOverlay:
+    """Link from the shared store the wheels it holds, add the ones it does not have to the user store."""
+
+    def __init__(self, shared, user) -> None:
+        self.shared = shared
+        self.user = user
+
+    def materialize(self, wheel, digest, into, copy_only=lambda _: False):
+        store = self.shared if self.shared.has(digest) else self.user
+        store.materialize(wheel, digest, into, copy_only)
+
+
+class _PyInfoIndexOverlay:
+    """Interpreters still valid within the shared index are served from it, everything else from the user index."""
+
+    def __init__(self, shared, user) -> None:
+        self.shared = shared
+        self.user = user
+
+    def validate(self, paths):
+        paths = [str(i) for i in paths]
+        result = self.shared.validate(paths)
+        logging.debug("served %d of %d interpreters from the shared index", len(result), len(paths))
+        missing = [i for i in paths if i not in result]
+        if missing:
+            result.update(self.user.validate(missing))
+        return result
+
+    def get(self, path):
+        return self.validate([path]).get(str(path))
+
+    def put(self, path, content):
+        self.user.put(path, content)
+
+    def remove(self, path):
+        self.shared.remove(path)  # in memory only, the shared index is never written
+        self.user.remove(path)
+
+    def clear(self):
+        self.shared.clear()
+        self.user.clear()
+
+    def flush(self):
+        self.user.flush()
+
+
+__all__ = [
+    "OverlayAppData",
+]
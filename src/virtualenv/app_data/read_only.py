@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os.path
 from virtualenv.util.lock import NoOpFileLock
-from .via_disk_folder import AppDataDiskFolder, PyInfoStoreDisk
+from .via_disk_folder import AppDataDiskFolder, PyInfoIndexDisk, PyInfoStoreDisk
 
 class ReadOnlyAppData(AppDataDiskFolder):
     can_update = False
@@ -15,6 +15,24 @@ class ReadOnlyAppData(AppDataDiskFolder):
         self.folder = folder
         self.py_info_store = _PyInfoStoreDiskReadOnly(os.path.join(folder, 'py'))
 
+    @property
+    def py_info_index(self):
+        if self._py_info_index is None:
+            self._py_info_index = _PyInfoIndexDiskReadOnly(self.lock / "py")
+        return self._py_info_index
+
 class _PyInfoStoreDiskReadOnly(PyInfoStoreDisk):
     pass
+
+
+class _PyInfoIndexDiskReadOnly(PyInfoIndexDisk):
+    """Entries discovered in this process are kept in memory only, the index on disk is never touched."""
+
+    def flush(self):
+        pass
+
+    def clear(self):
+        with self._thread_lock:
+            self._entries, self._dirty = {}, {}
+
 __all__ = ['ReadOnlyAppData']
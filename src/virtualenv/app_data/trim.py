@@ -0,0 +1,204 @@
+"""
+Keep the application data within a size budget by evicting the least recently used content.
+
+Whenever virtualenv uses some content (an install image, a wheel within the content store, an environment template)
+it bumps the modification time of it, which serves as the last access time (the file systems access time is often
+disabled or coarse). Evicting then walks the content oldest first until the application data fits the budget. Content
+used within the grace period, or locked by a concurrent session, is never evicted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+from argparse import ArgumentTypeError
+from contextlib import suppress
+from pathlib import Path
+from subprocess import DEVNULL, Popen
+from textwrap import dedent
+from typing import NamedTuple
+
+from virtualenv.util.lock import ReentrantFileLock, Timeout
+from virtualenv.util.path import safe_delete
+from virtualenv.util.subprocess import CREATE_NO_WINDOW
+from virtualenv.version import __version__
+
+GRACE = 60 * 60  # content used within the last hour is considered in use
+PERIOD = 24 * 60 * 60  # trim opportunistically at most once a day
+_STAMP = "trim.stamp"
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+
+def parse_size(value):
+    """:return: the number of bytes of a human readable size (e.g. ``500M`` or ``2G``)"""
+    match = _SIZE.match(str(value))
+    if match is None:
+        msg = f"invalid size {value!r}, expected a number optionally followed by K, M, G or T"
+        raise ArgumentTypeError(msg)
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+def touch(path):
+    """Mark some content of the application data as used right now."""
+    with suppress(OSError):  # e.g. a read-only shared application data
+        os.utime(str(path))
+
+
+class Entry(NamedTuple):
+    """A unit of eviction."""
+
+    path: Path
+    last_used: float
+    size: float
+    lock: ReentrantFileLock | None  # the lock the content is created under, if any
+    key: str | None  # the key of the content within that lock
+
+
+def entries(folder):
+    """:return: the evictable content of an application data folder"""
+    folder = Path(folder)
+    # <python>/image/<format>/<install class>/<wheel>
+    found = [_entry(i, ReentrantFileLock(i.parent), i.name) for i in folder.glob("wheel/*/image/*/*/*") if i.is_dir()]
+    found.extend(_entry(manifest) for manifest in folder.glob("wheel/content/wheel/*.json"))
+    found.extend(_entry(wheel) for wheel in folder.glob("wheel/house/*.whl"))
+    found.extend(_entry(i, ReentrantFileLock(folder), "template") for i in folder.glob("template/*") if i.is_dir())
+    found.extend(_entry(unzip) for unzip in folder.glob("unzip/*") if unzip.name != __version__)
+    return found
+
+
+def _entry(path, lock=None, key=None):
+    stat = path.stat()
+    size = _size(path) if path.is_dir() else stat.st_size / stat.st_nlink
+    return Entry(path, stat.st_mtime, size, lock, key)
+
+
+def _size(folder):
+    """:return: the disk usage of a folder, hard linked files accounted by the share of their links within"""
+    size = 0
+    for root, _, files in os.walk(str(folder)):
+        for name in files:
+            with suppress(OSError):
+                stat = os.lstat(os.path.join(root, name))
+                size += stat.st_size / stat.st_nlink
+    return size
+
+
+def trim(folder, max_size, grace=GRACE):
+    """
+    Evict the least recently used content until the application data fits within the budget.
+
+    :param folder: the application data folder
+    :param max_size: the budget in bytes
+    :param grace: seconds within which content used is never evicted
+    :return: the bytes freed
+    """
+    folder = Path(folder)
+    found = sorted(entries(folder), key=lambda e: e.last_used)
+    blobs = _size(folder / "wheel" / "content" / "blob")
+    total = sum(e.size for e in found) + blobs
+    logging.debug("app data %s uses %.0f bytes, budget is %d", folder, total, max_size)
+    now, freed = time.time(), 0
+    for entry in found:
+        if total - freed <= max_size:
+            break
+        if now - entry.last_used < grace:
+            break  # the rest has been used even more recently
+        if _evict(entry):
+            freed += entry.size
+    if freed:
+        freed += blobs - _sweep_blobs(folder / "wheel" / "content", grace)
+        logging.info("evicted %.0f bytes from app data %s", freed, folder)
+    return freed
+
+
+def _evict(entry):
+    if entry.lock is None:
+        _delete(entry.path)
+        return True
+    try:
+        with entry.lock.lock_for_key(entry.key, no_block=True):
+            if entry.path.stat().st_mtime != entry.last_used:
+                return False  # got used meanwhile
+            _delete(entry.path)
+    except Timeout:
+        logging.debug("skip evicting %s as it's locked", entry.path)
+        return False
+    return True
+
+
+def _delete(path):
+    logging.debug("evict %s", path)
+    if path.is_dir():
+        safe_delete(path)
+    else:
+        with suppress(OSError):
+            path.unlink()
+
+
+def _sweep_blobs(content, grace):
+    """Remove the blobs no wheel refers to anymore, :return: the disk usage of the remaining blobs."""
+    referenced = set()
+    for manifest in content.glob("wheel/*.json"):
+        with suppress(OSError, ValueError, KeyError):
+            referenced.update(json.loads(manifest.read_text(encoding="utf-8"))["files"].values())
+    now = time.time()
+    for blob in content.glob("blob/*/*"):
+        with suppress(OSError):
+            # a fresh blob may belong to a wheel being added right now, whose manifest is not yet published
+            if blob.name not in referenced and now - blob.stat().st_mtime > grace:
+                blob.unlink()
+    return _size(content / "blob")
+
+
+def trim_due(folder):
+    """:return: ``True`` if the application data has not been trimmed within the last period (marking it trimmed)"""
+    stamp = Path(folder) / _STAMP
+    with suppress(OSError):
+        if time.time() - stamp.stat().st_mtime < PERIOD:
+            return False
+    try:
+        stamp.touch()
+    except OSError:
+        return False
+    return True
+
+
+def trigger_trim(folder, max_size, env):
+    """Trim the application data within a background process, so that we don't delay the exit of this one."""
+    cmd = [
+        sys.executable,
+        "-c",
+        dedent(
+            f"""
+            from virtualenv.report import setup_report, MAX_LEVEL
+            from virtualenv.app_data.trim import trim
+            setup_report(MAX_LEVEL, show_pid=True)
+            trim({str(folder)!r}, {max_size!r})
+            """,
+        ).strip(),
+    ]
+    debug = env.get("_VIRTUALENV_TRIM_INLINE") == "1"
+    pipe = None if debug else DEVNULL
+    kwargs = {"stdout": pipe, "stderr": pipe}
+    if not debug and sys.platform == "win32":
+        kwargs["creationflags"] = CREATE_NO_WINDOW
+    process = Popen(cmd, **kwargs)  # noqa: S603
+    logging.info("triggered trim of app data %s to %d bytes (PID %d)", folder, max_size, process.pid)
+    if debug:
+        process.communicate()
+
+
+__all__ = [
+    "GRACE",
+    "entries",
+    "parse_size",
+    "touch",
+    "trigger_trim",
+    "trim",
+    "trim_due",
+]
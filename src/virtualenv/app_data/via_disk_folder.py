@@ -3,18 +3,29 @@ A rough layout of the current storage goes as:
 
 virtualenv-app-data
 ├── py - <version> <cache information about python interpreters>
+│  ├── index.json <fingerprint (mtime, inode, size) keyed index of every interrogated interpreter>
+│  ├── path-listing.json <the interpreter candidates within the PATH folders, valid for their modification time>
 │  └── *.json/lock
 ├── wheel <cache wheels used for seeding>
 │   ├── house
 │   │   └── *.whl <wheels downloaded go here>
+│   ├── index
+│   │   └── <sha256 of folder>.json <the wheels within an extra search dir, valid for its modification time>
+│   ├── content <files of the wheels stored by their sha256, shared by all images - see wheel_store.py>
+│   │   ├── blob
+│   │   │   └── <first two hex of sha256>/<sha256 of file>
+│   │   └── wheel
+│   │       └── <sha256 of the wheel>.json -> the files within the wheel and their blob
 │   └── <python major.minor> -> 3.9
-│       ├── img-<version>
-│       │   └── image
-│       │           └── <install class> -> CopyPipInstall / SymlinkPipInstall
-│       │               └── <wheel name> -> pip-20.1.1-py2.py3-none-any
+│       ├── image
+│       │   └── 1 -> image format versioning
+│       │       └── <install class> -> CopyPipInstall / SymlinkPipInstall / HardlinkPipInstall
+│       │           └── <wheel name> -> pip-20.1.1-py2.py3-none-any <hard links to the blobs of the content>
 │       └── embed
 │           └── 3 -> json format versioning
 │               └── *.json -> for every distribution contains data about newer embed versions and releases
+├── template <environment templates, see virtualenv.run.template>
+├── trim.stamp <when the least recently used content has been last evicted, see trim.py>
 └─── unzip <in zip app we cannot refer to some internal files, so first extract them>
      └── <virtualenv version>
          ├── py_info.py
@@ -24,22 +35,28 @@ virtualenv-app-data
 from __future__ import annotations
 import json
 import logging
+import os
 from abc import ABC
 from contextlib import contextmanager, suppress
 from hashlib import sha256
+from threading import Lock
 from virtualenv.util.lock import ReentrantFileLock
-from virtualenv.util.path import safe_delete
+from virtualenv.util.path import safe_delete, write_atomic
 from virtualenv.util.zipapp import extract
 from virtualenv.version import __version__
 from .base import AppData, ContentStore
+from .trim import trigger_trim, trim_due
+from .wheel_store import WheelContentStore
 
 class AppDataDiskFolder(AppData):
     """Store the application data on the disk within a folder layout."""
     transient = False
     can_update = True
 
-    def __init__(self, folder) -> None:
+    def __init__(self, folder, max_size=None) -> None:
         self.lock = ReentrantFileLock(folder)
+        self.max_size = max_size
+        self._py_info_index = None
 
     def __repr__(self) -> str:
         return f'{type(self).__name__}({self.lock.path})'
@@ -48,8 +65,40 @@ class AppDataDiskFolder(AppData):
         return str(self.lock.path)
 
     def close(self):
-        """Close the file lock."""
-        self.lock.release()
+        """Publish the interpreter information learned, and trim the folder if it's over its budget."""
+        if self._py_info_index is not None:
+            self._py_info_index.flush()
+        if self.max_size is not None and self.can_update and not self.transient and trim_due(self.lock.path):
+            trigger_trim(self.lock.path, self.max_size, os.environ)
+
+    def reset(self):
+        logging.debug("reset app data folder %s", self.lock.path)
+        safe_delete(self.lock.path)
+
+    def plugins(self):
+        return PluginStoreDisk(self.lock / "plugins")
+
+    def wheel_image(self, for_py_version, name):
+        return self.lock.path / "wheel" / for_py_version / "image" / "1" / name
+
+    def wheel_store(self):
+        """The content addressed store the install images link their files from."""
+        return WheelContentStore(self.lock.path / "wheel" / "content")
+
+    def wheel_index(self, folder):
+        """The index of the wheels within a folder, see :func:`virtualenv.seed.wheels.util.wheel_index`."""
+        return WheelIndexStoreDisk(self.lock / "wheel" / "index", folder)
+
+    @property
+    def py_info_index(self):
+        """A single file index of interpreter information, keyed by the executables fingerprint."""
+        if self._py_info_index is None:
+            self._py_info_index = PyInfoIndexDisk(self.lock / "py")
+        return self._py_info_index
+
+    def path_listing(self):
+        """The interpreter candidates found within the folders of the ``PATH``, see ``PathExeFinder``."""
+        return PathListingStoreDisk(self.lock / "py")
 
     def py_info_clear(self):
         """Clear Python interpreter information."""
@@ -58,6 +107,8 @@ class AppDataDiskFolder(AppData):
             for file in py_info_folder.iterdir():
                 if file.is_file() and file.suffix in ('.json', '.lock'):
                     safe_delete(file)
+        if self._py_info_index is not None:
+            self._py_info_index.clear()
 
 class JSONStoreDisk(ContentStore, ABC):
 
@@ -67,14 +118,198 @@ class JSONStoreDisk(ContentStore, ABC):
         self.msg = msg
         self.msg_args = (*msg_args, self.file)
 
+    @property
+    def file(self):
+        return self.in_folder.path / f"{self.key}.json"
+
+    def exists(self):
+        return self.file.exists()
+
+    def read(self):
+        data, bad_format = None, False
+        try:
+            data = json.loads(self.file.read_text(encoding="utf-8"))
+        except ValueError:
+            bad_format = True
+        except Exception:  # noqa: BLE001, S110
+            pass
+        else:
+            logging.debug("got %s from %s", self.msg, self.msg_args)
+            return data
+        if bad_format:
+            with suppress(OSError):  # reading and writing on the same file may cause race on multiple processes
+                self.remove()
+        return None
+
+    def remove(self):
+        self.file.unlink()
+        logging.debug("removed %s at %s", self.msg, self.msg_args)
+
+    @contextmanager
+    def locked(self):
+        with self.in_folder.lock_for_key(self.key):
+            yield
+
+    def write(self, content):
+        # published via an atomic rename, so readers see either the old or the new content without taking the lock
+        write_atomic(self.file, json.dumps(content, sort_keys=True, indent=2).encode("utf-8"))
+        logging.debug("wrote %s at %s", self.msg, self.msg_args)
+
 class PyInfoStoreDisk(JSONStoreDisk):
 
     def __init__(self, in_folder, path) -> None:
         key = sha256(str(path).encode('utf-8')).hexdigest()
         super().__init__(in_folder, key, 'python info of %s', (path,))
 
+class PluginStoreDisk(JSONStoreDisk):
+
+    def __init__(self, in_folder) -> None:
+        super().__init__(in_folder, __version__, 'plugin entry points of virtualenv %s', (__version__,))
+
+class PathListingStoreDisk(JSONStoreDisk):
+
+    def __init__(self, in_folder) -> None:
+        super().__init__(in_folder, 'path-listing', 'interpreter candidates of %s', ('PATH',))
+
+class WheelIndexStoreDisk(JSONStoreDisk):
+
+    def __init__(self, in_folder, folder) -> None:
+        key = sha256(str(folder).encode('utf-8')).hexdigest()
+        super().__init__(in_folder, key, 'wheel index of %s', (folder,))
+
 class EmbedDistributionUpdateStoreDisk(JSONStoreDisk):
 
     def __init__(self, in_folder, distribution) -> None:
         super().__init__(in_folder, distribution, 'embed update of distribution %s', (distribution,))
-__all__ = ['AppDataDiskFolder', 'JSONStoreDisk', 'PyInfoStoreDisk']
+
+def fingerprint(path):
+    """
+    Identify the content of an executable without reading it.
+
+    :param path: the executable
+    :return: a ``(st_mtime_ns, st_ino, st_size)`` triplet (of the link itself for a broken symlink), or ``None`` if the
+             path cannot be stat-ed
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        try:
+            stat = os.lstat(path)
+        except OSError:
+            return None
+    return [stat.st_mtime_ns, stat.st_ino, stat.st_size]
+
+
+class PyInfoIndexDisk:
+    """
+    Interpreter information for all known executables held in one compact JSON file.
+
+    The file is read at most once per process and validated against the file system with a single ``stat`` per entry,
+    new entries are buffered in memory and published with an atomic rename on :meth:`flush`.
+    """
+
+    VERSION = 1
+
+    def __init__(self, lock) -> None:
+        self.lock = lock
+        self.file = lock.path / "index.json"
+        self._entries = None
+        self._dirty = {}
+        self._thread_lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.file})"
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self):
+        try:
+            raw = json.loads(self.file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(raw, dict) or raw.get("version") != self.VERSION:
+            logging.debug("ignore py info index %s with unknown layout", self.file)
+            return {}
+        return raw.get("entries", {})
+
+    def validate(self, paths):
+        """
+        Look up many executables at once.
+
+        :param paths: the executables to look up
+        :return: a mapping of the path to the serialized interpreter information for every still valid entry
+        """
+        with self._thread_lock:
+            entries = self._load()
+            result = {}
+            for path in paths:
+                key = str(path)
+                entry = entries.get(key)
+                if entry is None:
+                    continue
+                if entry["fingerprint"] == fingerprint(key):
+                    result[key] = entry["content"]
+                else:
+                    del entries[key]
+                    self._dirty[key] = None
+            return result
+
+    def get(self, path):
+        return self.validate([path]).get(str(path))
+
+    def put(self, path, content):
+        key = str(path)
+        entry = {"fingerprint": fingerprint(key), "content": content}
+        if entry["fingerprint"] is None:
+            return
+        with self._thread_lock:
+            self._load()[key] = self._dirty[key] = entry
+
+    def remove(self, path):
+        key = str(path)
+        with self._thread_lock:
+            if self._load().pop(key, None) is not None:
+                self._dirty[key] = None
+
+    def clear(self):
+        with self._thread_lock:
+            self._entries, self._dirty = {}, {}
+            with self.lock, suppress(OSError):
+                self.file.unlink()
+
+    def flush(self):
+        """Merge the changes of this process into the on-disk index (others might have written since we read it)."""
+        with self._thread_lock:
+            if not self._dirty:
+                return
+            with self.lock:
+                entries = self._read()
+                for key, entry in self._dirty.items():
+                    if entry is None:
+                        entries.pop(key, None)
+                    else:
+                        entries[key] = entry
+                self._write(entries)
+            self._entries, self._dirty = entries, {}
+
+    def _write(self, entries):
+        content = json.dumps({"version": self.VERSION, "entries": entries}, separators=(",", ":"))
+        try:
+            write_atomic(self.file, content.encode("utf-8"))
+        except OSError as exception:
+            logging.debug("could not write py info index %s due to %r", self.file, exception)
+
+
+__all__ = [
+    "AppDataDiskFolder",
+    "JSONStoreDisk",
+    "PathListingStoreDisk",
+    "PluginStoreDisk",
+    "PyInfoIndexDisk",
+    "PyInfoStoreDisk",
+    "WheelIndexStoreDisk",
+    "fingerprint",
+]
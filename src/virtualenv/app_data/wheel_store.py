@@ -0,0 +1,239 @@
+"""
+A content addressed store of the files within wheels.
+
+Install images are specific to the target Python version and the install mechanism, yet (but for a few metadata
+files) they hold the very same files. So instead of unpacking the wheel for every image, the wheel is unpacked once
+into blobs named by the sha256 of their content and recorded within a manifest named by the sha256 of the wheel. An
+image is then a tree of hard links to these blobs (or copies, where hard links are not possible), which makes
+building one cheap and lets all images (across Python versions and virtualenv upgrades, and even across releases of
+a distribution for files that did not change) share the disk space.
+
+Layout::
+
+    content
+    ├── blob
+    │   └── <first two hex of sha256>
+    │       └── <sha256 of the file>
+    └── wheel
+        └── <sha256 of the wheel>.json -> {"files": {"<path within the wheel>": "<sha256 of the file>"}}
+
+Blobs and manifests are only ever published via an atomic rename, so concurrent writers need no locks: whichever
+wins, the content is the same.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import zipfile
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path, PurePosixPath
+
+from virtualenv.util.path import copy_file, temp_sibling, write_atomic
+
+from .trim import touch
+
+_CHUNK = 1024 * 1024
+
+
+def wheel_digest(wheel):
+    """:return: the sha256 of the wheel file"""
+    digest = sha256()
+    with open(str(wheel), "rb") as file_handler:
+        for chunk in iter(lambda: file_handler.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class WheelReader:
+    """
+    Read a wheel through a read only memory map of it.
+
+    The central directory is parsed once when entered, members are streamed straight into their destination and
+    metadata is read without extracting anything; so the wheel is never held in memory, nor staged on the disk.
+    """
+
+    def __init__(self, wheel) -> None:
+        self.wheel = Path(wheel)
+        self._file = self._map = self._zip = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.wheel})"
+
+    def __enter__(self):
+        self._file = open(str(self.wheel), "rb")  # noqa: SIM115
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # e.g. an empty file, or a file system not supporting it
+            source = self._file
+        else:
+            source = _MappedFile(self._map)
+        try:
+            self._zip = zipfile.ZipFile(source)
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for closeable in (self._zip, self._map, self._file):
+            if closeable is not None:
+                closeable.close()
+        self._file = self._map = self._zip = None
+
+    def members(self):
+        """:return: the files within the wheel"""
+        result = []
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+            if info.filename.startswith("/") or ".." in PurePosixPath(info.filename).parts:
+                msg = f"{self.wheel} contains {info.filename} outside of its root"
+                raise RuntimeError(msg)
+            result.append(info)
+        return result
+
+    @property
+    def dist_info(self):
+        """:return: the name of the metadata folder within the wheel"""
+        for name in self._zip.namelist():
+            top = name.split("/", 1)[0]
+            if top.endswith(".dist-info"):
+                return top
+        msg = f"no .dist-info within {self.wheel}"
+        raise RuntimeError(msg)
+
+    def metadata(self, name):
+        """:return: the text of a file within the metadata folder, or ``None`` if the wheel has no such file"""
+        try:
+            return self._zip.read(f"{self.dist_info}/{name}").decode("utf-8")
+        except KeyError:
+            return None
+
+    def extract(self, info, dest):
+        """
+        Stream a member of the wheel into a file.
+
+        :param info: the member
+        :param dest: the file to write
+        :return: the sha256 of the content
+        """
+        digest = sha256()
+        with self._zip.open(info) as source, open(str(dest), "wb") as target:
+            for chunk in iter(lambda: source.read(_CHUNK), b""):
+                digest.update(chunk)
+                target.write(chunk)
+        return digest.hexdigest()
+
+    def extract_all(self, into):
+        """Stream all members of the wheel into a folder."""
+        into = Path(into)
+        for info in self.members():
+            dest = into / info.filename
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self.extract(info, dest)
+
+
+class _MappedFile:
+    """Expose a memory map as a seekable file (memory maps only gained ``seekable`` with Python 3.13)."""
+
+    def __init__(self, mapped) -> None:
+        self._mapped = mapped
+
+    def __getattr__(self, name):
+        return getattr(self._mapped, name)
+
+    @staticmethod
+    def seekable():
+        return True
+
+
+class WheelContentStore:
+    def __init__(self, folder) -> None:
+        self.folder = Path(folder)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.folder})"
+
+    def manifest_file(self, digest):
+        return self.folder / "wheel" / f"{digest}.json"
+
+    def blob(self, file_digest):
+        return self.folder / "blob" / file_digest[:2] / file_digest
+
+    def has(self, digest):
+        return self.manifest_file(digest).exists()
+
+    def manifest(self, wheel, digest):
+        """:return: the files of the wheel mapped to their blob digest, adding the wheel to the store if missing"""
+        try:
+            return json.loads(self.manifest_file(digest).read_text(encoding="utf-8"))["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return self._add(wheel, digest)
+
+    def _add(self, wheel, digest):
+        logging.debug("add %s to the wheel content store %s", wheel, self.folder)
+        files = {}
+        with WheelReader(wheel) as reader:
+            for info in reader.members():
+                files[info.filename] = self._add_blob(reader, info)
+        write_atomic(self.manifest_file(digest), json.dumps({"files": files}, sort_keys=True).encode("utf-8"))
+        return files
+
+    def _add_blob(self, reader, info):
+        # the digest is only known once streamed, so stream into a temporary file and publish it via an atomic rename
+        temp = temp_sibling(self.folder / "blob" / "new")
+        temp.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            file_digest = reader.extract(info, temp)
+            blob = self.blob(file_digest)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.replace(str(temp), str(blob))
+                except OSError:
+                    if not blob.exists():  # e.g. on Windows one can't replace a file in use, but then it's published
+                        raise
+        finally:
+            with suppress(OSError):
+                temp.unlink()
+        return file_digest
+
+    def materialize(self, wheel, digest, into, copy_only=lambda _: False):
+        """
+        Create the content of the wheel within a folder.
+
+        :param wheel: the wheel
+        :param digest: the sha256 of the wheel
+        :param into: the folder to create the content in
+        :param copy_only: a predicate telling for a path within the wheel whether it must be a copy (as it will be
+                          modified in place, which would alter the blob if it was a hard link)
+        """
+        files = self.manifest(wheel, digest)
+        touch(self.manifest_file(digest))
+        if not all(self.blob(i).exists() for i in set(files.values())):  # blobs got removed since, add them again
+            files = self._add(wheel, digest)
+        can_link = True
+        for name, file_digest in files.items():
+            blob, dest = self.blob(file_digest), Path(into) / name
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if can_link and not copy_only(name):
+                try:
+                    os.link(str(blob), str(dest))
+                except OSError as exception:
+                    logging.debug("cannot hard link from %s (%r), copy instead", self.folder, exception)
+                    can_link = False
+                else:
+                    continue
+            copy_file(str(blob), str(dest))
+
+
+__all__ = [
+    "WheelContentStore",
+    "WheelReader",
+    "wheel_digest",
+]
@@ -2,10 +2,15 @@ from __future__ import annotations
 import logging
 import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
-from virtualenv.info import IS_WIN, fs_path_id
+from typing import TYPE_CHECKING
+from virtualenv.info import IS_WIN, fs_file_id, fs_path_id
+from .cached_py_info import add_alias, prefetch
 from .discover import Discover
+from .py_identity import PythonIdentity
 from .py_info import PythonInfo
 from .py_spec import PythonSpec
 if TYPE_CHECKING:
@@ -23,11 +28,237 @@ class Builtin(Discover):
         self.python_spec = options.python or [sys.executable]
         self.app_data = options.app_data
         self.try_first_with = options.try_first_with
+        self.jobs = getattr(options, "discovery_jobs", 1)
+
+    @classmethod
+    def add_parser_arguments(cls, parser):
+        parser.add_argument(
+            "-p",
+            "--python",
+            dest="python",
+            metavar="py",
+            type=str,
+            action="append",
+            default=[],
+            help="interpreter based on what to create environment (path/identifier) "
+            "- by default use the interpreter where the tool is installed - first found wins",
+        )
+        parser.add_argument(
+            "--try-first-with",
+            dest="try_first_with",
+            metavar="py_exe",
+            type=str,
+            action="append",
+            default=[],
+            help="try first these interpreters before starting the discovery",
+        )
+        parser.add_argument(
+            "--discovery-jobs",
+            dest="discovery_jobs",
+            metavar="N",
+            type=int,
+            default=1,
+            help="interrogate up to this many interpreter candidates found on the PATH concurrently "
+            "- the first candidate (in PATH order) that matches still wins",
+        )
+
+    def run(self):
+        for python_spec in self.python_spec:
+            result = get_interpreter(python_spec, self.try_first_with, self.app_data, self._env, jobs=self.jobs)
+            if result is not None:
+                return result
+        return None
 
     def __repr__(self) -> str:
         spec = self.python_spec[0] if len(self.python_spec) == 1 else self.python_spec
         return f'{self.__class__.__name__}(python_spec={spec!r}, app_data={self.app_data!r}, try_first_with={self.try_first_with!r})'
 
+def get_interpreter(key, try_first_with, app_data=None, env=None, jobs=1):
+    spec = PythonSpec.from_string_spec(key)
+    logging.info("find interpreter for spec %r", spec)
+    proposed_paths = set()
+    env = os.environ if env is None else env
+    for interpreter, impl_must_match in propose_interpreters(spec, try_first_with, app_data, env, jobs):
+        key = interpreter.system_executable, impl_must_match
+        if key in proposed_paths:
+            continue
+        logging.info("proposed %s", interpreter)
+        if interpreter.satisfies(spec, impl_must_match):
+            resolved = interpreter
+            if isinstance(interpreter, PythonIdentity):  # only now pay for the full interrogation, of this one only
+                resolved = interpreter.resolve(app_data, env)
+                if resolved is None or not resolved.satisfies(spec, impl_must_match):
+                    proposed_paths.add(key)
+                    continue
+            logging.debug("accepted %s", resolved)
+            return resolved
+        proposed_paths.add(key)
+    return None
+
+
+def propose_interpreters(  # noqa: C901, PLR0912
+    spec: PythonSpec,
+    try_first_with: Iterable[str],
+    app_data: AppData | None = None,
+    env: Mapping[str, str] | None = None,
+    jobs: int = 1,
+) -> Generator[tuple[PythonInfo, bool], None, None]:
+    # 0. try with first
+    env = os.environ if env is None else env
+    tested_exes: set[str] = set()
+    for py_exe in try_first_with:
+        path = os.path.abspath(py_exe)
+        try:
+            os.lstat(path)  # Windows Store Python does not work with os.path.exists, but does for os.lstat
+        except OSError:
+            pass
+        else:
+            exe_raw = os.path.abspath(path)
+            exe_id = fs_path_id(exe_raw)
+            if exe_id in tested_exes:
+                continue
+            tested_exes.add(exe_id)
+            yield PythonInfo.from_exe(exe_raw, app_data, env=env), True
+
+    # 1. if it's a path and exists
+    if spec.path is not None:
+        try:
+            os.lstat(spec.path)  # Windows Store Python does not work with os.path.exists, but does for os.lstat
+        except OSError:
+            if spec.is_abs:
+                raise
+        else:
+            exe_raw = os.path.abspath(spec.path)
+            exe_id = fs_path_id(exe_raw)
+            if exe_id not in tested_exes:
+                tested_exes.add(exe_id)
+                yield PythonInfo.from_exe(exe_raw, app_data, env=env), True
+        if spec.is_abs:
+            return
+    else:
+        # 2. otherwise try with the current
+        current_python = PythonInfo.current_system(app_data)
+        exe_raw = str(current_python.executable)
+        exe_id = fs_path_id(exe_raw)
+        if exe_id not in tested_exes:
+            tested_exes.add(exe_id)
+            yield current_python, True
+
+        # 3. otherwise fallback to platform default logic
+        if IS_WIN:
+            from .windows import propose_interpreters  # noqa: PLC0415
+
+            for interpreter in propose_interpreters(spec, app_data, env):
+                exe_raw = str(interpreter.executable)
+                exe_id = fs_path_id(exe_raw)
+                if exe_id in tested_exes:
+                    continue
+                tested_exes.add(exe_id)
+                yield interpreter, True
+
+    # finally just find on path, the path order matters (as the candidates are less easy to control by end user)
+    candidates = _path_candidates(spec, env, tested_exes, app_data)
+    yield from _interrogate(candidates, app_data, env, jobs)
+
+
+def _path_candidates(spec, env, tested_exes, app_data=None):
+    find_candidates = path_exe_finder(spec, app_data)
+    try:
+        yield from _path_candidates_via(find_candidates, env, tested_exes, app_data)
+    finally:  # also when the consumer found its match, and closed us
+        find_candidates.flush()
+
+
+def _path_candidates_via(find_candidates, env, tested_exes, app_data):
+    seen = {}  # (st_dev, st_ino, impl_must_match) -> the first candidate resolving to that file
+    for pos, path in enumerate(get_paths(env)):
+        logging.debug(LazyPathDump(pos, path, env))
+        for exe, impl_must_match in find_candidates(path):
+            exe_raw = str(exe)
+            exe_id = fs_path_id(exe_raw)
+            if exe_id in tested_exes:
+                continue
+            tested_exes.add(exe_id)
+            # aliases of the same binary (e.g. python3, python3.12 and shims linking to it) are the same interpreter
+            # as far as the spec is concerned, so only the first of them (in PATH order) is worth interrogating
+            file_id = fs_file_id(exe_raw)
+            if file_id is not None:
+                first = seen.setdefault((*file_id, impl_must_match), exe_raw)
+                if first != exe_raw:
+                    logging.debug("skip %s as it's the same file as %s", exe_raw, first)
+                    if _same_interpreter(first, exe_raw):
+                        add_alias(app_data, first, exe_raw)
+                    continue
+            yield exe_raw, impl_must_match
+
+
+def _same_interpreter(exe, alias):
+    """:return: ``True`` if the interpreter computes the same information when invoked via either path"""
+    if os.path.realpath(exe) != os.path.realpath(alias):
+        return False  # a hard link, whose prefix is computed from its own location
+    # a virtual environment next to the link alters its prefix
+    return not any(os.path.exists(os.path.join(i, "pyvenv.cfg")) for p in (exe, alias) for i in _cfg_dirs(p))
+
+
+def _cfg_dirs(path):
+    folder = os.path.dirname(path)
+    return folder, os.path.dirname(folder)
+
+
+def _interrogate(candidates, app_data, env, jobs):
+    """
+    Identify the candidates, in parallel when asked, but yield the results in the order of the candidates.
+
+    The candidates are not interrogated in full, only identified (see ``PythonInfo.identify``), which is enough to
+    match them against the spec.
+
+    At most ``jobs`` interrogations are in flight ahead of the consumer, so once it found its match (and closed us) we
+    only wasted a bounded amount of work on the candidates after it.
+    """
+    if jobs <= 1:
+        for exe_raw, impl_must_match in candidates:
+            identity = PathPythonInfo.identify(exe_raw, app_data, env=env)
+            if identity is not None:
+                yield identity, impl_must_match
+        return
+
+    candidates = list(candidates)
+    prefetch(PathPythonInfo, app_data, (exe for exe, _ in candidates), env)  # one batched index read before probing
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="virtualenv-discovery") as executor:
+        try:
+            for exe_raw, impl_must_match in candidates:
+                future = executor.submit(PathPythonInfo.identify, exe_raw, app_data, env=env)
+                pending.append((future, impl_must_match))
+                if len(pending) >= jobs:
+                    yield from _yield_done(pending.popleft())
+            while pending:
+                yield from _yield_done(pending.popleft())
+        finally:
+            for future, _ in pending:
+                future.cancel()
+
+
+def _yield_done(entry):
+    future, impl_must_match = entry
+    identity = future.result()
+    if identity is not None:
+        yield identity, impl_must_match
+
+
+def get_paths(env: Mapping[str, str]) -> Generator[Path, None, None]:
+    path = env.get("PATH", None)
+    if path is None:
+        try:
+            path = os.confstr("CS_PATH")
+        except (AttributeError, ValueError):
+            path = os.defpath
+    if path:
+        for p in map(Path, path.split(os.pathsep)):
+            if p.exists():
+                yield p
+
+
 class LazyPathDump:
 
     def __init__(self, pos: int, path: Path, env: Mapping[str, str]) -> None:
@@ -49,21 +280,91 @@ class LazyPathDump:
                 content += file_path.name
         return content
 
-def path_exe_finder(spec: PythonSpec) -> Callable[[Path], Generator[tuple[Path, bool], None, None]]:
-    """Given a spec, return a function that can be called on a path to find all matching files in it."""
-    def finder(path: Path) -> Generator[tuple[Path, bool], None, None]:
-        if not path.exists():
-            return
+#: a folder modified this recently might still be modified within the same timestamp tick, so its listing is not kept
+_RACY_NS = 2 * 10**9
+
+
+class PathExeFinder:
+    """
+    Find the executables matching a spec within the folders of the ``PATH``.
+
+    The folders are listed via ``scandir`` (whose entries know their type, so there is no ``stat`` per file) and every
+    name is matched by a single regular expression. The matches are kept per folder in the app data, valid for as long
+    as the modification time of the folder does not change, so unchanged folders are not even listed.
+    """
+
+    def __init__(self, spec: PythonSpec, app_data: AppData | None = None) -> None:
+        self._pattern = spec.generate_re(windows=IS_WIN)
+        self._direct = f"{spec.str_spec}.exe" if IS_WIN else spec.str_spec
+        self._key = f"{self._direct}|{self._pattern.pattern}"
+        self._store = None if app_data is None else app_data.path_listing()
+        self._can_update = app_data is not None and app_data.can_update
+        self._folders = None
+        self._dirty = False
 
-        pattern = spec.generate_re(windows=sys.platform.startswith('win'))
-        for item in path.iterdir():
-            if item.is_file() and pattern.match(item.name):
-                yield item, True
-            elif item.is_dir():
-                yield item, False
+    def __call__(self, path: Path) -> Generator[tuple[Path, bool], None, None]:
+        for name, impl_must_match in self._matches(path):
+            yield path.absolute() / name, impl_must_match
+
+    def _matches(self, path):
+        try:
+            mtime = os.stat(str(path)).st_mtime_ns
+        except OSError:
+            return []
+        if self._folders is None:
+            content = self._store.read() if self._store is not None and self._store.exists() else None
+            self._folders = content if isinstance(content, dict) else {}
+        folder = self._folders.get(str(path))
+        if folder is not None and folder["mtime"] == mtime and self._key in folder["matches"]:
+            return folder["matches"][self._key]
+        found = self._scan(path)
+        if time.time_ns() - mtime > _RACY_NS:
+            if folder is None or folder["mtime"] != mtime:
+                folder = self._folders[str(path)] = {"mtime": mtime, "matches": {}}
+            folder["matches"][self._key] = found
+            self._dirty = True
+        return found
+
+    def _scan(self, path):
+        direct, found = [], []
+        try:
+            with os.scandir(str(path)) as entries:
+                for entry in entries:
+                    # 4. then maybe it's something exact on PATH - if direct lookup, implementation no longer counts
+                    is_direct = entry.name == self._direct
+                    # 5. or from the spec we can deduce if a name on path matches
+                    match = self._pattern.fullmatch(entry.name)
+                    if not (is_direct or match) or _is_dir(entry):
+                        continue
+                    if is_direct:
+                        direct.append([entry.name, False])
+                    if match:  # the implementation must match when we find “python[ver]”
+                        found.append([entry.name, match["impl"] == "python"])
+        except OSError:
+            return []
+        return direct + found
+
+    def flush(self):
+        """Persist the listings learned."""
+        if self._dirty and self._can_update:
+            self._store.write(self._folders)
+            self._dirty = False
+
+
+def _is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def path_exe_finder(spec: PythonSpec, app_data: AppData | None = None) -> PathExeFinder:
+    """Given a spec, return a function that can be called on a path to find all matching files in it."""
+    return PathExeFinder(spec, app_data)
 
-    return finder
 
 class PathPythonInfo(PythonInfo):
     """python info from path."""
-__all__ = ['Builtin', 'PathPythonInfo', 'get_interpreter']
+
+
+__all__ = ['Builtin', 'PathExeFinder', 'PathPythonInfo', 'get_interpreter']
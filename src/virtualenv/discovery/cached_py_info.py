@@ -5,22 +5,336 @@ cheap, especially not on Windows. To not have to pay this hefty cost every time
 caching.
 """
 from __future__ import annotations
+import json
 import logging
 import os
 import random
 import sys
-from collections import OrderedDict
+import time
+from collections import OrderedDict, defaultdict
+from copy import copy
+from hashlib import sha256
 from pathlib import Path
 from shlex import quote
 from string import ascii_lowercase, ascii_uppercase, digits
 from subprocess import Popen
+from threading import Lock
 from virtualenv.app_data import AppDataDisabled
+from virtualenv.discovery.py_identity import IDENTITY_SCRIPT, PythonIdentity
 from virtualenv.discovery.py_info import PythonInfo
+from virtualenv.info import IS_WIN, IS_ZIPAPP
+from virtualenv.util.profiling import probe_cmd
 from virtualenv.util.subprocess import subprocess
 _CACHE = OrderedDict()
 _CACHE[Path(sys.executable)] = PythonInfo()
+#: seconds a failed interrogation is remembered for (unless the executable changes), so that dead candidates found on
+#: the ``PATH`` (e.g. ``python3-config``, stale shims or broken symlinks) don't cost a subprocess on every run
+FAILURE_TTL = 24 * 60 * 60
+#: besides the ``PYTHON*`` ones, the environment variables that can break the start-up of an interpreter
+_FAILURE_ENV = {"LD_LIBRARY_PATH", "DYLD_LIBRARY_PATH", "DYLD_FALLBACK_LIBRARY_PATH"}
+_ALIASES = defaultdict(set)  # executable -> other paths it's known by, its interrogation is valid for too
+_ALIASES_LOCK = Lock()
+_IDENTITIES = {}  # executable -> identity (or failure) of interpreters not interrogated in full (yet)
+
+
+def from_exe(cls, app_data, exe, env=None, raise_on_error=True, ignore_cache=False):  # noqa: FBT002, PLR0913
+    env = os.environ if env is None else env
+    # only the candidates we look at speculatively may be rejected via a cached failure, what the user asked for we
+    # always interrogate - they might have fixed it since
+    result = _get_from_cache(cls, app_data, exe, env, ignore_cache=ignore_cache, cache_failure=not raise_on_error)
+    if isinstance(result, Exception):
+        if raise_on_error:
+            raise result
+        logging.info("%s", result)
+        result = None
+    return result
+
+
+def identify(cls, app_data, exe, env=None):
+    """
+    Identify an executable cheaply: its full information if already known, otherwise only its identity.
+
+    :param cls: the python info class to materialize
+    :param app_data: the application data folder holding the index
+    :param exe: the executable
+    :param env: the environment to run the interpreter within
+    :return: the python info or identity of the executable, ``None`` if it can't be interrogated
+    """
+    env = os.environ if env is None else env
+    if app_data is None:
+        app_data = AppDataDisabled()
+    exe_path = Path(exe)
+    identity = None
+    if exe_path not in _CACHE:
+        identity = _IDENTITIES.get(exe_path)
+        if identity is None:
+            identity = _identify_via_index(cls, app_data, exe_path, exe, env)
+            if identity is not None:
+                _IDENTITIES[exe_path] = identity
+    if identity is None:  # known in full (or known to fail) already, which is just as cheap to serve
+        return from_exe(cls, app_data, exe, env, raise_on_error=False)
+    if isinstance(identity, Exception):
+        logging.info("%s", identity)
+        return None
+    return identity
+
+
+def _identify_via_index(cls, app_data, path, exe, env):
+    index = app_data.py_info_index
+    content = index.get(path)
+    if content is None:
+        identity = PythonIdentity.from_layout(cls, exe) or _run_identity(cls, exe, env)
+        if isinstance(identity, Exception):
+            index.put(path, _failure_to_index(identity, env))
+        else:
+            index.put(path, {"identity": identity._to_dict()})  # noqa: SLF001
+        return identity
+    if "identity" in content:
+        return PythonIdentity(cls, exe, **content["identity"])
+    return None
+
+
+def prefetch(cls, app_data, exes, env=None):
+    """
+    Warm the in-memory cache for many executables with one read of the index and one ``stat`` per executable.
+
+    :param cls: the python info class to materialize
+    :param app_data: the application data folder holding the index
+    :param exes: the executables we're likely to interrogate (speculatively, so cached failures are served too)
+    :param env: the environment the interpreters would run within
+    """
+    env = os.environ if env is None else env
+    if app_data is None:
+        app_data = AppDataDisabled()
+    missing = [Path(exe) for exe in exes if Path(exe) not in _CACHE]
+    for path, content in app_data.py_info_index.validate(missing).items():
+        if "identity" in content:
+            _IDENTITIES[Path(path)] = PythonIdentity(cls, path, **content["identity"])
+            continue
+        py_info = _failure_from_index(content, env) if "failure" in content else _from_index(cls, content)
+        if py_info is not None:
+            _CACHE[Path(path)] = py_info
+
+
+def _get_from_cache(cls, app_data, exe, env, ignore_cache=True, cache_failure=False):  # noqa: FBT002, PLR0913
+    # note here we cannot resolve symlinks, as the symlink may trigger different prefix information if there's a
+    # pyenv.cfg somewhere alongside on python3.5+
+    exe_path = Path(exe)
+    result = None if ignore_cache else _CACHE.get(exe_path)
+    if result is None or (isinstance(result, Exception) and not cache_failure):  # not in the in-memory cache
+        # otherwise go through the app data cache
+        result = _CACHE[exe_path] = _get_via_index(cls, app_data, exe_path, exe, env, ignore_cache, cache_failure)
+    # independent if it was from the file or in-memory cache fix the original executable location
+    if isinstance(result, PythonInfo):
+        result.executable = exe
+        _serve_aliases(app_data, exe_path, result)
+    return result
+
+
+def add_alias(app_data, exe, alias):
+    """
+    Serve the interrogation of an executable for another path of it too, so that looking up the alias is a cache hit.
+
+    Only valid for paths the interpreter computes the same information for: symlinks resolving to the same file, with
+    no ``pyvenv.cfg`` alongside to alter its prefix - the caller must ensure this.
+
+    :param app_data: the application data holding the index
+    :param exe: the executable (which might be interrogated yet)
+    :param alias: the other path of it
+    """
+    with _ALIASES_LOCK:
+        _ALIASES[Path(exe)].add(Path(alias))
+    result = _CACHE.get(Path(exe))
+    if isinstance(result, PythonInfo):
+        _serve_aliases(app_data, Path(exe), result)
+
+
+def _serve_aliases(app_data, exe_path, py_info):
+    with _ALIASES_LOCK:
+        aliases = _ALIASES.pop(exe_path, None)
+    if not aliases:
+        return
+    index = (AppDataDisabled() if app_data is None else app_data).py_info_index
+    content = py_info._to_dict()  # noqa: SLF001
+    for alias in aliases:
+        if alias not in _CACHE:
+            _CACHE[alias] = copy(py_info)  # a copy, as the executable is fixed up on every lookup
+            index.put(alias, content)
+
+
+def _get_via_index(cls, app_data, path, exe, env, ignore_cache, cache_failure):  # noqa: PLR0913
+    if app_data is None:
+        app_data = AppDataDisabled()
+    index = app_data.py_info_index
+    py_info = None
+    if not ignore_cache:
+        content = index.get(path)
+        if content is not None and "identity" not in content:  # if only identified so far, interrogate in full
+            if "failure" in content:  # kept even if not served, overwritten by the outcome of the next speculative run
+                failure = _failure_from_index(content, env) if cache_failure else None
+                if failure is not None:
+                    return failure
+            else:
+                py_info = _from_index(cls, content)
+                if py_info is None:
+                    index.remove(path)
+    if py_info is None:
+        py_info = _run_via_daemon(cls, exe, app_data, env)
+        failure = None
+        if py_info is None:
+            failure, py_info = _run_subprocess(cls, exe, app_data, env)
+        if failure is None:
+            index.put(path, py_info._to_dict())  # noqa: SLF001
+        else:
+            if cache_failure:
+                index.put(path, _failure_to_index(failure, env))
+            py_info = failure
+    return py_info
+
+
+def _from_index(cls, content):
+    py_info = cls._from_dict(content.copy())  # noqa: SLF001
+    sys_exe = py_info.system_executable
+    if sys_exe is not None and not os.path.exists(sys_exe):
+        return None  # the system executable is gone, the entry is stale
+    return py_info
+
+
+def _failure_to_index(failure, env):
+    return {"failure": str(failure), "at": time.time(), "env": _env_key(env)}
+
+
+def _failure_from_index(content, env):
+    if time.time() - content["at"] > FAILURE_TTL:
+        return None  # expired, try again
+    if content.get("env") != _env_key(env):
+        return None  # e.g. a broken PYTHONHOME since fixed, try again
+    return RuntimeError(f"{content['failure']} (cached, retried after {FAILURE_TTL}s or once the executable changes)")
+
+
+def _env_key(env):
+    """:return: a digest of the environment variables that can break the start-up of an interpreter"""
+    relevant = sorted((k, v) for k, v in env.items() if k.startswith("PYTHON") or k in _FAILURE_ENV)
+    return sha256(json.dumps(relevant).encode("utf-8")).hexdigest()[:16]
+
+
 COOKIE_LENGTH: int = 32
 
+
+def gen_cookie():
+    return "".join(random.choice(f"{ascii_lowercase}{ascii_uppercase}{digits}") for _ in range(COOKIE_LENGTH))
+
+
+def _run_via_daemon(cls, exe, app_data, env):
+    if not env.get("VIRTUALENV_PROBE_DAEMON") or app_data.transient or IS_WIN or IS_ZIPAPP:
+        return None
+    from virtualenv.discovery import probe_daemon  # noqa: PLC0415
+    from virtualenv.version import __version__  # noqa: PLC0415
+
+    idle_timeout = float(env.get("VIRTUALENV_PROBE_DAEMON_IDLE_TIMEOUT", probe_daemon.IDLE_TIMEOUT))
+    payload = probe_daemon.query(
+        str(app_data.lock.path / "probe" / f"{__version__}.sock"),
+        exe,
+        env,
+        Path(os.path.abspath(__file__)).parent / "py_info.py",
+        idle_timeout=idle_timeout,
+        spawn=app_data.can_update,
+    )
+    if payload is None:
+        return None
+    result = cls._from_json(payload)  # noqa: SLF001
+    result.executable = exe
+    return result
+
+
+def _run_subprocess(cls, exe, app_data, env):
+    py_info_script = Path(os.path.abspath(__file__)).parent / "py_info.py"
+    # Cookies allow to split the serialized stdout output generated by the script collecting the info from the output
+    # generated by something else. The right way to deal with it is to create an anonymous pipe and pass its descriptor
+    # to the child and output to it. But AFAIK all of them are either not cross-platform or too big to implement and are
+    # not in the stdlib. So the easiest and the shortest way I could mind is just using the cookies.
+    # We generate pseudorandom cookies because it easy to implement and avoids breakage from outputting modules source
+    # code, i.e. by debug output libraries. We reverse the cookies to avoid breakages resulting from variable values
+    # appearing in debug output.
+
+    start_cookie = gen_cookie()
+    end_cookie = gen_cookie()
+    with app_data.ensure_extracted(py_info_script) as py_info_script:
+        cmd = probe_cmd([exe, str(py_info_script), start_cookie, end_cookie])
+        # prevent sys.prefix from leaking into the child process - see https://bugs.python.org/issue22490
+        env = env.copy()
+        env.pop("__PYVENV_LAUNCHER__", None)
+        logging.debug("get interpreter info via cmd: %s", LogCmd(cmd))
+        try:
+            process = Popen(
+                cmd,
+                universal_newlines=True,
+                stdin=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=env,
+                encoding="utf-8",
+            )
+            out, err = process.communicate()
+            code = process.returncode
+        except OSError as os_error:
+            out, err, code = "", os_error.strerror, os_error.errno
+    result, failure = None, None
+    if code == 0:
+        out_starts = out.find(start_cookie[::-1])
+
+        if out_starts > -1:
+            pre_cookie = out[:out_starts]
+
+            if pre_cookie:
+                sys.stdout.write(pre_cookie)
+
+            out = out[out_starts + COOKIE_LENGTH :]
+
+        out_ends = out.find(end_cookie[::-1])
+
+        if out_ends > -1:
+            post_cookie = out[out_ends + COOKIE_LENGTH :]
+
+            if post_cookie:
+                sys.stdout.write(post_cookie)
+
+            out = out[:out_ends]
+
+        result = cls._from_json(out)  # noqa: SLF001
+        result.executable = exe  # keep original executable as this may contain initialization code
+    else:
+        msg = f"{exe} with code {code}{f' out: {out!r}' if out else ''}{f' err: {err!r}' if err else ''}"
+        failure = RuntimeError(f"failed to query {msg}")
+    return failure, result
+
+def _run_identity(cls, exe, env):
+    cmd = [exe, "-S", "-E", "-c", IDENTITY_SCRIPT]
+    env = env.copy()
+    env.pop("__PYVENV_LAUNCHER__", None)
+    logging.debug("get interpreter identity via cmd: %s", LogCmd(cmd))
+    try:
+        process = Popen(
+            cmd,
+            universal_newlines=True,
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            encoding="utf-8",
+        )
+        out, err = process.communicate()
+        code = process.returncode
+    except OSError as os_error:
+        out, err, code = "", os_error.strerror, os_error.errno
+    if code == 0:
+        try:
+            return PythonIdentity.from_output(cls, exe, out.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            pass
+    msg = f"{exe} with code {code}{f' out: {out!r}' if out else ''}{f' err: {err!r}' if err else ''}"
+    return RuntimeError(f"failed to identify {msg}")
+
 class LogCmd:
 
     def __init__(self, cmd, env=None) -> None:
@@ -32,4 +346,12 @@ class LogCmd:
         if self.env is not None:
             cmd_repr = f'{cmd_repr} env of {self.env!r}'
         return cmd_repr
-___all___ = ['from_exe', 'clear', 'LogCmd']
\ No newline at end of file
+
+
+def clear(app_data):
+    app_data.py_info_clear()
+    _CACHE.clear()
+    _IDENTITIES.clear()
+
+
+___all___ = ['from_exe', 'add_alias', 'clear', 'identify', 'LogCmd', 'prefetch']
\ No newline at end of file
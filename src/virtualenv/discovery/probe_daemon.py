@@ -0,0 +1,227 @@
+"""
+An opt-in long-lived process that answers interpreter interrogations from one warm worker per target interpreter.
+
+Forking a fresh interpreter to run ``py_info.py`` pays the interpreter startup and the ``sysconfig``/``platform``
+imports every time. When ``VIRTUALENV_PROBE_DAEMON`` is set the first interrogation starts this daemon (listening on a
+unix socket inside the application data folder), which keeps a worker process (``py_info.py --serve``) alive per target
+interpreter and exits after being idle for a while. Any failure to talk to the daemon makes the caller fall back to the
+plain subprocess interrogation.
+
+Note: this file is also executed as a script by the host interpreter, so can only use standard library methods
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from random import choice
+from socketserver import StreamRequestHandler, ThreadingMixIn
+from string import ascii_letters, digits
+
+IDLE_TIMEOUT = 300
+_MAX_SOCKET_PATH = 100  # sun_path is 104 bytes on macOS and 108 on Linux, leave room for the terminating null
+_CONNECT_ATTEMPTS = 20
+_CONNECT_DELAY = 0.05
+
+
+def query(socket_path, exe, env, py_info_script, idle_timeout=IDLE_TIMEOUT, spawn=True):  # noqa: PLR0913, FBT002
+    """
+    Ask the daemon for the interrogation result of an interpreter.
+
+    :param socket_path: the unix socket the daemon listens on
+    :param exe: the interpreter to interrogate
+    :param env: the environment variables to interrogate with
+    :param py_info_script: the interrogation script the workers run
+    :param idle_timeout: seconds of inactivity after which a daemon we start exits
+    :param spawn: start the daemon if it's not running
+    :return: the serialized python info, or ``None`` if the daemon could not provide it
+    """
+    if len(os.fsencode(socket_path)) > _MAX_SOCKET_PATH:
+        logging.debug("probe daemon socket path %s too long", socket_path)
+        return None
+    request = json.dumps({"exe": exe, "env": dict(env)}).encode("utf-8") + b"\n"
+    for attempt in range(_CONNECT_ATTEMPTS):
+        try:
+            response = _ask(socket_path, request)
+        except OSError:
+            if not spawn:
+                return None
+            if attempt == 0:
+                _spawn(socket_path, py_info_script, idle_timeout)
+            time.sleep(_CONNECT_DELAY)
+            continue
+        if "error" in response:
+            logging.debug("probe daemon failed to interrogate %s: %s", exe, response["error"])
+            return None
+        return response["payload"]
+    logging.debug("probe daemon at %s did not come up", socket_path)
+    return None
+
+
+def _ask(socket_path, request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(request)
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        msg = "probe daemon closed the connection"
+        raise ConnectionError(msg)
+    return json.loads(line)
+
+
+def _spawn(socket_path, py_info_script, idle_timeout):
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    cmd = [sys.executable, os.path.abspath(__file__), socket_path, str(py_info_script), str(idle_timeout)]
+    logging.debug("start probe daemon via %s", cmd)
+    subprocess.Popen(  # noqa: S603
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+class _Worker:
+    """A warm interpreter running the interrogation script in serve mode."""
+
+    def __init__(self, exe, py_info_script, env) -> None:
+        self.exe = exe
+        self.fingerprint = _fingerprint(exe)
+        self.lock = threading.Lock()
+        env = env.copy()
+        env.pop("__PYVENV_LAUNCHER__", None)
+        self.process = subprocess.Popen(  # noqa: S603
+            [exe, py_info_script, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            universal_newlines=True,
+            encoding="utf-8",
+        )
+
+    @property
+    def stale(self):
+        return self.process.poll() is not None or self.fingerprint != _fingerprint(self.exe)
+
+    def ask(self):
+        token = "".join(choice(f"{ascii_letters}{digits}") for _ in range(32))  # noqa: S311
+        marker = token[::-1]
+        with self.lock:
+            self.process.stdin.write(f"{token}\n")
+            self.process.stdin.flush()
+            for line in iter(self.process.stdout.readline, ""):
+                at = line.find(marker)
+                if at > -1:  # anything else is noise printed by the target interpreters startup
+                    return line[at + len(marker) :].rstrip("\n")
+        msg = f"worker for {self.exe} exited with {self.process.wait()}"
+        raise RuntimeError(msg)
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def _fingerprint(exe):
+    try:
+        stat = os.stat(exe)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+def _worker_key(exe, env):
+    # only the variables that alter what the interpreter reports may require a new worker
+    return exe, tuple(sorted((k, v) for k, v in env.items() if k.startswith("PYTHON")))
+
+
+class _Handler(StreamRequestHandler):
+    def handle(self):
+        self.server.touch()
+        request = json.loads(self.rfile.readline())
+        try:
+            response = {"payload": self.server.interrogate(request["exe"], request["env"])}
+        except Exception as exception:  # noqa: BLE001
+            response = {"error": repr(exception)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.server.touch()
+
+
+if hasattr(socket, "AF_UNIX"):
+    from socketserver import UnixStreamServer
+
+    class _Server(ThreadingMixIn, UnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, socket_path, py_info_script, idle_timeout) -> None:
+            super().__init__(socket_path, _Handler)
+            self.py_info_script = py_info_script
+            self.idle_timeout = idle_timeout
+            self.timeout = 1
+            self.last_active = time.monotonic()
+            self._workers = {}
+            self._workers_lock = threading.Lock()
+
+        def touch(self):
+            self.last_active = time.monotonic()
+
+        @property
+        def idle(self):
+            return time.monotonic() - self.last_active > self.idle_timeout
+
+        def interrogate(self, exe, env):
+            key = _worker_key(exe, env)
+            with self._workers_lock:
+                worker = self._workers.get(key)
+                if worker is None or worker.stale:
+                    if worker is not None:
+                        worker.close()
+                    worker = self._workers[key] = _Worker(exe, self.py_info_script, env)
+            return worker.ask()
+
+        def server_close(self):
+            super().server_close()
+            with self._workers_lock:
+                for worker in self._workers.values():
+                    worker.close()
+                self._workers.clear()
+
+
+def serve(socket_path, py_info_script, idle_timeout):
+    import fcntl  # noqa: PLC0415
+
+    with open(f"{socket_path}.lock", "a", encoding="utf-8") as lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return  # another daemon owns this socket
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # left behind by a daemon that did not exit cleanly
+        old_mask = os.umask(0o177)  # only the owner may talk to us
+        try:
+            server = _Server(socket_path, py_info_script, idle_timeout)
+        finally:
+            os.umask(old_mask)
+        try:
+            while not server.idle:
+                server.handle_request()
+        finally:
+            os.unlink(socket_path)
+            server.server_close()
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1], sys.argv[2], float(sys.argv[3]))
@@ -0,0 +1,168 @@
+"""
+The identity of an interpreter: the few facts a spec is matched against.
+
+Interrogating an interpreter in full (via ``py_info.py``) computes the install schemes, the config variables, the paths
+and the encodings - yet rejecting a candidate found on the ``PATH`` only needs its implementation, version and
+architecture. These are probed by a one-liner run in isolated mode (at about the cost of starting the interpreter), and
+only the candidate finally selected is interrogated in full.
+
+For the well-known layout of a CPython install (``<prefix>/bin/python3.X`` next to ``<prefix>/lib/python3.X``) not even
+that is needed: the identity is read from the files of the install (the header of the executable for the architecture,
+``_sysconfigdata_*.py`` for the version and ABI flags), see :meth:`from_layout`. These tell the major and minor version
+only, the rest is left unknown - so matches any spec, and gets checked once the interpreter is interrogated in full.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+from pathlib import Path
+
+from virtualenv.discovery.py_info import VersionInfo
+from virtualenv.info import IS_WIN
+
+#: prints the identity of the interpreter running it, run via ``-S -E -c`` so that no site customization gets imported;
+#: importing ``json`` or ``platform`` would double the cost of the probe, so the latter only for exotic implementations
+IDENTITY_SCRIPT = (
+    "import sys; "
+    "print({'cpython': 'CPython', 'pypy': 'PyPy'}.get(sys.implementation.name) "
+    "or __import__('platform').python_implementation(), "
+    "64 if sys.maxsize > 2**32 else 32, *sys.version_info)"
+)
+
+
+class PythonIdentity:
+    """The implementation, version and architecture of an interpreter, standing in for its full information."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        info_cls,
+        executable,
+        implementation,
+        version_info,
+        architecture,
+        prefix=None,
+        abiflags=None,
+    ) -> None:
+        """
+        Create.
+
+        :param info_cls: the python info class the full information is interrogated as
+        :param executable: the executable of the interpreter
+        :param implementation: the implementation of the interpreter (e.g. ``CPython``)
+        :param version_info: the version of the interpreter, as ``sys.version_info`` (``None`` for the parts unknown)
+        :param architecture: the pointer size of the interpreter in bits
+        :param prefix: the prefix of the interpreter, if known
+        :param abiflags: the ABI flags of the interpreter, if known
+        """
+        self._info_cls = info_cls
+        self.executable = executable
+        self.original_executable = executable
+        # we can't tell if this is a virtual environment (without importing site), so it's its own system executable
+        self.system_executable = executable
+        self.implementation = implementation
+        self.version_info = VersionInfo(*version_info)
+        self.architecture = architecture
+        self.prefix = prefix
+        self.abiflags = abiflags
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.executable})"
+
+    def __str__(self) -> str:
+        version = ".".join(str(i) for i in self.version_info[:3] if i is not None)
+        return f"{type(self).__name__}(exe={self.executable}, {self.implementation} {version} {self.architecture}-bit)"
+
+    def satisfies(self, spec, impl_must_match):
+        """Check if a given specification can be satisfied by this interpreter, same as the full information would."""
+        return self._info_cls.satisfies(self, spec, impl_must_match)  # which only looks at the fields we have
+
+    def resolve(self, app_data=None, env=None):
+        """:return: the full information of the interpreter, ``None`` if it cannot be interrogated"""
+        return self._info_cls.from_exe(self.executable, app_data, raise_on_error=False, env=env)
+
+    @classmethod
+    def from_output(cls, info_cls, executable, out):
+        """:return: the identity out of the output of :data:`IDENTITY_SCRIPT`"""
+        implementation, architecture, major, minor, micro, releaselevel, serial = out.split()
+        version_info = int(major), int(minor), int(micro), releaselevel, int(serial)
+        return cls(info_cls, executable, implementation, version_info, int(architecture))
+
+    @classmethod
+    def from_layout(cls, info_cls, executable):
+        """
+        Identify an interpreter from the files of its install, without running it.
+
+        :param info_cls: the python info class the full information is interrogated as
+        :param executable: the executable of the interpreter
+        :return: the identity, ``None`` if the layout is not one we recognize (so the interpreter must be probed)
+        """
+        if IS_WIN:
+            return None
+        exe = Path(os.path.realpath(executable))
+        match = _EXE_RE.fullmatch(exe.name)
+        if match is None or exe.parent.name != "bin" or not os.access(str(exe), os.X_OK):
+            return None
+        prefix = exe.parent.parent
+        folder = Path(executable).parent
+        if (folder / "pyvenv.cfg").exists() or (folder.parent / "pyvenv.cfg").exists():
+            return None  # a virtual environment (even if a copy of the executable), its prefix is not the install's
+        config = _config_vars((prefix / "lib" / f"python{match['version']}{match['t']}").glob("_sysconfigdata_*.py"))
+        if config is None or config.get("VERSION") != match["version"]:
+            return None
+        architecture = _architecture(exe)
+        if architecture is None or architecture != config.get("SIZEOF_VOID_P", 0) * 8:
+            return None
+        # the micro version is not recorded by the install in a file we could trust (patchlevel.h comes with the
+        # development headers, packaged separately so possibly of another release), so leave it unknown
+        major, minor = (int(i) for i in match["version"].split("."))
+        version_info = major, minor, None, None, None
+        return cls(info_cls, executable, "CPython", version_info, architecture, str(prefix), config.get("ABIFLAGS", ""))
+
+    def _to_dict(self):
+        return {
+            "implementation": self.implementation,
+            "version_info": list(self.version_info),
+            "architecture": self.architecture,
+            "prefix": self.prefix,
+            "abiflags": self.abiflags,
+        }
+
+
+_EXE_RE = re.compile(r"python(?P<version>\d+\.\d+)(?P<t>t?)")
+# the scalar config variables we need, a regular expression is an order of magnitude cheaper than evaluating the file
+_CONFIG_VAR_RE = re.compile(r"'(?P<key>ABIFLAGS|SIZEOF_VOID_P|VERSION)':\s*(?P<value>'[^'\\\n]*'|\d+)")
+
+
+def _config_vars(files):
+    """:return: the config variables we need, ``None`` if there are no (or disagreeing) sysconfig data files"""
+    result = None
+    for file in files:
+        try:
+            text = file.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        config = {i["key"]: ast.literal_eval(i["value"]) for i in _CONFIG_VAR_RE.finditer(text)}
+        if result is not None and config != result:
+            return None  # e.g. multiple architectures sharing the library, we can't tell which one is ours
+        result = config
+    return result
+
+
+def _architecture(exe):
+    """:return: the pointer size of an ELF or (thin) Mach-O executable in bits, ``None`` for anything else"""
+    try:
+        with exe.open("rb") as file_handler:
+            header = file_handler.read(5)
+    except OSError:
+        return None
+    if header[:4] == b"\x7fELF":
+        return {1: 32, 2: 64}.get(header[4])  # EI_CLASS
+    return {b"\xce\xfa\xed\xfe": 32, b"\xcf\xfa\xed\xfe": 64}.get(header[:4])  # MH_MAGIC and MH_MAGIC_64
+
+
+__all__ = [
+    "IDENTITY_SCRIPT",
+    "PythonIdentity",
+]
@@ -15,6 +15,12 @@ import warnings
 from collections import OrderedDict, namedtuple
 from string import digits
 VersionInfo = namedtuple('VersionInfo', ['major', 'minor', 'micro', 'releaselevel', 'serial'])
+
+
+def _get_path_extensions():
+    return list(OrderedDict.fromkeys(["", *os.environ.get("PATHEXT", "").lower().split(os.pathsep)]))
+
+
 EXTENSIONS = _get_path_extensions()
 _CONF_VAR_RE = re.compile('\\{\\w+\\}')
 
@@ -89,14 +95,34 @@ class PythonInfo:
     def __str__(self) -> str:
         return '{}({})'.format(self.__class__.__name__, ', '.join((f'{k}={v}' for k, v in (('spec', self.spec), ('system' if self.system_executable is not None and self.system_executable != self.executable else None, self.system_executable), ('original' if self.original_executable not in {self.system_executable, self.executable} else None, self.original_executable), ('exe', self.executable), ('platform', self.platform), ('version', repr(self.version)), ('encoding_fs_io', f'{self.file_system_encoding}-{self.stdout_encoding}')) if k is not None)))
 
-    def satisfies(self, spec, impl_must_match):
+    def satisfies(self, spec, impl_must_match):  # noqa: C901
         """Check if a given specification can be satisfied by the this python interpreter instance."""
-        if impl_must_match and spec.implementation != self.implementation:
+        if spec.path:
+            if self.executable == os.path.abspath(spec.path):
+                return True  # if the path is a our own executable path we're done
+            if not spec.is_abs:
+                # if path set, and is not our original executable name, this does not match
+                basename = os.path.basename(self.original_executable)
+                spec_path = spec.path
+                if sys.platform == "win32":
+                    basename, suffix = os.path.splitext(basename)
+                    if spec_path.endswith(suffix):
+                        spec_path = spec_path[: -len(suffix)]
+                if basename != spec_path:
+                    return False
+
+        if (
+            impl_must_match
+            and spec.implementation is not None
+            and spec.implementation.lower() != self.implementation.lower()
+        ):
             return False
+
         if spec.architecture is not None and spec.architecture != self.architecture:
             return False
-        if spec.version_info:
-            if self.version_info[:len(spec.version_info)] != spec.version_info:
+
+        for our, req in zip(self.version_info[0:3], (spec.major, spec.minor, spec.micro)):
+            if req is not None and our is not None and our != req:
                 return False
         return True
     _current_system = None
@@ -128,44 +154,230 @@ class PythonInfo:
         return cls._current_system
 
     @classmethod
-    def from_exe(cls, exe, app_data=None, raise_on_error=True, ignore_cache=False, resolve_to_host=True, env=None):
+    def clear_cache(cls, app_data):
+        # this method is not used by itself, so here and called functions can import stuff locally
+        from virtualenv.discovery.cached_py_info import clear  # noqa: PLC0415
+
+        clear(app_data)
+        cls._cache_exe_discovery.clear()
+
+    @classmethod
+    def from_exe(  # noqa: PLR0913
+        cls,
+        exe,
+        app_data=None,
+        raise_on_error=True,  # noqa: FBT002
+        ignore_cache=False,  # noqa: FBT002
+        resolve_to_host=True,  # noqa: FBT002
+        env=None,
+    ):
         """Given a path to an executable get the python information."""
-        exe = os.path.abspath(exe)
-        if not ignore_cache and exe in cls._cache_exe_discovery:
-            return cls._cache_exe_discovery[exe]
+        # this method is not used by itself, so here and called functions can import stuff locally
+        from virtualenv.discovery.cached_py_info import from_exe  # noqa: PLC0415
 
-        if not os.path.exists(exe):
-            if raise_on_error:
-                raise RuntimeError(f"Executable {exe} does not exist")
-            return None
+        env = os.environ if env is None else env
+        proposed = from_exe(cls, app_data, exe, env=env, raise_on_error=raise_on_error, ignore_cache=ignore_cache)
 
-        info = cls()
-        info.executable = exe
-        info.original_executable = exe
+        if isinstance(proposed, PythonInfo) and resolve_to_host:
+            try:
+                proposed = proposed._resolve_to_system(app_data, proposed)  # noqa: SLF001
+            except Exception as exception:
+                if raise_on_error:
+                    raise
+                logging.info("ignore %s due cannot resolve system due to %r", proposed.original_executable, exception)
+                proposed = None
+        return proposed
 
-        try:
-            output = cls._run_subprocess([exe, "-c", "import json, sys; print(json.dumps(sys.version_info._asdict()))"])
-            version_info = json.loads(output)
-            info.version_info = VersionInfo(**version_info)
-        except Exception as e:
-            if raise_on_error:
-                raise RuntimeError(f"Failed to get version info from {exe}: {e}")
-            return None
+    @classmethod
+    def identify(cls, exe, app_data=None, env=None):
+        """
+        Given a path to an executable get enough information to check it against a spec, at the cost of starting it.
+
+        The full information is only returned if already known, otherwise an identity that can :meth:`satisfies` a
+        spec and be resolved to the full information on demand.
+        """
+        # this method is not used by itself, so here and called functions can import stuff locally
+        from virtualenv.discovery.cached_py_info import identify  # noqa: PLC0415
+
+        return identify(cls, app_data, exe, env=env)
+
+    def _to_json(self):
+        # don't save calculated paths, as these are non primitive types
+        return json.dumps(self._to_dict(), indent=2)
 
-        cls._cache_exe_discovery[exe] = info
-        return info
+    def _to_dict(self):
+        data = {var: (getattr(self, var) if var != "_creators" else None) for var in vars(self)}
+
+        data["version_info"] = data["version_info"]._asdict()  # namedtuple to dictionary
+        return data
+
+    @classmethod
+    def _from_json(cls, payload):
+        # the dictionary unroll here is to protect against pypy bug of interpreter crashing
+        raw = json.loads(payload)
+        return cls._from_dict(raw.copy())
+
+    @classmethod
+    def _from_dict(cls, data):
+        data["version_info"] = VersionInfo(**data["version_info"])  # restore this to a named tuple structure
+        result = cls()
+        result.__dict__ = data.copy()
+        return result
+
+    @classmethod
+    def _resolve_to_system(cls, app_data, target):
+        start_executable = target.executable
+        prefixes = OrderedDict()
+        while target.system_executable is None:
+            prefix = target.real_prefix or target.base_prefix or target.prefix
+            if prefix in prefixes:
+                if len(prefixes) == 1:
+                    # if we're linking back to ourselves accept ourselves with a WARNING
+                    logging.info("%r links back to itself via prefixes", target)
+                    target.system_executable = target.executable
+                    break
+                for at, (p, t) in enumerate(prefixes.items(), start=1):
+                    logging.error("%d: prefix=%s, info=%r", at, p, t)
+                logging.error("%d: prefix=%s, info=%r", len(prefixes) + 1, prefix, target)
+                msg = "prefixes are causing a circle {}".format("|".join(prefixes.keys()))
+                raise RuntimeError(msg)
+            prefixes[prefix] = target
+            target = target.discover_exe(app_data, prefix=prefix, exact=False)
+        if target.executable != target.system_executable:
+            target = cls.from_exe(target.system_executable, app_data)
+        target.executable = start_executable
+        return target
+
+    def discover_exe(self, app_data, prefix, exact=True, env=None):  # noqa: FBT002
+        key = prefix, exact
+        if key in self._cache_exe_discovery and prefix:
+            logging.debug("discover exe from cache %s - exact %s: %r", prefix, exact, self._cache_exe_discovery[key])
+            return self._cache_exe_discovery[key]
+        logging.debug("discover exe for %s in %s", self, prefix)
+        # we don't know explicitly here, do some guess work - our executable name should tell
+        possible_names = self._find_possible_exe_names()
+        possible_folders = self._find_possible_folders(prefix)
+        discovered = []
+        env = os.environ if env is None else env
+        for folder in possible_folders:
+            for name in possible_names:
+                info = self._check_exe(app_data, folder, name, exact, discovered, env)
+                if info is not None:
+                    self._cache_exe_discovery[key] = info
+                    return info
+        if exact is False and discovered:
+            info = self._select_most_likely(discovered, self)
+            folders = os.pathsep.join(possible_folders)
+            self._cache_exe_discovery[key] = info
+            logging.debug("no exact match found, chosen most similar of %s within base folders %s", info, folders)
+            return info
+        msg = "failed to detect {} in {}".format("|".join(possible_names), os.pathsep.join(possible_folders))
+        raise RuntimeError(msg)
+
+    def _check_exe(self, app_data, folder, name, exact, discovered, env):  # noqa: PLR0913
+        exe_path = os.path.join(folder, name)
+        if not os.path.exists(exe_path):
+            return None
+        info = self.from_exe(exe_path, app_data, resolve_to_host=False, raise_on_error=False, env=env)
+        if info is None:  # ignore if for some reason we can't query
+            return None
+        for item in ["implementation", "architecture", "version_info"]:
+            found = getattr(info, item)
+            searched = getattr(self, item)
+            if found != searched:
+                if item == "version_info":
+                    found, searched = ".".join(str(i) for i in found), ".".join(str(i) for i in searched)
+                executable = info.executable
+                logging.debug("refused interpreter %s because %s differs %s != %s", executable, item, found, searched)
+                if exact is False:
+                    discovered.append(info)
+                break
+        else:
+            return info
+        return None
 
     @staticmethod
-    def _run_subprocess(cmd):
-        import subprocess
-        try:
-            output = subprocess.check_output(cmd, universal_newlines=True, stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError as e:
-            output = e.output
-        return output.strip()
+    def _select_most_likely(discovered, target):
+        # no exact match found, start relaxing our requirements then to facilitate system package upgrades that
+        # could cause this (when using copy strategy of the host python)
+        def sort_by(info):
+            # we need to setup some priority of traits, this is as follows:
+            # implementation, major, minor, micro, architecture, tag, serial
+            matches = [
+                info.implementation == target.implementation,
+                info.version_info.major == target.version_info.major,
+                info.version_info.minor == target.version_info.minor,
+                info.architecture == target.architecture,
+                info.version_info.micro == target.version_info.micro,
+                info.version_info.releaselevel == target.version_info.releaselevel,
+                info.version_info.serial == target.version_info.serial,
+            ]
+            return sum((1 << pos if match else 0) for pos, match in enumerate(reversed(matches)))
+
+        sorted_discovered = sorted(discovered, key=sort_by, reverse=True)  # sort by priority in decreasing order
+        return sorted_discovered[0]
+
+    def _find_possible_folders(self, inside_folder):
+        candidate_folder = OrderedDict()
+        executables = OrderedDict()
+        executables[os.path.realpath(self.executable)] = None
+        executables[self.executable] = None
+        executables[os.path.realpath(self.original_executable)] = None
+        executables[self.original_executable] = None
+        for exe in executables:
+            base = os.path.dirname(exe)
+            # following path pattern of the current
+            if base.startswith(self.prefix):
+                relative = base[len(self.prefix) :]
+                candidate_folder[f"{inside_folder}{relative}"] = None
+
+        # or at root level
+        candidate_folder[inside_folder] = None
+        return [i for i in candidate_folder if os.path.exists(i)]
+
+    def _find_possible_exe_names(self):
+        name_candidate = OrderedDict()
+        for name in self._possible_base():
+            for at in (3, 2, 1, 0):
+                version = ".".join(str(i) for i in self.version_info[:at])
+                for arch in [f"-{self.architecture}", ""]:
+                    for ext in EXTENSIONS:
+                        candidate = f"{name}{version}{arch}{ext}"
+                        name_candidate[candidate] = None
+        return list(name_candidate.keys())
+
+    def _possible_base(self):
+        possible_base = OrderedDict()
+        basename = os.path.splitext(os.path.basename(self.executable))[0].rstrip(digits)
+        possible_base[basename] = None
+        possible_base[self.implementation] = None
+        # python is always the final option as in practice is used by multiple implementation as exe name
+        if "python" in possible_base:
+            del possible_base["python"]
+        possible_base["python"] = None
+        for base in possible_base:
+            lower = base.lower()
+            yield lower
+            from virtualenv.info import fs_is_case_sensitive  # noqa: PLC0415
+
+            if fs_is_case_sensitive():
+                if base != lower:
+                    yield base
+                upper = base.upper()
+                if upper != base:
+                    yield upper
+
+
     _cache_exe_discovery = {}
 if __name__ == '__main__':
     argv = sys.argv[1:]
+    if argv[:1] == ['--serve']:
+        # answer the probe daemon (one line per request) until it closes our stdin
+        sys.argv = sys.argv[:1]
+        for token in iter(sys.stdin.readline, ''):
+            sys.stdout.write(f'{token.strip()[::-1]}{json.dumps(PythonInfo()._to_dict())}\n')
+            sys.stdout.flush()
+        sys.exit(0)
     if len(argv) >= 1:
         start_cookie = argv[0]
         argv = argv[1:]
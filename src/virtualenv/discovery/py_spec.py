@@ -16,18 +16,73 @@ class PythonSpec:
         self.architecture = architecture
         self.path = path
 
+    @classmethod
+    def from_string_spec(cls, string_spec: str):  # noqa: C901, PLR0912
+        impl, major, minor, micro, arch, path = None, None, None, None, None, None
+        if os.path.isabs(string_spec):  # noqa: PLR1702
+            path = string_spec
+        else:
+            ok = False
+            match = re.match(PATTERN, string_spec)
+            if match:
+
+                def _int_or_none(val):
+                    return None if val is None else int(val)
+
+                try:
+                    groups = match.groupdict()
+                    version = groups["version"]
+                    if version is not None:
+                        versions = tuple(int(i) for i in version.split(".") if i)
+                        if len(versions) > 3:  # noqa: PLR2004
+                            raise ValueError  # noqa: TRY301
+                        if len(versions) == 3:  # noqa: PLR2004
+                            major, minor, micro = versions
+                        elif len(versions) == 2:  # noqa: PLR2004
+                            major, minor = versions
+                        elif len(versions) == 1:
+                            version_data = versions[0]
+                            major = int(str(version_data)[0])  # first digit major
+                            if version_data > 9:  # noqa: PLR2004
+                                minor = int(str(version_data)[1:])
+                    ok = True
+                except ValueError:
+                    pass
+                else:
+                    impl = groups["impl"]
+                    if impl in {"py", "python"}:
+                        impl = None
+                    arch = _int_or_none(groups["arch"])
+
+            if not ok:
+                path = string_spec
+
+        return cls(string_spec, impl, major, minor, micro, arch, path)
+
     def generate_re(self, *, windows: bool) -> re.Pattern:
         """Generate a regular expression for matching against a filename."""
-        impl = self.implementation or r'[a-zA-Z]+'
-        version = rf'{self.major or r"\d+"}\.{self.minor or r"\d+"}\.{self.micro or r"\d+"}'
-        arch = rf'(32|64)' if self.architecture is None else str(self.architecture)
-        
-        if windows:
-            pattern = rf'{impl}-{version}(-{arch})?\.exe'
-        else:
-            pattern = rf'{impl}{version}'
-        
-        return re.compile(pattern, re.IGNORECASE)
+        version = r"{}(\.{}(\.{})?)?".format(
+            *(r"\d+" if v is None else v for v in (self.major, self.minor, self.micro)),
+        )
+        impl = "python" if self.implementation is None else f"python|{re.escape(self.implementation)}"
+        suffix = r"\.exe" if windows else ""
+        version_conditional = (
+            "?"
+            # Windows Python executables are almost always unversioned
+            if windows
+            # Spec is an empty string
+            or self.major is None
+            else ""
+        )
+        # Try matching `direct` first, so the `direct` group is filled when possible.
+        return re.compile(
+            rf"(?P<impl>{impl})(?P<v>{version}){version_conditional}{suffix}$",
+            flags=re.IGNORECASE,
+        )
+
+    @property
+    def is_abs(self):
+        return self.path is not None and os.path.isabs(self.path)
 
     def satisfies(self, spec):
         """Called when there's a candidate metadata spec to see if compatible - e.g. PEP-514 on Windows."""
@@ -53,6 +108,6 @@ class PythonSpec:
 
     def __repr__(self) -> str:
         name = type(self).__name__
-        params = ('implementation', 'major', 'minor', 'micro', 'architecture', 'path')
-        return f'{name}({', '.join((f'{k}={getattr(self, k)}' for k in params if getattr(self, k) is not None))})'
+        params = "implementation", "major", "minor", "micro", "architecture", "path"
+        return f"{name}({', '.join(f'{k}={getattr(self, k)}' for k in params if getattr(self, k) is not None)})"
 __all__ = ['PythonSpec']
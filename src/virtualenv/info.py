@@ -12,4 +12,69 @@ IS_MAC_ARM64 = sys.platform == 'darwin' and platform.machine() == 'arm64'
 ROOT = os.path.realpath(os.path.join(os.path.abspath(__file__), os.path.pardir, os.path.pardir))
 IS_ZIPAPP = os.path.isfile(ROOT)
 _CAN_SYMLINK = _FS_CASE_SENSITIVE = _CFG_DIR = _DATA_DIR = None
-__all__ = ('IS_CPYTHON', 'IS_MAC_ARM64', 'IS_PYPY', 'IS_WIN', 'IS_ZIPAPP', 'ROOT', 'fs_is_case_sensitive', 'fs_path_id', 'fs_supports_symlink')
\ No newline at end of file
+
+
+def fs_is_case_sensitive():
+    global _FS_CASE_SENSITIVE  # noqa: PLW0603
+
+    if _FS_CASE_SENSITIVE is None:
+        with tempfile.NamedTemporaryFile(prefix="TmP") as tmp_file:
+            _FS_CASE_SENSITIVE = not os.path.exists(tmp_file.name.lower())
+            logging.debug("filesystem is %scase-sensitive", "" if _FS_CASE_SENSITIVE else "not ")
+    return _FS_CASE_SENSITIVE
+
+
+def fs_supports_symlink():
+    global _CAN_SYMLINK  # noqa: PLW0603
+
+    if _CAN_SYMLINK is None:
+        can = False
+        if hasattr(os, "symlink"):
+            if IS_WIN:
+                with tempfile.NamedTemporaryFile(prefix="TmP") as tmp_file:
+                    temp_dir = os.path.dirname(tmp_file.name)
+                    dest = os.path.join(temp_dir, f"{tmp_file.name}-{'b'}")
+                    try:
+                        os.symlink(tmp_file.name, dest)
+                        can = True
+                    except (OSError, NotImplementedError):
+                        pass
+                logging.debug("symlink on filesystem does%s work", "" if can else " not")
+            else:
+                can = True
+        _CAN_SYMLINK = can
+    return _CAN_SYMLINK
+
+
+def fs_path_id(path: str) -> str:
+    return path.casefold() if fs_is_case_sensitive() else path
+
+
+def fs_file_id(path: str) -> tuple[int, int] | None:
+    """
+    Identify the file a path resolves to, so that aliases (symlinks, hard links) of it can be told apart cheaply.
+
+    :param path: the path
+    :return: the ``(st_dev, st_ino)`` pair of the file (following symlinks), or ``None`` if it cannot be determined
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not stat.st_ino:  # some file systems (and older Windows Pythons) don't provide one
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+__all__ = (
+    "IS_CPYTHON",
+    "IS_MAC_ARM64",
+    "IS_PYPY",
+    "IS_WIN",
+    "IS_ZIPAPP",
+    "ROOT",
+    "fs_file_id",
+    "fs_is_case_sensitive",
+    "fs_path_id",
+    "fs_supports_symlink",
+)
\ No newline at end of file
@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from timeit import default_timer
+from typing import NamedTuple
 
 from virtualenv.app_data import make_app_data
+from virtualenv.app_data.trim import parse_size, trim
 from virtualenv.config.cli.parser import VirtualEnvConfigParser
 from virtualenv.report import LEVELS, setup_report
 from virtualenv.run.session import Session
-from virtualenv.seed.wheels.periodic_update import manual_upgrade
+from virtualenv.util.profiling import profile, profile_target
 from virtualenv.version import __version__
 
 from .plugin.activators import ActivationSelector
+from .plugin.base import PluginLoader
 from .plugin.creators import CreatorSelector
 from .plugin.discovery import get_discover
 from .plugin.seeders import SeederSelector
+from .timings import Timings
 
 
 def cli_run(args, options=None, setup_logging=True, env=None):  # noqa: FBT002
@@ -28,12 +34,89 @@ def cli_run(args, options=None, setup_logging=True, env=None):  # noqa: FBT002
     :return: the session object of the creation (its structure for now is experimental and might change on short notice)
     """
     env = os.environ if env is None else env
-    of_session = session_via_cli(args, options, setup_logging, env)
-    with of_session:
-        of_session.run()
+    with profile(profile_target(args, env)):
+        of_session = session_via_cli(args, options, setup_logging, env)
+        with of_session:
+            of_session.run()
     return of_session
 
 
+class BatchResult(NamedTuple):
+    """The outcome of creating one destination within :func:`cli_run_many`."""
+
+    dest: str
+    session: Session | None
+    error: Exception | None
+    elapsed: float
+
+
+def cli_run_many(destinations, args=(), options=None, setup_logging=True, env=None, jobs=None):  # noqa: FBT002, PLR0913
+    """
+    Create many virtual environments with the same configuration, all within the current process.
+
+    The command line is parsed, the interpreter discovered and the creator/seeder/activators selected only once, the
+    environments are then created concurrently sharing the app data (and so the seed wheel images).
+
+    With ``--timings-json`` the timings of each environment are written to a file of their own, the index of the
+    destination appended to the stem of the path (e.g. ``timings-0.json``, ``timings-1.json``).
+
+    :param destinations: the paths of the virtual environments to create
+    :param args: the command line arguments (without the destination)
+    :param options: passing in a ``VirtualEnvOptions`` object allows return of the parsed options
+    :param setup_logging: ``True`` if setup logging handlers, ``False`` to use handlers already registered
+    :param env: environment variables to use
+    :param jobs: the number of environments to create at once, by default the number of CPUs (at most 8)
+    :return: a :class:`BatchResult` per destination, in the order of the destinations
+    """
+    destinations = [str(i) for i in destinations]
+    if not destinations:
+        return []
+    env = os.environ if env is None else env
+    args = list(args)
+    timings = Timings()
+    parser, elements = build_parser([*args, destinations[0]], options, setup_logging, env, timings)
+    sessions = []
+    for at, dest in enumerate(destinations):  # parsing updates the parsers options object, create the elements after it
+        options = parser.parse_args([*args, dest])
+        creator, seeder, activators = tuple(e.create(options) for e in elements)
+        session = Session(
+            options.verbosity,
+            options.app_data,
+            parser._interpreter,  # noqa: SLF001
+            creator,
+            seeder,
+            activators,
+            template_cache=options.template_cache,
+            # the parse phases are shared, but each session reports its own creation
+            timings=timings.copy(_batch_path(options.timings_json, at)),
+        )
+        sessions.append(session)
+
+    def _run(session):
+        start = default_timer()
+        try:
+            session.run()
+        except Exception as exception:  # noqa: BLE001
+            logging.error("failed to create %s: %r", session.creator.dest, exception)  # noqa: TRY400
+            return BatchResult(str(session.creator.dest), None, exception, default_timer() - start)
+        return BatchResult(str(session.creator.dest), session, None, default_timer() - start)
+
+    jobs = min(8, os.cpu_count() or 1) if jobs is None else jobs
+    try:
+        with ThreadPoolExecutor(max_workers=max(jobs, 1), thread_name_prefix="virtualenv-batch") as executor:
+            return list(executor.map(_run, sessions))
+    finally:
+        options.app_data.close()  # shared by all sessions, so we close it once instead of per session
+
+
+def _batch_path(path, at):
+    """:return: the path of the timings file for the destination at an index within the batch"""
+    if path is None:
+        return None
+    root, ext = os.path.splitext(path)
+    return f"{root}-{at}{ext}"
+
+
 def session_via_cli(args, options=None, setup_logging=True, env=None):  # noqa: FBT002
     """
     Create a virtualenv session (same as cli_run, but this does not perform the creation). Use this if you just want to
@@ -46,8 +129,10 @@ def session_via_cli(args, options=None, setup_logging=True, env=None):  # noqa:
     :return: the session object of the creation (its structure for now is experimental and might change on short notice)
     """  # noqa: D205
     env = os.environ if env is None else env
-    parser, elements = build_parser(args, options, setup_logging, env)
+    timings = Timings()
+    parser, elements = build_parser(args, options, setup_logging, env, timings)
     options = parser.parse_args(args)
+    timings.path = options.timings_json
     creator, seeder, activators = tuple(e.create(options) for e in elements)  # create types
     return Session(
         options.verbosity,
@@ -56,10 +141,13 @@ def session_via_cli(args, options=None, setup_logging=True, env=None):  # noqa:
         creator,
         seeder,
         activators,
+        template_cache=options.template_cache,
+        timings=timings,
     )
 
 
-def build_parser(args=None, options=None, setup_logging=True, env=None):  # noqa: FBT002
+def build_parser(args=None, options=None, setup_logging=True, env=None, timings=None):  # noqa: FBT002
+    timings = Timings() if timings is None else timings
     parser = VirtualEnvConfigParser(options, os.environ if env is None else env)
     add_version_flag(parser)
     parser.add_argument(
@@ -69,12 +157,38 @@ def build_parser(args=None, options=None, setup_logging=True, env=None):  # noqa
         default=False,
         help="on failure also display the stacktrace internals of virtualenv",
     )
+    parser.add_argument(
+        "--template-cache",
+        dest="template_cache",
+        action="store_true",
+        default=False,
+        help="clone a cached template of an identical environment from the app data instead of creating it from "
+        "scratch (the template is created on first use)",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        metavar="OUT",
+        default=None,
+        help="profile the run (and the interpreter interrogations it does) via cProfile, writing the stats in pstats "
+        "format to OUT, and a summary of the slowest functions to OUT.txt - work done in worker threads is only "
+        "accounted as time spent waiting on them",
+    )
+    parser.add_argument(
+        "--timings-json",
+        dest="timings_json",
+        metavar="PATH",
+        default=None,
+        help="write the time spent within each phase of the creation as JSON to this file",
+    )
     _do_report_setup(parser, args, setup_logging)
     options = load_app_data(args, parser, options)
     handle_extra_commands(options)
+    PluginLoader.cache_in(options.app_data)
 
     discover = get_discover(parser, args)
-    parser._interpreter = interpreter = discover.interpreter  # noqa: SLF001
+    with timings.phase("discovery"):
+        parser._interpreter = interpreter = discover.interpreter  # noqa: SLF001
     if interpreter is None:
         msg = f"failed to find interpreter for {discover}"
         raise RuntimeError(msg)
@@ -97,8 +211,15 @@ def build_parser_only(args=None):
 
 def handle_extra_commands(options):
     if options.upgrade_embed_wheels:
+        # imported on demand as it pulls in the network stack, which is slow to import
+        from virtualenv.seed.wheels.periodic_update import manual_upgrade  # noqa: PLC0415
+
         result = manual_upgrade(options.app_data, options.env)
         raise SystemExit(result)
+    if options.app_data_gc:
+        if options.app_data.can_update and not options.app_data.transient:
+            trim(options.app_data.lock.path, options.app_data_max_size or 0)
+        raise SystemExit(0)
 
 
 def load_app_data(args, parser, options):
@@ -107,14 +228,38 @@ def load_app_data(args, parser, options):
         action="store_true",
         help="use app data folder in read-only mode (write operations will fail with error)",
     )
+    parser.add_argument(
+        "--app-data-shared",
+        dest="app_data_shared",
+        metavar="PATH",
+        default=None,
+        help="a pre-warmed, read-only app data folder (e.g. shared between the users of a machine) to consult first, "
+        "the app data folder is then only used for what's missing from it",
+    )
+    parser.add_argument(
+        "--app-data-max-size",
+        dest="app_data_max_size",
+        metavar="SIZE",
+        type=parse_size,
+        default=None,
+        help="size budget of the app data folder (e.g. 500M or 2G), once a day the least recently used content over "
+        "it is evicted in the background",
+    )
     options, _ = parser.parse_known_args(args, namespace=options)
+    make = partial(
+        make_app_data,
+        read_only=options.read_only_app_data,
+        env=options.env,
+        shared=options.app_data_shared,
+        max_size=options.app_data_max_size,
+    )
 
     # here we need a write-able application data (e.g. the zipapp might need this for discovery cache)
     parser.add_argument(
         "--app-data",
         help="a data folder used as cache by the virtualenv",
-        type=partial(make_app_data, read_only=options.read_only_app_data, env=options.env),
-        default=make_app_data(None, read_only=options.read_only_app_data, env=options.env),
+        type=make,
+        default=make(None),
     )
     parser.add_argument(
         "--reset-app-data",
@@ -126,6 +271,12 @@ def load_app_data(args, parser, options):
         action="store_true",
         help="trigger a manual update of the embedded wheels",
     )
+    parser.add_argument(
+        "--app-data-gc",
+        action="store_true",
+        help="evict the least recently used content of the app data folder until it fits --app-data-max-size (all of "
+        "it if no size is set), content used within the last hour or locked by others is kept, then exit",
+    )
     options, _ = parser.parse_known_args(args, namespace=options)
     if options.reset_app_data:
         options.app_data.reset()
@@ -159,6 +310,8 @@ def _do_report_setup(parser, args, setup_logging):
 
 
 __all__ = [
+    "BatchResult",
     "cli_run",
+    "cli_run_many",
     "session_via_cli",
 ]
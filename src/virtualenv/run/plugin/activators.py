@@ -7,7 +7,9 @@ class ActivationSelector(ComponentBuilder):
 
     def __init__(self, interpreter, parser) -> None:
         self.default = None
-        possible = OrderedDict(((k, v) for k, v in self.options('virtualenv.activate').items() if v.supports(interpreter)))
+        # whether an activator supports the interpreter can only be told by importing it
+        loaded = ((k, v.load()) for k, v in self.options('virtualenv.activate').items())
+        possible = OrderedDict(((k, v) for k, v in loaded if v.supports(interpreter)))
         super().__init__(interpreter, parser, 'activators', possible)
         self.parser.description = 'options for activation scripts'
         self.active = None
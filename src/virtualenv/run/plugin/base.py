@@ -1,19 +1,101 @@
 from __future__ import annotations
+
+import os
 import sys
 from collections import OrderedDict
+from importlib import import_module
+
 if sys.version_info >= (3, 8):
     from importlib.metadata import entry_points
+
     importlib_metadata_version = ()
 else:
     from importlib_metadata import entry_points, version
-    importlib_metadata_version = tuple((int(i) for i in version('importlib_metadata').split('.')[:2]))
+
+    importlib_metadata_version = tuple(int(i) for i in version("importlib_metadata").split(".")[:2])
+
+_GROUPS = ("virtualenv.activate", "virtualenv.create", "virtualenv.discovery", "virtualenv.seed")
+
+
+class LazyEntryPoint:
+    """A plugin entry point that imports its target only when first loaded."""
+
+    def __init__(self, name, value) -> None:
+        self.name = name
+        self.value = value
+        self._loaded = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name}={self.value})"
+
+    def load(self):
+        if self._loaded is None:
+            module, _, attrs = self.value.partition(":")
+            result = import_module(module.strip())
+            for attr in filter(None, attrs.strip().split(".")):
+                result = getattr(result, attr)
+            self._loaded = result
+        return self._loaded
+
 
 class PluginLoader:
     _OPTIONS = None
     _ENTRY_POINTS = None
+    _APP_DATA = None
+
+    @classmethod
+    def cache_in(cls, app_data):
+        """Persist the discovered entry points within the app data (must be called before any plugin is looked up)."""
+        PluginLoader._APP_DATA = app_data
+
+    @classmethod
+    def entry_points_for(cls, key):
+        return OrderedDict((name, LazyEntryPoint(name, value)) for name, value in cls.entry_points().get(key, []))
+
+    @staticmethod
+    def entry_points():
+        if PluginLoader._ENTRY_POINTS is None:
+            PluginLoader._ENTRY_POINTS = _load_entry_points(PluginLoader._APP_DATA)
+        return PluginLoader._ENTRY_POINTS
 
-class ComponentBuilder(PluginLoader):
 
+def _load_entry_points(app_data):
+    """
+    Scanning the metadata of every installed distribution is slow, so we keep the outcome in the app data.
+
+    The result is reused for as long as none of the folders on ``sys.path`` (where the distributions metadata lives) was
+    modified, as installing or removing a distribution changes the modification time of its parent folder.
+    """
+    store = None if app_data is None else app_data.plugins()
+    signature = _path_signature()
+    if store is not None:  # the store is written via an atomic rename, so reading it needs no lock
+        cached = store.read() if store.exists() else None
+        if cached is not None and cached.get("signature") == signature:
+            return {k: [tuple(i) for i in v] for k, v in cached["entry_points"].items()}
+    result = _scan_entry_points()
+    if store is not None and app_data.can_update:
+        store.write({"signature": signature, "entry_points": result})
+    return result
+
+
+def _scan_entry_points():
+    found = entry_points()
+    if sys.version_info >= (3, 10) or importlib_metadata_version >= (3, 6):
+        return {key: [(e.name, e.value) for e in found.select(group=key)] for key in _GROUPS}
+    return {key: [(e.name, e.value) for e in found.get(key, [])] for key in _GROUPS}
+
+
+def _path_signature():
+    signature = []
+    for entry in sys.path:
+        try:
+            signature.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            signature.append([entry, None])
+    return signature
+
+
+class ComponentBuilder(PluginLoader):
     def __init__(self, interpreter, parser, name, possible) -> None:
         self.interpreter = interpreter
         self.name = name
@@ -21,4 +103,37 @@ class ComponentBuilder(PluginLoader):
         self.possible = possible
         self.parser = parser.add_argument_group(title=name)
         self.add_selector_arg_parse(name, list(self.possible))
-__all__ = ['ComponentBuilder', 'PluginLoader']
\ No newline at end of file
+
+    @classmethod
+    def options(cls, key):
+        if cls._OPTIONS is None:
+            cls._OPTIONS = cls.entry_points_for(key)
+        return cls._OPTIONS
+
+    def add_selector_arg_parse(self, name, choices):
+        raise NotImplementedError
+
+    def handle_selected_arg_parse(self, options):
+        selected = getattr(options, self.name)
+        if selected not in self.possible:
+            msg = f"No implementation for {self.interpreter}"
+            raise RuntimeError(msg)
+        impl = self.possible[selected]
+        # only the selected plugin needs to be imported
+        self._impl_class = impl.load() if isinstance(impl, LazyEntryPoint) else impl
+        self.populate_selected_argparse(selected, options.app_data)
+        return selected
+
+    def populate_selected_argparse(self, selected, app_data):
+        self.parser.description = f"options for {self.name} {selected}"
+        self._impl_class.add_parser_arguments(self.parser, self.interpreter, app_data)
+
+    def create(self, options):
+        return self._impl_class(options, self.interpreter)
+
+
+__all__ = [
+    "ComponentBuilder",
+    "LazyEntryPoint",
+    "PluginLoader",
+]
@@ -2,16 +2,34 @@ from __future__ import annotations
 import json
 import logging
 
+from virtualenv.util.lock import LOCK_WAITS
+from virtualenv.util.path import safe_delete
+
+from .template import EnvTemplate
+from .timings import Timings
+
 class Session:
     """Represents a virtual environment creation session."""
 
-    def __init__(self, verbosity, app_data, interpreter, creator, seeder, activators) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        verbosity,
+        app_data,
+        interpreter,
+        creator,
+        seeder,
+        activators,
+        template_cache=False,  # noqa: FBT002
+        timings=None,
+    ) -> None:
         self._verbosity = verbosity
         self._app_data = app_data
         self._interpreter = interpreter
         self._creator = creator
         self._seeder = seeder
         self._activators = activators
+        self._template_cache = template_cache
+        self._timings = Timings() if timings is None else timings
 
     @property
     def verbosity(self):
@@ -38,6 +56,76 @@ class Session:
         """Activators used to generate activations scripts."""
         return self._activators
 
+    @property
+    def timings(self):
+        """The time spent within the phases of the creation."""
+        return self._timings
+
+    def run(self):
+        waited = LOCK_WAITS.seconds
+        if not (self._template_cache and self._from_template()):
+            self._create()
+            self._seed()
+            self._activate()
+            self.creator.pyenv_cfg.write()
+        if LOCK_WAITS.seconds > waited:  # process wide, so includes waits of sessions run concurrently with this one
+            self._timings.add("lock_wait", LOCK_WAITS.seconds - waited)
+        self._timings.dump(dest=str(self.creator.dest))
+
+    def _create(self):
+        logging.info("create virtual environment via %s", self.creator)
+        with self._timings.phase("create"):
+            self.creator.run()
+        logging.debug(_DEBUG_MARKER)
+        logging.debug("%s", _Debug(self.creator))
+
+    def _seed(self):
+        if self.seeder is not None and self.seeder.enabled:
+            logging.info("add seed packages via %s", self.seeder)
+            with self._timings.phase("seed"):
+                self.seeder.run(self.creator)
+            # seeders may report the time spent per stage and distribution
+            for stage, per_distribution in getattr(self.seeder, "timings", {}).items():
+                for distribution, elapsed in per_distribution.items():
+                    self._timings.add(f"seed.{stage}.{distribution}", elapsed)
+
+    def _activate(self):
+        if self.activators:
+            active = ", ".join(type(i).__name__.replace("Activator", "") for i in self.activators)
+            logging.info("add activators for %s", active)
+            with self._timings.phase("activate"):
+                for activator in self.activators:
+                    name = type(activator).__name__.replace("Activator", "").lower()
+                    with self._timings.phase(f"activate.{name}"):
+                        activator.generate(self.creator)
+
+    def _from_template(self):
+        dest = self.creator.dest
+        if dest.exists() and not self.creator.clear and any(dest.iterdir()):
+            return False  # we'd need to merge into existing content, do the regular creation
+        with self._timings.phase("template"):
+            template = EnvTemplate.of_session(self)
+            if template is None:
+                return False
+            lock = self._app_data.lock
+            with lock.shared_lock_for_key("template"):
+                ready = template.ready
+            if not ready:
+                with lock.lock_for_key("template"):
+                    if not template.ready and not template.build(self):
+                        return False
+            with lock.shared_lock_for_key("template"):  # many may clone at once, eviction waits for them
+                if not template.relocatable:
+                    logging.debug("template %s is not relocatable, create the environment", template.folder)
+                    return False
+                if not template.fits(dest):
+                    logging.debug("template %s does not fit %s, create the environment", template.folder, dest)
+                    return False
+                if dest.exists():
+                    safe_delete(dest)
+                template.materialize(dest)
+        return True
+
     def __enter__(self):
         return self
 
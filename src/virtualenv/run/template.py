@@ -0,0 +1,215 @@
+"""
+Materialize virtual environments by cloning a cached template of an identical environment.
+
+For a given interpreter, creator configuration, seed wheels and activators the created environment differs from any
+other such environment only by its destination path (in activation scripts, console script shebangs, etc.). So we
+create the environment once into the application data under a unique placeholder path, and later materialize new
+environments by cloning that tree and substituting the placeholder with the real destination.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from copy import copy
+from hashlib import sha256
+from pathlib import Path
+
+from virtualenv.app_data.trim import touch
+from virtualenv.app_data.via_disk_folder import fingerprint
+from virtualenv.create.pyenv_cfg import PyEnvCfg
+from virtualenv.util.path import copy_file, safe_delete
+from virtualenv.version import __version__
+
+_MANIFEST = "manifest.json"
+_SKIP_DIRS = {"__pycache__"}  # byte code embeds the source path, let it be regenerated
+
+
+class EnvTemplate:
+    """A relocatable template of a virtual environment in the application data."""
+
+    def __init__(self, app_data, key) -> None:
+        self.app_data = app_data
+        self.key = key
+        self.folder = app_data.lock.path / "template" / key[:32]
+        self.placeholder = f"_virtualenv_template_{key[:16]}_"
+        self.root = self.folder / self.placeholder
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.folder})"
+
+    @classmethod
+    def of_session(cls, session):
+        """:return: the template matching the session, or ``None`` if the session can't be served via templates"""
+        app_data = session._app_data  # noqa: SLF001
+        if app_data.transient or not app_data.can_update:
+            return None
+        system_exe = session.interpreter.system_executable
+        creator_args = [(k, str(v)) for k, v in session.creator._args() if k != "dest"]  # noqa: SLF001
+        parts = {
+            "virtualenv": __version__,
+            "interpreter": [system_exe, fingerprint(system_exe)],
+            "creator": [type(session.creator).__name__, creator_args],
+            "activators": [(type(i).__name__, i.flag_prompt) for i in session.activators],
+        }
+        seeder = session.seeder
+        if seeder is not None and seeder.enabled:
+            from virtualenv.seed.embed.base_embed import BaseEmbed  # noqa: PLC0415
+
+            if not isinstance(seeder, BaseEmbed):
+                return None
+            wheels = _resolve_wheels(seeder, session.interpreter)
+            if wheels is None:
+                return None
+            parts["seeder"] = [repr(seeder), wheels]
+        key = sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+        return cls(app_data, key)
+
+    @property
+    def ready(self):
+        """``True`` once built - which might have found it not relocatable, see :attr:`relocatable`"""
+        return (self.folder / _MANIFEST).exists()
+
+    @property
+    def relocatable(self):
+        """``False`` if the environment can't be served via this template, so it must not be built again"""
+        manifest = self._read_manifest()
+        return manifest is not None and manifest.get("relocatable", True)
+
+    def fits(self, dest):
+        """
+        Check if the template can be materialized into a destination.
+
+        Console scripts get a plain ``#!`` line only if their interpreter path is short enough and has no spaces, else
+        a shell script that execs the interpreter - so a template built with plain ones can't serve such destinations.
+        """
+        from virtualenv.seed.embed.via_app_data.pip_install.base import _plain_shebang  # noqa: PLC0415
+
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+        placeholder = manifest["placeholder"]
+        return all(_plain_shebang(i.replace(placeholder, str(dest))) for i in manifest.get("shebangs", []))
+
+    def _read_manifest(self):
+        try:
+            return json.loads((self.folder / _MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def build(self, session):
+        """Create the template environment by running the creation of the session against the placeholder path."""
+        logging.info("create environment template %s", self.folder)
+        safe_delete(self.folder)
+        creator = copy(session.creator)
+        creator.dest = self.root
+        creator.pyenv_cfg = PyEnvCfg.from_folder(self.root)
+        creator.run()
+        if session.seeder is not None and session.seeder.enabled:
+            session.seeder.run(creator)
+        for activator in session.activators:
+            activator.generate(creator)
+        creator.pyenv_cfg.write()
+
+        rewrite, links, shebangs = [], {}, set()
+        placeholder = str(self.root).encode("utf-8")
+        for path in self._walk():
+            if path.is_symlink():
+                target = os.readlink(str(path))
+                if self.placeholder in target:
+                    links[self._rel(path)] = target
+                continue
+            if path.is_dir():
+                continue
+            content = path.read_bytes()
+            if self.placeholder.encode("utf-8") in content:
+                if b"\0" in content:
+                    logging.info("template %s not relocatable, %s embeds its path", self.folder, path)
+                    safe_delete(self.folder)
+                    # remember it, else every later creation would build (and throw away) the environment again
+                    self._write_manifest({"relocatable": False, "embeds_path": self._rel(path)})
+                    return False
+                rewrite.append(self._rel(path))
+                if content.startswith(b"#!" + placeholder):
+                    shebangs.add(content[2 : content.find(b"\n")].decode("utf-8"))
+        self._write_manifest({
+            "placeholder": str(self.root),
+            "name": self.placeholder,
+            "rewrite": rewrite,
+            "links": links,
+            "shebangs": sorted(shebangs),
+        })
+        return True
+
+    def _write_manifest(self, manifest):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        (self.folder / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+    def materialize(self, dest):
+        """Clone the template into the destination folder."""
+        manifest = json.loads((self.folder / _MANIFEST).read_text(encoding="utf-8"))
+        rewrite, links = set(manifest["rewrite"]), manifest["links"]
+        replacements = [
+            (manifest["placeholder"].encode("utf-8"), str(dest).encode("utf-8")),
+            (manifest["name"].encode("utf-8"), dest.name.encode("utf-8")),
+        ]
+        logging.info("materialize environment from template %s", self.folder)
+        touch(self.folder)
+        for path in self._walk():
+            rel = self._rel(path)
+            into = dest / rel
+            if path.is_dir() and not path.is_symlink():
+                into.mkdir(parents=True, exist_ok=True)
+            elif path.is_symlink():
+                target = os.readlink(str(path))
+                if rel in links:
+                    target = target.replace(manifest["placeholder"], str(dest)).replace(manifest["name"], dest.name)
+                os.symlink(target, str(into))
+            elif rel in rewrite:
+                content = path.read_bytes()
+                for old, new in replacements:
+                    content = content.replace(old, new)
+                into.write_bytes(content)
+                os.chmod(str(into), path.stat().st_mode)
+            else:
+                copy_file(str(path), str(into))
+
+    def _walk(self):
+        for root, dirs, files in os.walk(str(self.root)):
+            dirs[:] = [i for i in dirs if i not in _SKIP_DIRS]
+            base = Path(root)
+            for name in dirs:
+                yield base / name
+            for name in files:
+                yield base / name
+
+    def _rel(self, path):
+        return os.path.relpath(str(path), str(self.root))
+
+
+def _resolve_wheels(seeder, interpreter):
+    """:return: the wheels the seeder would install (without downloading), ``None`` if some are not available"""
+    from virtualenv.seed.wheels import get_wheel  # noqa: PLC0415
+
+    wheels = {}
+    for distribution, version in seeder.distribution_to_versions().items():
+        wheel = get_wheel(
+            distribution=distribution,
+            version=version,
+            for_py_version=interpreter.version_release_str,
+            search_dirs=seeder.extra_search_dir,
+            download=False,
+            app_data=seeder.app_data,
+            do_periodic_update=seeder.periodic_update,
+            env=seeder.env,
+        )
+        if wheel is None:
+            return None
+        wheels[distribution] = wheel.path.name
+    return wheels
+
+
+__all__ = [
+    "EnvTemplate",
+]
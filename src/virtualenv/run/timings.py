@@ -0,0 +1,81 @@
+"""Collect how long the phases of a virtual environment creation take."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from timeit import default_timer
+
+from virtualenv.version import __version__
+
+
+class Timings:
+    """
+    Wall clock time spent per phase of a session, in the order the phases first started.
+
+    Phase names are dotted, the first part being the top level phase (e.g. ``seed``) and the rest naming the work
+    within it (e.g. ``seed.install.pip``). Sub phases may run concurrently, so they don't necessarily sum up to their
+    top level phase.
+    """
+
+    def __init__(self, path=None) -> None:
+        """
+        Create.
+
+        :param path: if set :meth:`dump` writes the timings as JSON to this file
+        """
+        self.path = path
+        self.start = default_timer()
+        self._phases = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v * 1000:.0f}ms' for k, v in self.items())})"
+
+    @contextmanager
+    def phase(self, name):
+        """Measure the time spent within the context as the given phase."""
+        start = default_timer()
+        try:
+            yield
+        finally:
+            self.add(name, default_timer() - start)
+
+    def add(self, name, elapsed):
+        """Account some seconds to a phase (accumulating if the phase has been already recorded)."""
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0) + elapsed
+
+    def items(self):
+        with self._lock:
+            return list(self._phases.items())
+
+    def copy(self, path=None):
+        """:return: a new collector with the same start and the phases recorded so far"""
+        result = type(self)(path)
+        result.start = self.start
+        for name, elapsed in self.items():
+            result.add(name, elapsed)
+        return result
+
+    def to_dict(self):
+        return {
+            "virtualenv": __version__,
+            "total_ms": (default_timer() - self.start) * 1000,
+            "phases_ms": {name: elapsed * 1000 for name, elapsed in self.items()},
+        }
+
+    def dump(self, **extra):
+        """Write the timings (plus the extra keys passed in) to :attr:`path` as JSON, no-op if not set."""
+        if self.path is None:
+            return
+        content = self.to_dict()
+        content.update(extra)
+        Path(self.path).write_text(json.dumps(content, indent=2), encoding="utf-8")
+
+
+__all__ = [
+    "Timings",
+]
@@ -1,15 +1,18 @@
 from __future__ import annotations
+import json
 import logging
 import os
 import re
-import zipfile
+import sys
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
 from itertools import chain
 from pathlib import Path
-from tempfile import mkdtemp
-from distlib.scripts import ScriptMaker, enquote_executable
-from virtualenv.util.path import safe_delete
+from virtualenv.app_data.wheel_store import WheelReader, wheel_digest
+from virtualenv.util.path import safe_delete, temp_sibling
+
+#: the console scripts rendered when building the image, stored within it (but not installed from it)
+CONSOLE_SCRIPTS = "virtualenv-console-scripts.json"
 
 class PipInstall(ABC):
 
@@ -20,15 +23,249 @@ class PipInstall(ABC):
         self._extracted = False
         self.__dist_info = None
         self._console_entry_points = None
+        self._reader = None  # the open wheel, while building the image
+
+    @abstractmethod
+    def _sync(self, src, dst):
+        raise NotImplementedError
+
+    def install(self, version_info):
+        self.install_image()
+        self.install_console_scripts(version_info)
+
+    def install_image(self):
+        self._extracted = True
+        self._uninstall_previous_version()
+        # sync image
+        for filename in self._image_dir.iterdir():
+            if filename.name == CONSOLE_SCRIPTS:
+                continue
+            into = self._creator.purelib / filename.name
+            self._sync(filename, into)
+
+    def install_console_scripts(self, version_info):
+        # generate console executables
+        script_dir = self._creator.script_dir
+        consoles = self._install_rendered_console_scripts(script_dir)
+        if consoles is None:
+            consoles = set()
+            for name, module in self._console_scripts.items():
+                consoles.update(self._create_console_entry_point(name, module, script_dir, version_info))
+        logging.debug("generated console scripts %s", " ".join(i.name for i in consoles))
+
+    def build_image(self, content_store=None):
+        """
+        Build the install image of the wheel.
+
+        The image is built within a temporary sibling folder and published via an atomic rename, so an image is either
+        complete or missing: readers need no lock to see a consistent one, and concurrent builders don't corrupt it.
+        """
+        image_dir = self._image_dir
+        logging.debug("build install image for %s to %s", self._wheel.name, image_dir)
+        self._image_dir = staging = temp_sibling(image_dir)
+        try:
+            safe_delete(staging)  # left over by a crashed build of a recycled process and thread id
+            with WheelReader(self._wheel) as self._reader:
+                self._build_image(content_store)
+            self._publish_image(staging, image_dir)
+        finally:
+            self._image_dir, self.__dist_info, self._reader = image_dir, None, None
+            if staging.exists():
+                safe_delete(staging)
+
+    @staticmethod
+    def _publish_image(staging, image_dir):
+        if image_dir.exists() and not any(image_dir.iterdir()):  # an empty one would block the rename
+            safe_delete(image_dir)
+        try:
+            os.rename(str(staging), str(image_dir))
+        except OSError:
+            if not (image_dir.exists() and any(image_dir.iterdir())):
+                raise
+            logging.debug("install image %s got published meanwhile by another builder", image_dir)
+
+    def _build_image(self, content_store):
+        # 1. first extract the wheel (or link its content from the content addressed store)
+        if content_store is None:
+            self._reader.extract_all(self._image_dir)
+        else:
+            # the metadata is altered in place below, so must not be shared with the store
+            in_place = lambda name: name.split("/", 1)[0].endswith(".dist-info")  # noqa: E731
+            content_store.materialize(self._wheel, wheel_digest(self._wheel), self._image_dir, in_place)
+        self._extracted = True
+        # 2. now add additional files not present in the distribution
+        new_files = self._generate_new_files()
+        # 3. finally fix the records file
+        self._fix_records(new_files)
+
+    def _records_text(self, files):
+        return "\n".join(f"{os.path.relpath(str(rec), str(self._image_dir))},," for rec in files)
+
+    def _generate_new_files(self):
+        new_files = set()
+        installer = self._dist_info / "INSTALLER"
+        installer.write_text("pip\n", encoding="utf-8")
+        new_files.add(installer)
+        # inject a no-op root element, as workaround for bug in https://github.com/pypa/pip/issues/7226
+        marker = self._image_dir / f"{self._dist_info.stem}.virtualenv"
+        marker.write_text("", encoding="utf-8")
+        new_files.add(marker)
+        # render the console scripts without writing them, to record their names and store their body with the image
+        rel = os.path.relpath(str(self._creator.script_dir), str(self._creator.purelib))
+        to_folder = Path(os.path.normpath(str(self._image_dir / rel)))
+        version_info = self._creator.interpreter.version_info
+        rendered = []
+        for name, module in self._console_scripts.items():
+            new_files.update(
+                self._create_console_entry_point(name, module, to_folder, version_info, dry_run=True, into=rendered),
+            )
+        scripts = [{"names": names, "body": body.decode("utf-8")} for names, body in rendered]
+        (self._image_dir / CONSOLE_SCRIPTS).write_text(json.dumps(scripts, indent=2), encoding="utf-8")
+        return new_files
+
+    @property
+    def _dist_info(self):
+        if self._extracted is False:
+            return None  # pragma: no cover
+        if self.__dist_info is None:
+            files = []
+            for filename in self._image_dir.iterdir():
+                files.append(filename.name)
+                if filename.suffix == ".dist-info":
+                    self.__dist_info = filename
+                    break
+            else:
+                msg = f"no .dist-info at {self._image_dir}, has {', '.join(files)}"
+                raise RuntimeError(msg)  # pragma: no cover
+        return self.__dist_info
+
+    @abstractmethod
+    def _fix_records(self, extra_record_data):
+        raise NotImplementedError
+
+    @property
+    def _console_scripts(self):
+        if self._console_entry_points is None:
+            self._console_entry_points = {}
+            # read from the wheel itself, so it does not depend on the image being extracted
+            if self._reader is None:
+                with WheelReader(self._wheel) as reader:
+                    entry_points = reader.metadata("entry_points.txt")
+            else:
+                entry_points = self._reader.metadata("entry_points.txt")
+            if entry_points is not None:
+                parser = ConfigParser()
+                parser.read_string(entry_points)
+                if "console_scripts" in parser.sections():
+                    for name, value in parser.items("console_scripts"):
+                        match = re.match(r"(.*?)-?\d\.?\d*$", name)
+                        our_name = match.groups(1)[0] if match else name
+                        self._console_entry_points[our_name] = value
+        return self._console_entry_points
+
+    def _create_console_entry_point(  # noqa: PLR0913
+        self,
+        name,
+        value,
+        to_folder,
+        version_info,
+        dry_run=False,  # noqa: FBT002
+        into=None,
+    ):
+        from .script_maker import ScriptMakerCustom  # noqa: PLC0415 # distlib is only needed when not rendered yet
+
+        result = []
+        maker = ScriptMakerCustom(to_folder, version_info, self._creator.exe, name, dry_run)
+        specification = f"{name} = {value}"
+        new_files = maker.make(specification)
+        result.extend(Path(i) for i in new_files)
+        if into is not None:
+            into.extend(maker.rendered)
+        return result
+
+    def _install_rendered_console_scripts(self, script_dir):
+        """
+        Install the console scripts rendered when building the image, by prefixing them with the shebang.
+
+        The scripts only differ by the interpreter within their shebang, so this spares generating them. Where the
+        shebang is not a plain one (e.g. Windows launchers, or paths distlib must wrap via ``/bin/sh``) we don't.
+
+        :return: the scripts installed, or ``None`` if these need to be generated
+        """
+        shebang = _plain_shebang(str(self._creator.exe))
+        if shebang is None:
+            return None
+        try:
+            scripts = json.loads((self._image_dir / CONSOLE_SCRIPTS).read_text(encoding="utf-8"))
+        except (OSError, ValueError):  # e.g. an image built by an older virtualenv
+            return None
+        result = set()
+        for script in scripts:
+            content = shebang + script["body"].encode("utf-8")
+            for name in script["names"]:
+                dest = script_dir / name
+                if dest.exists() or dest.is_symlink():
+                    dest.unlink()  # might be a link to a file shared with others
+                dest.write_bytes(content)
+                dest.chmod((dest.stat().st_mode | 0o555) & 0o7777)
+                result.add(dest)
+        return result
+
+    def _uninstall_previous_version(self):
+        dist_name = self._dist_info.stem.split("-")[0]
+        in_folders = chain.from_iterable([i.iterdir() for i in (self._creator.purelib, self._creator.platlib)])
+        paths = (p for p in in_folders if p.stem.split("-")[0] == dist_name and p.suffix == ".dist-info" and p.is_dir())
+        existing_dist = next(paths, None)
+        if existing_dist is not None:
+            self._uninstall_dist(existing_dist)
+
+    @staticmethod
+    def _uninstall_dist(dist):
+        dist_base = dist.parent
+        logging.debug("uninstall existing distribution %s from %s", dist.stem, dist_base)
+
+        top_txt = dist / "top_level.txt"  # add top level packages at folder level
+        paths = (
+            {dist.parent / i.strip() for i in top_txt.read_text(encoding="utf-8").splitlines()}
+            if top_txt.exists()
+            else set()
+        )
+        paths.add(dist)  # add the dist-info folder itself
+
+        base_dirs, record = paths.copy(), dist / "RECORD"  # collect entries in record that we did not register yet
+        for name in (
+            (i.split(",")[0] for i in record.read_text(encoding="utf-8").splitlines()) if record.exists() else ()
+        ):
+            path = dist_base / name
+            if not any(p in base_dirs for p in path.parents):  # only add if not already added as a base dir
+                paths.add(path)
+
+        for path in sorted(paths):  # actually remove stuff in a stable order
+            if path.exists():
+                if path.is_dir() and not path.is_symlink():
+                    safe_delete(path)
+                else:
+                    path.unlink()
+
+    def clear(self):
+        if self._image_dir.exists():
+            safe_delete(self._image_dir)
+
+    def has_image(self):
+        return self._image_dir.exists() and any(self._image_dir.iterdir())
+
+
+def _plain_shebang(executable):
+    """:return: the shebang line distlib generates for the executable, if it's a plain one (else ``None``)"""
+    if os.name != "posix" or " " in executable:
+        return None
+    try:
+        shebang = b"#!" + os.fsencode(executable) + b"\n"
+        shebang.decode("utf-8")
+    except (UnicodeError, ValueError):
+        return None
+    # the kernel truncates longer ones, so for these distlib creates a shell script that execs the interpreter
+    return shebang if len(shebang) <= (512 if sys.platform == "darwin" else 127) else None
 
-class ScriptMakerCustom(ScriptMaker):
 
-    def __init__(self, target_dir, version_info, executable, name) -> None:
-        super().__init__(None, str(target_dir))
-        self.clobber = True
-        self.set_mode = True
-        self.executable = enquote_executable(str(executable))
-        self.version_info = (version_info.major, version_info.minor)
-        self.variants = {'', 'X', 'X.Y'}
-        self._name = name
 __all__ = ['PipInstall']
\ No newline at end of file
@@ -1,41 +1,40 @@
 from __future__ import annotations
+
 import os
 from pathlib import Path
+
 from virtualenv.util.path import copy
+
 from .base import PipInstall
 
-class CopyPipInstall(PipInstall):
-    def __init__(self, wheel):
-        super().__init__(wheel)
-        self.copy_source = None
 
+class CopyPipInstall(PipInstall):
     def _sync(self, src, dst):
-        self.copy_source = src
-        if src != dst:
-            self.sync(src, dst)
-
-    @staticmethod
-    def sync(src, dst):
-        src_path = Path(src)
-        dst_path = Path(dst)
-        if not dst_path.exists():
-            dst_path.mkdir(parents=True, exist_ok=True)
-        for src_file in src_path.rglob('*'):
-            if src_file.is_file():
-                rel_path = src_file.relative_to(src_path)
-                dst_file = dst_path / rel_path
-                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                copy(str(src_file), str(dst_file))
+        copy(src, dst)
 
     def _generate_new_files(self):
-        pass  # No new files need to be generated for copy installation
+        # create the pyc files
+        new_files = super()._generate_new_files()
+        new_files.update(self._cache_files())
+        return new_files
+
+    def _cache_files(self):
+        version = self._creator.interpreter.version_info
+        py_c_ext = f".{self._creator.interpreter.implementation.lower()}-{version.major}{version.minor}.pyc"
+        for root, dirs, files in os.walk(str(self._image_dir), topdown=True):
+            root_path = Path(root)
+            for name in files:
+                if name.endswith(".py"):
+                    yield root_path / f"{name[:-3]}{py_c_ext}"
+            for name in dirs:
+                yield root_path / name / "__pycache__"
+
+    def _fix_records(self, new_files):
+        extra_record_data_str = self._records_text(new_files)
+        with (self._dist_info / "RECORD").open("ab") as file_handler:
+            file_handler.write(extra_record_data_str.encode("utf-8"))
 
-    def install(self, creator):
-        base = creator.purelib
-        for filename in self.distribution.list_installed_files():
-            dest = os.path.join(base, filename)
-            source = os.path.join(self.copy_source, filename)
-            if os.path.exists(source):
-                copy(source, dest)
 
-__all__ = ['CopyPipInstall']
+__all__ = [
+    "CopyPipInstall",
+]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from stat import S_IREAD, S_IRGRP, S_IROTH
+
+from virtualenv.util.path import copy, set_tree
+
+from .copy import CopyPipInstall
+
+
+class HardlinkPipInstall(CopyPipInstall):
+    """
+    Hard link the files of the install image into the environment.
+
+    Costs next to no I/O, yet (unlike symlinks) the environment keeps working after the app data is cleaned. Falls back
+    to copying once hard linking fails, e.g. when the image and the environment are on different file systems.
+    """
+
+    def __init__(self, wheel, creator, image_folder) -> None:
+        super().__init__(wheel, creator, image_folder)
+        self._can_link = True
+
+    def _sync(self, src, dst):
+        if not src.is_dir():
+            self._link(src, dst)
+            return
+        for root, _, files in os.walk(str(src)):
+            into = dst / os.path.relpath(root, str(src))
+            into.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                self._link(Path(root) / name, into / name)
+
+    def _link(self, src, dst):
+        if self._can_link:
+            if dst.exists() or dst.is_symlink():
+                dst.unlink()
+            try:
+                os.link(str(src), str(dst))
+            except OSError as exception:
+                logging.debug("cannot hard link %s to %s (%r), copy instead", src, dst, exception)
+                self._can_link = False
+            else:
+                return
+        copy(src, dst)
+
+    def build_image(self, content_store=None):  # noqa: ARG002
+        # the image is made read only, which must not alter the blobs the content store shares with other images
+        super().build_image(None)
+
+    def _build_image(self, content_store):
+        super()._build_image(content_store)
+        # the files are shared with every environment, so protect the image by making it read only
+        set_tree(self._image_dir, S_IREAD | S_IRGRP | S_IROTH)
+
+
+__all__ = [
+    "HardlinkPipInstall",
+]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from distlib.scripts import ScriptMaker, enquote_executable
+
+
+class ScriptMakerCustom(ScriptMaker):
+    def __init__(self, target_dir, version_info, executable, name, dry_run=False) -> None:  # noqa: FBT002
+        super().__init__(None, str(target_dir), dry_run=dry_run)
+        self.clobber = True
+        self.set_mode = True
+        self.executable = enquote_executable(str(executable))
+        self.version_info = (version_info.major, version_info.minor)
+        self.variants = {"", "X", "X.Y"}
+        self._name = name
+        self.rendered = []  # the names and the body (without the shebang) of every script made
+
+    def _write_script(self, names, shebang, script_bytes, filenames, ext):
+        names.add(f"{self._name}{self.version_info[0]}.{self.version_info[1]}")
+        self.rendered.append((sorted(names), script_bytes))
+        super()._write_script(names, shebang, script_bytes, filenames, ext)
+
+
+__all__ = [
+    "ScriptMakerCustom",
+]
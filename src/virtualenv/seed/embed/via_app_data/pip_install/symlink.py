@@ -1,67 +1,67 @@
 from __future__ import annotations
+
 import os
 from stat import S_IREAD, S_IRGRP, S_IROTH
 from subprocess import PIPE, Popen
+
 from virtualenv.util.path import safe_delete, set_tree
+
 from .base import PipInstall
 
+
 class SymlinkPipInstall(PipInstall):
-    def __init__(self, wheel, creator, symlinks):
-        super().__init__(wheel, creator)
-        self.symlinks = symlinks
+    def __init__(self, wheel, creator, image_folder) -> None:
+        super().__init__(wheel, creator, image_folder)
+        self._published_dir = image_folder
 
-    @property
-    def symlink_meta(self):
-        return os.path.join(self.creator.purelib, self.wheel.name + ".virtualenv")
+    def _sync(self, src, dst):
+        os.symlink(str(src), str(dst))
 
-    def _install(self):
-        self._create_symlinks()
-        self._generate_meta()
+    def build_image(self, content_store=None):  # noqa: ARG002
+        self._published_dir = self._image_dir  # the image is built aside, remember where it will be published to
+        # the image is made read only, which must not alter the blobs the content store shares with other images
+        super().build_image(None)
 
-    def _create_symlinks(self):
-        for src, rel_dst in self.symlinks:
-            dst = os.path.join(self.creator.purelib, rel_dst)
-            if not os.path.exists(os.path.dirname(dst)):
-                os.makedirs(os.path.dirname(dst))
-            if os.path.exists(dst):
-                if os.path.islink(dst) and os.readlink(dst) == src:
-                    continue  # Skip if the symlink already exists and points to the correct source
-                safe_delete(dst)
-            os.symlink(src, dst)
+    def _build_image(self, content_store):
+        super()._build_image(content_store)
+        # protect the image by making it read only
+        set_tree(self._image_dir, S_IREAD | S_IRGRP | S_IROTH)
 
-    def _generate_meta(self):
-        with open(self.symlink_meta, "w") as file_handler:
-            file_handler.write("\n".join(f"{s}\t{d}" for s, d in self.symlinks))
-        self._make_file_readonly(self.symlink_meta)
+    def _generate_new_files(self):
+        # create the pyc files, as the build image will be R/O - recording the published location for tracebacks
+        cmd = [str(self._creator.exe), "-m", "compileall", "-d", str(self._published_dir), str(self._image_dir)]
+        process = Popen(cmd, stdout=PIPE, stderr=PIPE)  # noqa: S603
+        process.communicate()
+        # the root pyc is shared, so we'll not symlink that - but still add the pyc files to the RECORD for close
+        root_py_cache = self._image_dir / "__pycache__"
+        new_files = set()
+        if root_py_cache.exists():
+            new_files.update(root_py_cache.iterdir())
+            new_files.add(root_py_cache)
+            safe_delete(root_py_cache)
+        core_new_files = super()._generate_new_files()
+        # remove files that are within the image folder deeper than one level (as these will be not linked directly)
+        for file in core_new_files:
+            try:
+                rel = file.relative_to(self._image_dir)
+                if len(rel.parts) > 1:
+                    continue
+            except ValueError:
+                pass
+            new_files.add(file)
+        return new_files
 
-    def _make_file_readonly(self, file_path):
-        os.chmod(file_path, S_IREAD | S_IRGRP | S_IROTH)
+    def _fix_records(self, new_files):
+        new_files.update(i for i in self._image_dir.iterdir())
+        extra_record_data_str = self._records_text(sorted(new_files, key=str))
+        (self._dist_info / "RECORD").write_text(extra_record_data_str, encoding="utf-8")
 
     def clear(self):
-        if os.path.exists(self.symlink_meta):
-            with open(self.symlink_meta, "r") as file_handler:
-                for line in file_handler:
-                    _src, dst = line.strip().split("\t")
-                    dst = os.path.join(self.creator.purelib, dst)
-                    if os.path.exists(dst):
-                        safe_delete(dst)
-            safe_delete(self.symlink_meta)
+        if self._image_dir.exists():
+            safe_delete(self._image_dir)
+        super().clear()
 
-    @classmethod
-    def can_be_applied(cls, interpreter):
-        return interpreter.platform == "win32" or not cls._windows_no_symlink(interpreter)
 
-    @classmethod
-    def _windows_no_symlink(cls, interpreter):
-        if interpreter.platform != "win32":
-            return False
-        # Windows may support symlinks, let's verify
-        with Popen(
-            [interpreter.executable, "-c", "import os; os.symlink('a', 'b')"],
-            stderr=PIPE,
-            stdout=PIPE,
-            cwd=interpreter.system_stdlib,
-        ) as process:
-            _, stderr = process.communicate()
-        return b"AttributeError: module 'os' has no attribute 'symlink'" in stderr
-__all__ = ['SymlinkPipInstall']
+__all__ = [
+    "SymlinkPipInstall",
+]
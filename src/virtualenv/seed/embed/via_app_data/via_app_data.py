@@ -1,26 +1,194 @@
 """Bootstrap."""
+
 from __future__ import annotations
+
 import logging
-import sys
+import os
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from subprocess import CalledProcessError
-from threading import Lock, Thread
+from threading import Lock
+from timeit import default_timer
+
+from virtualenv.app_data.trim import touch
 from virtualenv.info import fs_supports_symlink
 from virtualenv.seed.embed.base_embed import BaseEmbed
 from virtualenv.seed.wheels import get_wheel
-from .pip_install.copy import CopyPipInstall
-from .pip_install.symlink import SymlinkPipInstall
 
-class FromAppData(BaseEmbed):
+STAGES = ("acquire", "image", "install", "scripts")
+
 
+class FromAppData(BaseEmbed):
     def __init__(self, options) -> None:
         super().__init__(options)
         self.symlinks = options.symlink_app_data
+        self.hardlinks = options.hardlink_app_data
+        self.jobs = options.seed_jobs
+        self.timings = defaultdict(dict)  # stage -> distribution -> seconds
+        self._timings_lock = Lock()
+
+    @classmethod
+    def add_parser_arguments(cls, parser, interpreter, app_data):
+        super().add_parser_arguments(parser, interpreter, app_data)
+        can_symlink = app_data.transient is False and fs_supports_symlink()
+        sym = "" if can_symlink else "not supported - "
+        link = parser.add_mutually_exclusive_group()
+        link.add_argument(
+            "--symlink-app-data",
+            dest="symlink_app_data",
+            action="store_true" if can_symlink else "store_false",
+            help=f"{sym} symlink the python packages from the app-data folder (requires seed pip>=19.3)",
+            default=False,
+        )
+        link.add_argument(
+            "--hardlink-app-data",
+            dest="hardlink_app_data",
+            action="store_true",
+            help="hard link the python packages from the app-data folder (copy if it's on another file system)",
+            default=False,
+        )
+        parser.add_argument(
+            "--seed-jobs",
+            dest="seed_jobs",
+            metavar="N",
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help="the number of workers acquiring, extracting and installing the seed packages concurrently",
+        )
+
+    def run(self, creator):
+        if not self.enabled:
+            return
+        with ThreadPoolExecutor(max_workers=max(self.jobs, 1), thread_name_prefix="virtualenv-seed") as executor:
+            # the acquisitions are queued first, so a worker waiting on one never blocks one that is not yet started
+            acquired = {
+                distribution: executor.submit(self._acquire, creator, distribution, version)
+                for distribution, version in self.distribution_to_versions().items()
+            }
+            seeded = {name: executor.submit(self._seed, creator, name, acquired) for name in acquired}
+        logging.debug("seed timings %s", _Timings(self.timings))
+
+        failed_acquire = [name for name, future in acquired.items() if future.exception() is not None]
+        if failed_acquire:
+            msg = f"seed failed due to failing to download wheels {', '.join(failed_acquire)}"
+            raise RuntimeError(msg)
+        exceptions = {name: future.exception() for name, future in seeded.items() if future.exception() is not None}
+        if exceptions:
+            messages = [f"failed to build image {', '.join(exceptions.keys())} because:"]
+            for exception in exceptions.values():
+                trace = traceback.format_exception(type(exception), exception, exception.__traceback__)
+                messages.append("".join(trace))
+            raise RuntimeError("\n".join(messages))
+
+    def _acquire(self, creator, distribution, version):
+        with self._stage("acquire", distribution):
+            for_py_version = creator.interpreter.version_release_str
+            failure, result = None, None
+            # fallback to download in case the exact version is not available
+            for download in [True, False] if self.download else [False]:
+                try:
+                    result = get_wheel(
+                        distribution=distribution,
+                        version=version,
+                        for_py_version=for_py_version,
+                        search_dirs=self.extra_search_dir,
+                        download=download,
+                        app_data=self.app_data,
+                        do_periodic_update=self.periodic_update,
+                        env=self.env,
+                    )
+                    if result is not None:
+                        break
+                except Exception as exception:
+                    logging.exception("fail")
+                    failure = exception
+            if failure:
+                if isinstance(failure, CalledProcessError):
+                    msg = f"failed to download {distribution}"
+                    if version is not None:
+                        msg += f" version {version}"
+                    msg += f", pip download exit code {failure.returncode}"
+                    output = failure.output + failure.stderr
+                    if output:
+                        msg += "\n"
+                        msg += output
+                else:
+                    msg = repr(failure)
+                logging.error(msg)
+                raise RuntimeError(msg) from failure
+            return result
+
+    def _seed(self, creator, name, acquired):
+        if acquired[name].exception() is not None:
+            return  # reported as an acquisition failure
+        wheel = acquired[name].result()
+        pip = acquired.get("pip")
+        pip_version = pip.result().version_tuple if pip is not None and pip.exception() is None else None
+        installer_class = self.installer_class(pip_version)
+        logging.debug("install %s from wheel %s via %s", name, wheel, installer_class.__name__)
+        key = Path(installer_class.__name__) / wheel.path.stem
+        wheel_img = self.app_data.wheel_image(creator.interpreter.version_release_str, key)
+        installer = installer_class(wheel.path, creator, wheel_img)
+        parent = self.app_data.lock / wheel_img.parent
+        # any number of sessions may use the image at once, while evicting it waits for all of them
+        with parent.shared_lock_for_key(wheel_img.name):
+            with self._stage("image", name):
+                if not installer.has_image():  # built aside and published atomically, so building needs no lock
+                    installer.build_image(self.app_data.wheel_store())
+            touch(wheel_img)  # mark as recently used
+            with self._stage("install", name):
+                installer.install_image()
+            with self._stage("scripts", name):
+                installer.install_console_scripts(creator.interpreter.version_info)
+
+    @contextmanager
+    def _stage(self, stage, distribution):
+        start = default_timer()
+        try:
+            yield
+        finally:
+            with self._timings_lock:
+                self.timings[stage][distribution] = default_timer() - start
+
+    def installer_class(self, pip_version_tuple):
+        # the installers pull in distlib, only import them once we actually seed
+        if self.hardlinks:
+            from .pip_install.hardlink import HardlinkPipInstall  # noqa: PLC0415
+
+            return HardlinkPipInstall
+        if self.symlinks and pip_version_tuple:  # symlink support requires pip 19.3+
+            if pip_version_tuple >= (19, 3):
+                from .pip_install.symlink import SymlinkPipInstall  # noqa: PLC0415
+
+                return SymlinkPipInstall
+        from .pip_install.copy import CopyPipInstall  # noqa: PLC0415
+
+        return CopyPipInstall
 
     def __repr__(self) -> str:
-        msg = f', via={('symlink' if self.symlinks else 'copy')}, app_data_dir={self.app_data}'
+        via = "hardlink" if self.hardlinks else "symlink" if self.symlinks else "copy"
+        msg = f", via={via}, app_data_dir={self.app_data}"
         base = super().__repr__()
-        return f'{base[:-1]}{msg}{base[-1]}'
-__all__ = ['FromAppData']
\ No newline at end of file
+        return f"{base[:-1]}{msg}{base[-1]}"
+
+
+class _Timings:
+    """lazily format the stage timings."""
+
+    def __init__(self, timings) -> None:
+        self.timings = timings
+
+    def __repr__(self) -> str:
+        return ", ".join(
+            f"{stage}=({', '.join(f'{k}:{v * 1000:.0f}ms' for k, v in sorted(self.timings[stage].items()))})"
+            for stage in STAGES
+            if stage in self.timings
+        )
+
+
+__all__ = [
+    "FromAppData",
+]
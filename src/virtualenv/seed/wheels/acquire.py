@@ -20,7 +20,7 @@ def get_wheel(distribution, version, for_py_version, search_dirs, download, app_
 
     # If not found in bundle, search in the provided directories
     for directory in search_dirs:
-        wheel = from_dir(distribution, version, for_py_version, [directory])
+        wheel = from_dir(distribution, version, for_py_version, [directory], app_data)
         if wheel:
             return wheel
 
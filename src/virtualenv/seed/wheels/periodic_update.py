@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import logging
 import os
-import ssl
 import sys
 from datetime import datetime, timedelta, timezone
 from itertools import groupby
@@ -12,8 +11,6 @@ from shutil import copy2
 from subprocess import DEVNULL, Popen
 from textwrap import dedent
 from threading import Thread
-from urllib.error import URLError
-from urllib.request import urlopen
 from virtualenv.app_data import AppDataDiskFolder
 from virtualenv.seed.wheels.embed import BUNDLE_SUPPORT
 from virtualenv.seed.wheels.util import Wheel
@@ -48,5 +45,37 @@ class UpdateLog:
         self.completed = completed
         self.versions = versions
         self.periodic = periodic
+
+def urlopen(*args, **kwargs):
+    # the network stack (ssl especially) is slow to import, only pay for it when we actually talk to PyPI
+    from urllib.request import urlopen as _urlopen  # noqa: PLC0415
+
+    return _urlopen(*args, **kwargs)
+
+
+def _pypi_get_distribution_info(distribution):
+    from urllib.error import URLError  # noqa: PLC0415
+
+    content, url = None, f"https://pypi.org/pypi/{distribution}/json"
+    try:
+        for context in _request_context():
+            try:
+                with urlopen(url, context=context) as file_handler:  # noqa: S310
+                    content = json.load(file_handler)
+                break
+            except URLError as exception:
+                logging.error("failed to access %s because %r", url, exception)  # noqa: TRY400
+    except Exception as exception:  # noqa: BLE001
+        logging.error("failed to access %s because %r", url, exception)  # noqa: TRY400
+    return content
+
+
+def _request_context():
+    import ssl  # noqa: PLC0415
+
+    yield None
+    # fallback to non verified HTTPS (the information we request is not sensitive, so fallback)
+    yield ssl._create_unverified_context()  # noqa: S323, SLF001
+
 _PYPI_CACHE = {}
 __all__ = ['NewVersion', 'UpdateLog', 'add_wheel_to_update_log', 'do_update', 'dump_datetime', 'load_datetime', 'manual_upgrade', 'periodic_update', 'release_date_for_wheel_path', 'trigger_update']
\ No newline at end of file
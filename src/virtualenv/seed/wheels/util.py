@@ -1,21 +1,185 @@
 from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import defaultdict
 from operator import attrgetter
+from pathlib import Path
+from threading import Lock
 from zipfile import ZipFile
 
-class Wheel:
+#: a folder modified this recently might still be modified within the same timestamp tick, so its index is not kept
+_RACY_NS = 2 * 10**9
 
+
+class Wheel:
     def __init__(self, path) -> None:
+        # https://www.python.org/dev/peps/pep-0427/#file-name-convention
+        # The wheel filename is {distribution}-{version}(-{build tag})?-{python tag}-{abi tag}-{platform tag}.whl
         self.path = path
-        self._parts = path.stem.split('-')
+        self._parts = path.stem.split("-")
+
+    @classmethod
+    def from_path(cls, path):
+        if path is not None and path.suffix == ".whl" and len(path.stem.split("-")) >= 5:  # noqa: PLR2004
+            return cls(path)
+        return None
+
+    @property
+    def distribution(self):
+        return self._parts[0]
+
+    @property
+    def version(self):
+        return self._parts[1]
+
+    @property
+    def version_tuple(self):
+        return self.as_version_tuple(self.version)
+
+    @staticmethod
+    def as_version_tuple(version):
+        result = []
+        for part in version.split(".")[0:3]:
+            try:
+                result.append(int(part))
+            except ValueError:  # noqa: PERF203
+                break
+        if not result:
+            raise ValueError(version)
+        return tuple(result)
+
+    @property
+    def name(self):
+        return self.path.name
+
+    def support_py(self, py_version):
+        name = f"{'-'.join(self.path.stem.split('-')[0:2])}.dist-info/METADATA"
+        with ZipFile(str(self.path), "r") as zip_file:
+            metadata = zip_file.read(name).decode("utf-8")
+        marker = "Requires-Python:"
+        requires = next((i[len(marker) :] for i in metadata.splitlines() if i.startswith(marker)), None)
+        if requires is None:  # if it does not specify a python requires the assumption is compatible
+            return True
+        py_version_int = tuple(int(i) for i in py_version.split("."))
+        for require in (i.strip() for i in requires.split(",")):
+            # https://www.python.org/dev/peps/pep-0345/#version-specifiers
+            for operator, check in [
+                ("!=", lambda v: py_version_int != v),
+                ("==", lambda v: py_version_int == v),
+                ("<=", lambda v: py_version_int <= v),
+                (">=", lambda v: py_version_int >= v),
+                ("<", lambda v: py_version_int < v),
+                (">", lambda v: py_version_int > v),
+            ]:
+                if require.startswith(operator):
+                    ver_str = require[len(operator) :].strip()
+                    version = tuple((int(i) if i != "*" else None) for i in ver_str.split("."))[0:2]
+                    if not check(version):
+                        return False
+                    break
+        return True
 
     def __repr__(self) -> str:
-        return f'{self.__class__.__name__}({self.path})'
+        return f"{self.__class__.__name__}({self.path})"
 
     def __str__(self) -> str:
         return str(self.path)
 
+
+_INDEXES = {}  # folder -> (modification time, index) loaded within this process
+_INDEXES_LOCK = Lock()
+
+
+def wheel_index(folder, app_data=None):
+    """
+    Index the wheels within a folder, so that finding one does not need to list the folder and parse every name.
+
+    The index is persisted within the application data, and is valid for as long as the modification time of the
+    folder does not change (which adding, removing or renaming a wheel within it does).
+
+    :param folder: the folder holding the wheels
+    :param app_data: the application data to persist the index within, ``None`` to only keep it in memory
+    :return: the file names of the wheels by distribution and version
+    """
+    try:
+        mtime = Path(folder).stat().st_mtime_ns
+    except OSError:
+        return {}
+    key = str(folder)
+    with _INDEXES_LOCK:
+        cached = _INDEXES.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    store = None if app_data is None else app_data.wheel_index(folder)
+    content = store.read() if store is not None and store.exists() else None
+    if content is not None and content.get("mtime") == mtime:
+        index = content["wheels"]
+    else:
+        index = _scan(folder)
+        if time.time_ns() - mtime < _RACY_NS:
+            return index
+        if store is not None and app_data.can_update:
+            store.write({"mtime": mtime, "wheels": index})
+    with _INDEXES_LOCK:
+        _INDEXES[key] = mtime, index
+    return index
+
+
+def _scan(folder):
+    logging.debug("index wheels within %s", folder)
+    index = defaultdict(lambda: defaultdict(list))
+    with os.scandir(str(folder)) as entries:
+        for entry in entries:
+            wheel = Wheel.from_path(Path(entry.name))
+            if wheel is None:
+                continue
+            try:
+                wheel.version_tuple  # noqa: B018
+            except ValueError:
+                continue  # not a version we can order by
+            index[wheel.distribution][wheel.version].append(entry.name)
+    return {distribution: dict(versions) for distribution, versions in index.items()}
+
+
+def iter_wheels(from_folder, distribution, version, for_py_version, app_data=None):
+    """:return: the wheels of the distribution within the folder supporting the python version, newest first"""
+    versions = wheel_index(from_folder, app_data).get(distribution, {})
+    names = versions.get(version, []) if version is not None else [j for i in versions.values() for j in i]
+    wheels = sorted((Wheel(Path(from_folder) / i) for i in names), key=attrgetter("version_tuple"), reverse=True)
+    return (wheel for wheel in wheels if wheel.support_py(for_py_version))  # reading the metadata is the costly bit
+
+
+def discover_wheels(from_folder, distribution, version, for_py_version, app_data=None):
+    return list(iter_wheels(from_folder, distribution, version, for_py_version, app_data))
+
+
 class Version:
-    bundle = 'bundle'
-    embed = 'embed'
+    #: the version bundled with virtualenv
+    bundle = "bundle"
+    embed = "embed"
+    #: custom version handlers
     non_version = (bundle, embed)
-__all__ = ['Version', 'Wheel', 'discover_wheels']
\ No newline at end of file
+
+    @staticmethod
+    def of_version(value):
+        return None if value in Version.non_version else value
+
+    @staticmethod
+    def as_pip_req(distribution, version):
+        return f"{distribution}{Version.as_version_spec(version)}"
+
+    @staticmethod
+    def as_version_spec(version):
+        of_version = Version.of_version(version)
+        return "" if of_version is None else f"=={of_version}"
+
+
+__all__ = [
+    "Version",
+    "Wheel",
+    "discover_wheels",
+    "iter_wheels",
+    "wheel_index",
+]
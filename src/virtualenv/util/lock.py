@@ -1,34 +1,83 @@
 """holds locking functionality that works across processes."""
+
 from __future__ import annotations
+
 import logging
 import os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager, suppress
 from pathlib import Path
 from threading import Lock, RLock
+from timeit import default_timer
+
 from filelock import FileLock, Timeout
 
-class _CountedFileLock(FileLock):
+try:
+    import fcntl
+except ImportError:  # pragma: no cover # Windows
+    fcntl = None
+
 
+class _CountedFileLock(FileLock):
     def __init__(self, lock_file) -> None:
         parent = os.path.dirname(lock_file)
         if not os.path.isdir(parent):
             with suppress(OSError):
                 os.makedirs(parent)
+
         super().__init__(lock_file)
         self.count = 0
         self.thread_safe = RLock()
+
+    def acquire(self, timeout=None, poll_interval=0.05):
+        if not self.thread_safe.acquire(timeout=-1 if timeout is None else timeout):
+            raise Timeout(self.lock_file)
+        if self.count == 0:
+            try:
+                super().acquire(timeout, poll_interval)
+            except BaseException:
+                self.thread_safe.release()
+                raise
+        self.count += 1
+
+    def release(self, force=False):  # noqa: FBT002
+        with self.thread_safe:
+            if self.count > 0:
+                self.thread_safe.release()
+            if self.count == 1:
+                super().release(force=force)
+            self.count = max(self.count - 1, 0)
+
+
 _lock_store = {}
 _store_lock = Lock()
 
-class PathLockBase(ABC):
 
+class _LockWaits:
+    """Account the time spent waiting on locks held by others (other sessions, or other threads of ours)."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.count = 0
+        self.seconds = 0.0
+
+    def add(self, lock_file, seconds):
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+        logging.debug("waited %.0fms for lock %s", seconds * 1000, lock_file)
+
+
+LOCK_WAITS = _LockWaits()
+
+
+class PathLockBase(ABC):
     def __init__(self, folder) -> None:
         path = Path(folder)
         self.path = path.resolve() if path.exists() else path
 
     def __repr__(self) -> str:
-        return f'{self.__class__.__name__}({self.path})'
+        return f"{self.__class__.__name__}({self.path})"
 
     def __truediv__(self, other):
         return type(self)(self.path / other)
@@ -41,12 +90,46 @@ class PathLockBase(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         raise NotImplementedError
 
-class ReentrantFileLock(PathLockBase):
+    @abstractmethod
+    @contextmanager
+    def lock_for_key(self, name, no_block=False):  # noqa: FBT002
+        raise NotImplementedError
+
+    @abstractmethod
+    @contextmanager
+    def shared_lock_for_key(self, name, no_block=False):  # noqa: FBT002
+        raise NotImplementedError
 
+    @abstractmethod
+    @contextmanager
+    def non_reentrant_lock_for_key(self, name):
+        raise NotImplementedError
+
+
+class ReentrantFileLock(PathLockBase):
     def __init__(self, folder) -> None:
         super().__init__(folder)
         self._lock = None
 
+    def _create_lock(self, name=""):
+        lock_file = str(self.path / f"{name}.lock")
+        with _store_lock:
+            if lock_file not in _lock_store:
+                _lock_store[lock_file] = _CountedFileLock(lock_file)
+            return _lock_store[lock_file]
+
+    @staticmethod
+    def _del_lock(lock):
+        if lock is not None:
+            with _store_lock:
+                # if another thread holds it, the lock is in use, and waiting for it while holding the store would stall
+                if lock.thread_safe.acquire(blocking=False):
+                    try:
+                        if lock.count == 0:
+                            _lock_store.pop(lock.lock_file, None)
+                    finally:
+                        lock.thread_safe.release()
+
     def __del__(self) -> None:
         self._del_lock(self._lock)
 
@@ -59,11 +142,107 @@ class ReentrantFileLock(PathLockBase):
         self._del_lock(self._lock)
         self._lock = None
 
-class NoOpFileLock(PathLockBase):
+    def _lock_file(self, lock, no_block=False):  # noqa: FBT002
+        # multiple processes might be trying to get a first lock... so we cannot check if this directory exist without
+        # a lock, but that lock might then become expensive, and it's not clear where that lock should live.
+        # Instead here we just ignore if we fail to create the directory.
+        with suppress(OSError):
+            os.makedirs(str(self.path))
+
+        try:
+            lock.acquire(0.0001)
+        except Timeout:
+            if no_block:
+                raise
+            logging.debug("lock file %s present, will block until released", lock.lock_file)
+            start = default_timer()
+            lock.acquire()
+            LOCK_WAITS.add(lock.lock_file, default_timer() - start)
+
+    @staticmethod
+    def _release(lock):
+        lock.release()
+
+    @contextmanager
+    def lock_for_key(self, name, no_block=False):  # noqa: FBT002
+        lock = self._create_lock(name)
+        try:
+            self._lock_file(lock, no_block)
+            try:
+                yield
+            finally:
+                self._release(lock)
+        finally:
+            self._del_lock(lock)
+            lock = None
+
+    @contextmanager
+    def shared_lock_for_key(self, name, no_block=False):  # noqa: FBT002
+        """
+        Lock a key for reading.
+
+        Any number of shared holders may proceed at once, while :meth:`lock_for_key` (used to create or alter the
+        content) waits for all of them, and they wait for it. Must not be nested within a :meth:`lock_for_key` of the
+        same key.
+        """
+        if fcntl is None:  # no shared locks via the standard library on Windows, fallback to the exclusive lock
+            with self.lock_for_key(name, no_block):
+                yield
+            return
+        with suppress(OSError):
+            os.makedirs(str(self.path))
+        lock_file = str(self.path / f"{name}.lock")
+        try:
+            fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:  # a location we can't write to (e.g. a shared read-only app data), nor can our peers
+            yield
+            return
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if no_block:
+                    raise Timeout(lock_file) from None
+                logging.debug("lock file %s locked exclusively, will block until released", lock_file)
+                start = default_timer()
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                LOCK_WAITS.add(lock_file, default_timer() - start)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def non_reentrant_lock_for_key(self, name):
+        with _CountedFileLock(str(self.path / f"{name}.lock")):
+            yield
+
 
+class NoOpFileLock(PathLockBase):
     def __enter__(self):
         raise NotImplementedError
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         raise NotImplementedError
-__all__ = ['NoOpFileLock', 'ReentrantFileLock', 'Timeout']
\ No newline at end of file
+
+    @contextmanager
+    def lock_for_key(self, name, no_block=False):  # noqa: ARG002, FBT002
+        yield
+
+    @contextmanager
+    def shared_lock_for_key(self, name, no_block=False):  # noqa: ARG002, FBT002
+        yield
+
+    @contextmanager
+    def non_reentrant_lock_for_key(self, name):  # noqa: ARG002
+        yield
+
+
+__all__ = [
+    "LOCK_WAITS",
+    "NoOpFileLock",
+    "ReentrantFileLock",
+    "Timeout",
+]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from ._permission import make_exe, set_tree
-from ._sync import copy, copytree, ensure_dir, safe_delete, symlink
+from ._clone import clone_method
+from ._sync import copy, copy_file, copytree, ensure_dir, safe_delete, symlink, temp_sibling, write_atomic
 from ._win import get_short_path_name
 
 __all__ = [
+    "clone_method",
     "copy",
+    "copy_file",
     "copytree",
     "ensure_dir",
     "get_short_path_name",
@@ -13,4 +16,6 @@ __all__ = [
     "safe_delete",
     "set_tree",
     "symlink",
+    "temp_sibling",
+    "write_atomic",
 ]
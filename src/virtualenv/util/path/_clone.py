@@ -0,0 +1,118 @@
+"""
+Copy file content with the cheapest mechanism the file systems involved support.
+
+In order of preference: a reflink (copy-on-write clone, metadata only on btrfs/xfs), an in-kernel ``copy_file_range``,
+``sendfile`` and finally a buffered user space copy. The first mechanism that works between two devices is remembered,
+so a file system not supporting some mechanism pays for finding out only once per process.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import sys
+from threading import Lock
+
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+_BUFFER_SIZE = 1024 * 1024
+_NOT_SUPPORTED = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EBADF, errno.EPERM, errno.ETXTBSY, errno.ENOTTY}
+_NOT_SUPPORTED.update({getattr(errno, "EOPNOTSUPP", errno.EINVAL), getattr(errno, "ENOTSUP", errno.EINVAL)})
+
+_METHOD_FOR_DEVICES = {}
+_METHOD_LOCK = Lock()
+
+
+class _ShortCopyError(OSError):
+    """The mechanism stopped before copying the whole file (e.g. the file shrunk, or the file system returns 0)."""
+
+    def __init__(self, method, copied, size) -> None:
+        super().__init__(errno.EIO, f"{method} copied only {copied} of {size} bytes")
+
+
+def _reflink(src_fd, dst_fd, size):  # noqa: ARG001
+    import fcntl  # noqa: PLC0415
+
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        sent = os.copy_file_range(src_fd, dst_fd, size - offset)
+        if sent == 0:
+            raise _ShortCopyError("copy_file_range", offset, size)
+        offset += sent
+
+
+def _sendfile(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            raise _ShortCopyError("sendfile", offset, size)
+        offset += sent
+
+
+def _buffered(src_fd, dst_fd, size):  # noqa: ARG001
+    with os.fdopen(src_fd, "rb", closefd=False) as src, os.fdopen(dst_fd, "wb", closefd=False) as dst:
+        shutil.copyfileobj(src, dst, _BUFFER_SIZE)
+
+
+def _methods():
+    methods = []
+    if sys.platform.startswith("linux"):
+        methods.append(_reflink)
+        if hasattr(os, "copy_file_range"):
+            methods.append(_copy_file_range)
+        if hasattr(os, "sendfile"):
+            methods.append(_sendfile)
+    methods.append(_buffered)
+    return methods
+
+
+METHODS = _methods()
+
+
+def clone_method(src_dev, dst_dev):
+    """:return: the name of the copy mechanism found to work between the two devices (``None`` if not yet probed)"""
+    at = _METHOD_FOR_DEVICES.get((src_dev, dst_dev))
+    return None if at is None else METHODS[at].__name__.lstrip("_")
+
+
+def clone_file(src, dst):
+    """
+    Copy the content of a file (not its metadata), see the module documentation for how.
+
+    :param src: the file to copy
+    :param dst: the destination file, overwritten if exists
+    """
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        src_fd, dst_fd = src_file.fileno(), dst_file.fileno()
+        src_stat = os.fstat(src_fd)
+        key = src_stat.st_dev, os.fstat(dst_fd).st_dev
+        for at in range(_METHOD_FOR_DEVICES.get(key, 0), len(METHODS)):
+            method = METHODS[at]
+            try:
+                method(src_fd, dst_fd, src_stat.st_size)
+            except OSError as exception:
+                supported = exception.errno not in _NOT_SUPPORTED and not isinstance(exception, _ShortCopyError)
+                if supported or method is _buffered:
+                    raise
+                logging.debug("%s not supported from %s to %s due to %r", method.__name__, src, dst, exception)
+                # a partial attempt might have moved the offsets (copy_file_range advances both files)
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                continue
+            break
+        if _METHOD_FOR_DEVICES.get(key) != at:
+            with _METHOD_LOCK:
+                _METHOD_FOR_DEVICES[key] = at
+
+
+__all__ = [
+    "clone_file",
+    "clone_method",
+]
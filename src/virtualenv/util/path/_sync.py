@@ -1,16 +1,126 @@
 from __future__ import annotations
+
 import logging
 import os
 import shutil
 import sys
+from contextlib import suppress
+from pathlib import Path
 from stat import S_IWUSR
+from threading import get_ident
+
+from ._clone import clone_file
+
+
+def ensure_dir(path):
+    if not path.exists():
+        logging.debug("create folder %s", str(path))
+        os.makedirs(str(path))
+
+
+def ensure_safe_to_do(src, dest):
+    if src == dest:
+        msg = f"source and destination is the same {src}"
+        raise ValueError(msg)
+    if not dest.exists():
+        return
+    if dest.is_dir() and not dest.is_symlink():
+        logging.debug("remove directory %s", dest)
+        safe_delete(dest)
+    else:
+        logging.debug("remove file %s", dest)
+        dest.unlink()
+
+
+def symlink(src, dest):
+    ensure_safe_to_do(src, dest)
+    logging.debug("symlink %s", _Debug(src, dest))
+    dest.symlink_to(src, target_is_directory=src.is_dir())
+
+
+def copy(src, dest):
+    ensure_safe_to_do(src, dest)
+    is_dir = src.is_dir()
+    method = copytree if is_dir else copy_file
+    logging.debug("copy %s", _Debug(src, dest))
+    method(str(src), str(dest))
+
+
+def copytree(src, dest):
+    for root, _, files in os.walk(src):
+        dest_dir = os.path.join(dest, os.path.relpath(root, src))
+        if not os.path.isdir(dest_dir):
+            os.makedirs(dest_dir)
+        for name in files:
+            src_f = os.path.join(root, name)
+            dest_f = os.path.join(dest_dir, name)
+            copy_file(src_f, dest_f)
 
-class _Debug:
 
+def copy_file(src, dest):
+    """Same as :func:`shutil.copy`, but clone the content when the file system allows it."""
+    if os.path.islink(src):  # shutil.copy follows links, keep doing so
+        src = os.path.realpath(src)
+    clone_file(src, dest)
+    shutil.copymode(src, dest)
+
+
+def temp_sibling(path):
+    """:return: a path next to the given one, unique to this process and thread, to stage its content at"""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{os.getpid()}-{get_ident()}.tmp")
+
+
+def write_atomic(path, content):
+    """
+    Write a file via a temporary sibling and an atomic rename, so readers see either the old or the new content.
+
+    :param path: the file to write
+    :param content: the bytes to write
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = temp_sibling(path)
+    try:
+        temp.write_bytes(content)
+        try:
+            os.replace(str(temp), str(path))
+        except OSError:
+            if not path.exists():  # e.g. on Windows one can't replace a file in use, but then someone else published
+                raise
+    finally:
+        with suppress(OSError):
+            temp.unlink()
+
+
+def safe_delete(dest):
+    def onerror(func, path, exc_info):  # noqa: ARG001
+        if not os.access(path, os.W_OK):
+            os.chmod(path, S_IWUSR)
+            func(path)
+        else:
+            raise  # noqa: PLE0704
+
+    kwargs = {"onexc" if sys.version_info >= (3, 12) else "onerror": onerror}
+    shutil.rmtree(str(dest), ignore_errors=True, **kwargs)
+
+
+class _Debug:
     def __init__(self, src, dest) -> None:
         self.src = src
         self.dest = dest
 
     def __str__(self) -> str:
-        return f'{('directory ' if self.src.is_dir() else '')}{self.src!s} to {self.dest!s}'
-__all__ = ['copy', 'copytree', 'ensure_dir', 'safe_delete', 'symlink', 'symlink']
\ No newline at end of file
+        return f"{'directory ' if self.src.is_dir() else ''}{self.src!s} to {self.dest!s}"
+
+
+__all__ = [
+    "copy",
+    "copy_file",
+    "copytree",
+    "ensure_dir",
+    "safe_delete",
+    "symlink",
+    "temp_sibling",
+    "write_atomic",
+]
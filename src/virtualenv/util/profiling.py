@@ -0,0 +1,77 @@
+"""Profile a virtualenv invocation via cProfile."""
+
+from __future__ import annotations
+
+import logging
+import os
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from io import StringIO
+from itertools import count
+from pathlib import Path
+from threading import Lock
+
+TOP = 40
+_PROBES = None  # folder to profile the interpreter interrogations into, while profiling
+_PROBES_COUNTER = count()
+_PROBES_LOCK = Lock()
+
+
+def profile_target(args, env):
+    """:return: where to write the profile to as requested via the command line (or environment), ``None`` if not"""
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument("--profile", default=env.get("VIRTUALENV_PROFILE") or None)
+    options, _ = parser.parse_known_args(list(args or []))
+    return options.profile
+
+
+@contextmanager
+def profile(out, top=TOP):
+    """
+    Profile the code running within the context (on the current thread).
+
+    Writes the stats in pstats format to ``out``, a summary of the ``top`` functions by cumulative time next to it
+    (with ``.txt`` appended), and the stats of the interpreter interrogations run meanwhile into the ``.probes`` folder.
+
+    :param out: the file to write the stats to, ``None`` to not profile
+    :param top: the number of functions to list in the summary
+    """
+    if out is None:
+        yield
+        return
+    import cProfile  # noqa: PLC0415
+    import pstats  # noqa: PLC0415
+
+    global _PROBES  # noqa: PLW0603
+    out = Path(out).absolute()
+    _PROBES = Path(f"{out}.probes")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _PROBES = None
+        profiler.dump_stats(str(out))
+        summary = StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+        Path(f"{out}.txt").write_text(summary.getvalue(), encoding="utf-8")
+        logging.warning("profile written to %s (summary at %s.txt)", out, out)
+
+
+def probe_cmd(cmd):
+    """:return: the interpreter interrogation command, altered to profile the interrogation when profiling"""
+    folder = _PROBES
+    if folder is None:
+        return cmd
+    with _PROBES_LOCK:
+        at = next(_PROBES_COUNTER)
+    os.makedirs(str(folder), exist_ok=True)
+    return [cmd[0], "-m", "cProfile", "-o", str(folder / f"{at}-{Path(cmd[0]).name}.pstats"), *cmd[1:]]
+
+
+__all__ = [
+    "probe_cmd",
+    "profile",
+    "profile_target",
+]
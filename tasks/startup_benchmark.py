@@ -0,0 +1,100 @@
+"""
+Measure the start-up cost of virtualenv and fail when it exceeds the budget.
+
+Two numbers are reported, each the median of multiple runs in a fresh interpreter:
+
+- ``import`` - the cumulative import time of ``virtualenv.run`` as reported by ``python -X importtime``,
+- ``create`` - the wall clock time of ``virtualenv --no-seed`` creating an environment end-to-end.
+
+Alongside, the slowest modules imported are listed, so that regressions can be traced back to their source.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+IMPORT_TIME = re.compile(r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<name>\S+)$")
+ROOT = "virtualenv.run"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--python", default=sys.executable, help="interpreter that has virtualenv installed")
+    parser.add_argument("--runs", type=int, default=5, help="number of measurements to take the median of")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument("--import-budget", type=float, default=None, help="fail if importing takes more ms")
+    parser.add_argument("--create-budget", type=float, default=None, help="fail if creating takes more ms")
+    parser.add_argument("--json", dest="json_file", type=Path, default=None, help="also write the results here")
+    args = parser.parse_args()
+
+    result = {
+        "import": measure_import(args.python, args.runs),
+        "create": measure_create(args.python, args.runs),
+    }
+    report(result, args.top)
+    if args.json_file is not None:
+        args.json_file.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    failed = False
+    for key, budget in (("import", args.import_budget), ("create", args.create_budget)):
+        if budget is not None and result[key]["ms"] > budget:
+            print(f"{key} took {result[key]['ms']:.1f}ms, over the budget of {budget:.1f}ms")  # noqa: T201
+            failed = True
+    raise SystemExit(1 if failed else 0)
+
+
+def measure_import(python, runs):
+    totals, modules = [], defaultdict(list)
+    for _ in range(runs):
+        cmd = [python, "-X", "importtime", "-c", f"import {ROOT}"]
+        process = subprocess.run(cmd, capture_output=True, text=True, check=True, env=_env())  # noqa: S603
+        for line in process.stderr.splitlines():
+            match = IMPORT_TIME.match(line)
+            if match is None:
+                continue
+            name, self_us = match.group("name"), int(match.group("self"))
+            modules[name].append(self_us)
+            if name == ROOT:
+                totals.append(int(match.group("cumulative")))
+    by_module = {name: median(values) / 1000 for name, values in modules.items()}
+    return {"ms": median(totals) / 1000, "modules": dict(sorted(by_module.items(), key=lambda i: -i[1]))}
+
+
+def measure_create(python, runs):
+    durations = []
+    with TemporaryDirectory() as folder:
+        for at in range(runs):
+            dest = Path(folder) / str(at)
+            cmd = [python, "-m", "virtualenv", "--no-seed", "-q", str(dest)]
+            start = default_timer()
+            subprocess.run(cmd, check=True, env=_env())  # noqa: S603
+            durations.append(default_timer() - start)
+    return {"ms": median(durations) * 1000}
+
+
+def report(result, top):
+    print(f"import {ROOT}: {result['import']['ms']:.1f}ms")  # noqa: T201
+    for name, took in list(result["import"]["modules"].items())[:top]:
+        print(f"  {took:8.2f}ms {name}")  # noqa: T201
+    print(f"create --no-seed: {result['create']['ms']:.1f}ms")  # noqa: T201
+
+
+def _env():
+    env = os.environ.copy()
+    for key in ("PYTHONPROFILEIMPORTTIME", "PYTHONDONTWRITEBYTECODE"):  # measure as users see it
+        env.pop(key, None)
+    return env
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,13 @@ from typing import NamedTuple
 
 import pytest
 
+from virtualenv.app_data import AppDataDiskFolder
+from virtualenv.app_data.via_disk_folder import PyInfoIndexDisk
 from virtualenv.discovery import cached_py_info
 from virtualenv.discovery.py_info import PythonInfo, VersionInfo
 from virtualenv.discovery.py_spec import PythonSpec
 from virtualenv.info import IS_PYPY, IS_WIN, fs_supports_symlink
+from virtualenv.util.lock import ReentrantFileLock
 
 CURRENT = PythonInfo.current_system()
 
@@ -481,3 +484,107 @@ def test_uses_posix_prefix_on_debian_3_10_without_venv(mocker):
     pyver = f"{pyinfo.version_info.major}.{pyinfo.version_info.minor}"
     assert pyinfo.install_path("scripts") == "bin"
     assert pyinfo.install_path("purelib").replace(os.sep, "/") == f"lib/python{pyver}/site-packages"
+
+
+def test_py_info_index_single_file(mocker, tmp_path):
+    app_data = AppDataDiskFolder(str(tmp_path / "app-data"))
+    PythonInfo.from_exe(sys.executable, app_data, ignore_cache=True)
+    app_data.close()
+    index = tmp_path / "app-data" / "py" / "index.json"
+    assert index.exists()
+    assert sys.executable in json.loads(index.read_text(encoding="utf-8"))["entries"]
+
+    spy = mocker.spy(cached_py_info, "_run_subprocess")
+    cached_py_info._CACHE.clear()  # noqa: SLF001
+    fresh = AppDataDiskFolder(str(tmp_path / "app-data"))
+    cached_py_info.prefetch(PythonInfo, fresh, [sys.executable])
+    assert PythonInfo.from_exe(sys.executable, fresh) is not None
+    assert spy.call_count == 0
+
+
+def test_py_info_index_invalidated_by_fingerprint(tmp_path):
+    exe = tmp_path / "python"
+    exe.write_text("a", encoding="utf-8")
+    index = PyInfoIndexDisk(ReentrantFileLock(tmp_path / "py"))
+    index.put(exe, {"a": 1})
+    index.flush()
+    assert PyInfoIndexDisk(ReentrantFileLock(tmp_path / "py")).get(exe) == {"a": 1}
+
+    exe.write_text("ab", encoding="utf-8")
+    assert PyInfoIndexDisk(ReentrantFileLock(tmp_path / "py")).get(exe) is None
+
+
+def test_py_info_failure_cached_until_ttl_or_change(mocker, tmp_path):
+    exe = tmp_path / "python3-config"
+    exe.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+    exe.chmod(0o755)
+    spy = mocker.spy(cached_py_info, "_run_subprocess")
+
+    def _query():
+        cached_py_info._CACHE.pop(exe, None)  # noqa: SLF001
+        app_data = AppDataDiskFolder(str(tmp_path / "app-data"))
+        try:
+            return PythonInfo.from_exe(str(exe), app_data, raise_on_error=False)
+        finally:
+            app_data.close()
+
+    assert _query() is None
+    assert _query() is None
+    assert spy.call_count == 1  # the second run is served by the negative cache
+
+    mocker.patch.object(cached_py_info, "FAILURE_TTL", -1)
+    assert _query() is None
+    assert spy.call_count == 2  # expired
+
+    mocker.patch.object(cached_py_info, "FAILURE_TTL", 60)
+    exe.write_text("#!/bin/sh\nexit 42\n", encoding="utf-8")
+    assert _query() is None
+    assert spy.call_count == 3  # the executable changed
+
+
+def test_py_info_failure_cached_only_for_speculative_lookups_within_same_env(mocker, tmp_path):
+    exe = tmp_path / "python3"
+    exe.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+    exe.chmod(0o755)
+    spy = mocker.spy(cached_py_info, "_run_subprocess")
+
+    def _query(env, raise_on_error=False):  # noqa: FBT002
+        cached_py_info._CACHE.pop(exe, None)  # noqa: SLF001
+        app_data = AppDataDiskFolder(str(tmp_path / "app-data"))
+        try:
+            return PythonInfo.from_exe(str(exe), app_data, raise_on_error=raise_on_error, env=env)
+        finally:
+            app_data.close()
+
+    broken = {"PATH": os.environ.get("PATH", ""), "PYTHONHOME": str(tmp_path / "missing")}
+    with pytest.raises(RuntimeError):
+        _query(broken, raise_on_error=True)
+    assert _query(broken) is None
+    assert spy.call_count == 2  # an explicit lookup does not record its failure
+
+    with pytest.raises(RuntimeError, match="failed to query"):
+        _query(broken, raise_on_error=True)
+    assert spy.call_count == 3  # nor is it served a recorded one
+
+    assert _query(broken) is None
+    assert spy.call_count == 3
+    assert _query({"PATH": broken["PATH"]}) is None
+    assert spy.call_count == 4  # the environment changed
+
+
+def test_from_exe_resolves_venv_to_host(mocker, session_app_data):
+    host = copy.copy(CURRENT)
+    host.executable = host.system_executable
+    venv = copy.copy(CURRENT)
+    venv.system_executable = None
+    venv.executable = venv.original_executable = str(Path(CURRENT.prefix) / "venv" / "bin" / "python")
+    mocker.patch.object(cached_py_info, "from_exe", return_value=venv)
+    discover_exe = mocker.patch.object(PythonInfo, "discover_exe", return_value=host)
+
+    assert PythonInfo.from_exe(venv.executable, session_app_data, resolve_to_host=False) is venv
+    discover_exe.assert_not_called()
+
+    resolved = PythonInfo.from_exe(venv.executable, session_app_data)
+    assert resolved is host
+    assert resolved.executable == venv.executable
+    assert resolved.system_executable == CURRENT.system_executable
@@ -11,7 +11,8 @@ import pytest
 
 from virtualenv.discovery.builtin import Builtin, get_interpreter
 from virtualenv.discovery.py_info import PythonInfo
-from virtualenv.info import fs_supports_symlink
+from virtualenv.discovery.py_spec import PythonSpec
+from virtualenv.info import IS_WIN, fs_supports_symlink
 
 
 @pytest.mark.skipif(not fs_supports_symlink(), reason="symlink not supported")
@@ -91,3 +92,112 @@ def test_discovery_fallback_ok(session_app_data, caplog):
     assert result.executable == sys.executable, caplog.text
 
     assert "accepted" in caplog.text
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_discovery_parallel_keeps_path_order(tmp_path, monkeypatch, mocker, session_app_data, jobs):
+    from virtualenv.discovery import builtin  # noqa: PLC0415
+
+    current = PythonInfo.current_system(session_app_data)
+    folders = [tmp_path / str(i) for i in range(6)]
+    for folder in folders:
+        folder.mkdir()
+        (folder / f"python{current.version_info.major}{'.exe' if IS_WIN else ''}").touch()
+    monkeypatch.setenv("PATH", os.pathsep.join(str(i) for i in folders))
+
+    def _identify(exe, *args, **kwargs):  # noqa: ARG001
+        name = Path(exe).parent.name
+        return name if name in {"3", "5"} else None
+
+    mocker.patch.object(builtin.PathPythonInfo, "identify", side_effect=_identify)
+    spec = PythonSpec.from_string_spec(f"python{current.version_info.major}")
+    candidates = builtin._path_candidates(spec, os.environ, set())  # noqa: SLF001
+    found = [i for i, _ in builtin._interrogate(candidates, None, os.environ, jobs)]  # noqa: SLF001
+    assert found == ["3", "5"]
+
+
+@pytest.mark.skipif(not fs_supports_symlink(), reason="symlink is not supported")
+def test_discovery_interrogates_one_alias_of_a_file(tmp_path, monkeypatch, session_app_data):
+    from copy import copy  # noqa: PLC0415
+
+    from virtualenv.discovery import builtin, cached_py_info  # noqa: PLC0415
+
+    target = tmp_path / "real" / "python3"
+    target.parent.mkdir()
+    target.touch()
+    folders = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+    for folder in folders:
+        folder.mkdir()
+        (folder / "python3").symlink_to(target)
+    monkeypatch.setenv("PATH", os.pathsep.join(str(i) for i in folders))
+
+    spec = PythonSpec.from_string_spec("python3")
+    found = [exe for exe, _ in builtin._path_candidates(spec, os.environ, set(), session_app_data)]  # noqa: SLF001
+    first, aliases = str(folders[0] / "python3"), [str(i / "python3") for i in folders[1:]]
+    assert found == [first]
+
+    monkeypatch.setitem(cached_py_info._CACHE, Path(first), copy(PythonInfo.current_system()))  # noqa: SLF001
+    assert builtin.PathPythonInfo.from_exe(first, session_app_data) is not None  # interrogated, serves the aliases
+    for alias in aliases:
+        assert Path(alias) in cached_py_info._CACHE  # noqa: SLF001
+        assert builtin.PathPythonInfo.from_exe(alias, session_app_data).executable == alias
+        cached_py_info._CACHE.pop(Path(alias))  # noqa: SLF001
+
+
+def test_path_exe_finder_serves_unchanged_folders_from_app_data(tmp_path, monkeypatch, session_app_data):
+    from virtualenv.discovery.builtin import PathExeFinder  # noqa: PLC0415
+
+    for name in ("python3", "python3.12", "pip", "python3-config"):
+        (tmp_path / name).touch()
+    (tmp_path / "python3.13").mkdir()
+    os.utime(str(tmp_path), (1, 1))  # old enough to be cached
+    spec = PythonSpec.from_string_spec("python3")
+
+    finder = PathExeFinder(spec, session_app_data)
+    found = sorted(finder(tmp_path))
+    finder.flush()
+    assert found == [(tmp_path / "python3", False), (tmp_path / "python3", True), (tmp_path / "python3.12", True)]
+
+    def _scandir(path):
+        msg = f"listed {path}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    assert sorted(PathExeFinder(spec, session_app_data)(tmp_path)) == found
+
+    monkeypatch.undo()
+    (tmp_path / "python3").unlink()
+    os.utime(str(tmp_path), (2, 2))
+    assert sorted(PathExeFinder(spec, session_app_data)(tmp_path)) == [(tmp_path / "python3.12", True)]
+
+
+@pytest.mark.skipif(not fs_supports_symlink(), reason="symlink is not supported")
+def test_path_candidates_are_identified_and_only_the_accepted_one_interrogated(tmp_path, monkeypatch, session_app_data):
+    from virtualenv.discovery import builtin, cached_py_info  # noqa: PLC0415
+    from virtualenv.discovery.py_identity import PythonIdentity  # noqa: PLC0415
+
+    current = PythonInfo.current_system(session_app_data)
+    (tmp_path / f"python{current.version_info.major}").symlink_to(sys.executable)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    spec = PythonSpec.from_string_spec(f"python{current.version_info.major}")
+    interrogated = []
+    run_subprocess = cached_py_info._run_subprocess  # noqa: SLF001
+
+    def _run_subprocess(cls, exe, *args):
+        interrogated.append(exe)
+        return run_subprocess(cls, exe, *args)
+
+    monkeypatch.setattr(cached_py_info, "_run_subprocess", _run_subprocess)
+    candidates = builtin._path_candidates(spec, os.environ, set(), session_app_data)  # noqa: SLF001
+    found = [i for i, _ in builtin._interrogate(candidates, session_app_data, os.environ, 1)]  # noqa: SLF001
+
+    assert [type(i) for i in found] == [PythonIdentity]
+    identity = found[0]
+    assert identity.implementation == current.implementation
+    assert identity.version_info[:3] == current.version_info[:3]
+    assert identity.satisfies(spec, impl_must_match=True)
+    assert interrogated == []
+
+    info = identity.resolve(session_app_data)
+    assert isinstance(info, builtin.PathPythonInfo)
+    assert interrogated == [identity.executable]
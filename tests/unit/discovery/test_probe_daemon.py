@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+import sys
+from textwrap import dedent
+
+import pytest
+
+from virtualenv.discovery import probe_daemon
+from virtualenv.info import IS_WIN
+
+pytestmark = pytest.mark.skipif(IS_WIN, reason="the probe daemon uses unix sockets")
+
+
+@pytest.fixture()
+def worker_script(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(
+        dedent(
+            """
+            import json, sys
+            print("noise before the payload")
+            for token in iter(sys.stdin.readline, ""):
+                sys.stdout.write(f"{token.strip()[::-1]}{json.dumps({'exe': sys.executable})}\\n")
+                sys.stdout.flush()
+            """,
+        ),
+        encoding="utf-8",
+    )
+    return script
+
+
+@pytest.fixture()
+def socket_path(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("s", numbered=True) / "p.sock")
+
+
+def test_probe_daemon_spawns_and_answers(socket_path, worker_script):
+    first = probe_daemon.query(socket_path, sys.executable, os.environ, worker_script, idle_timeout=2)
+    second = probe_daemon.query(socket_path, sys.executable, os.environ, worker_script, spawn=False)
+    assert first == second
+    assert sys.executable in first
+
+
+def test_probe_daemon_absent_without_spawn(socket_path, worker_script):
+    assert probe_daemon.query(socket_path, sys.executable, os.environ, worker_script, spawn=False) is None
+
+
+def test_probe_daemon_bad_interpreter(socket_path, worker_script, tmp_path):
+    assert probe_daemon.query(socket_path, str(tmp_path), os.environ, worker_script, idle_timeout=2) is None
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from virtualenv.discovery.py_identity import PythonIdentity
+from virtualenv.discovery.py_info import PythonInfo
+from virtualenv.discovery.py_spec import PythonSpec
+from virtualenv.info import IS_WIN
+
+pytestmark = pytest.mark.skipif(IS_WIN, reason="the layout of Windows installs is not recognized")
+
+
+@pytest.fixture
+def install(tmp_path):
+    exe = tmp_path / "bin" / "python3.12"
+    exe.parent.mkdir()
+    exe.write_bytes(b"\x7fELF\x02" + b"\0" * 59)
+    os.chmod(str(exe), 0o755)
+    lib = tmp_path / "lib" / "python3.12"
+    lib.mkdir(parents=True)
+    (lib / "_sysconfigdata__linux_x86_64-linux-gnu.py").write_text(
+        "build_time_vars = {'ABIFLAGS': '',\n 'SIZEOF_VOID_P': 8,\n 'VERSION': '3.12',\n 'prefix': '/install'}\n",
+        encoding="utf-8",
+    )
+    link = tmp_path / "bin" / "python3"
+    link.symlink_to(exe.name)
+    return link
+
+
+def test_identify_from_layout(install):
+    identity = PythonIdentity.from_layout(PythonInfo, str(install))
+
+    assert identity is not None
+    assert identity.executable == identity.original_executable == str(install)
+    assert identity._to_dict() == {  # noqa: SLF001
+        "implementation": "CPython",
+        "version_info": [3, 12, None, None, None],
+        "architecture": 64,
+        "prefix": str(install.parents[1]),
+        "abiflags": "",
+    }
+    assert identity.satisfies(PythonSpec.from_string_spec("python3.12-64"), impl_must_match=True)
+    assert identity.satisfies(PythonSpec.from_string_spec("cpython3.12"), impl_must_match=True)
+    # the micro version is not known without running the interpreter, so left for the full interrogation to check
+    assert identity.satisfies(PythonSpec.from_string_spec("python3.12.4"), impl_must_match=True)
+    assert not identity.satisfies(PythonSpec.from_string_spec("python3.12-32"), impl_must_match=True)
+    assert not identity.satisfies(PythonSpec.from_string_spec("python3.11-64"), impl_must_match=True)
+    assert not identity.satisfies(PythonSpec.from_string_spec("pypy3.12"), impl_must_match=True)
+
+
+def _config_of_other_version(exe):
+    config = next((exe.parents[1] / "lib").rglob("_sysconfigdata_*"))
+    config.write_text("build_time_vars = {'ABIFLAGS': '', 'SIZEOF_VOID_P': 8, 'VERSION': '3.13'}\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "alter",
+    [
+        pytest.param(lambda exe: (exe.parents[1] / "pyvenv.cfg").touch(), id="venv"),
+        pytest.param(lambda exe: exe.resolve().write_bytes(b"#!/bin/sh\n"), id="not-elf"),
+        pytest.param(lambda exe: exe.resolve().write_bytes(b"\x7fELF\x01"), id="other-arch"),
+        pytest.param(_config_of_other_version, id="other-version"),
+        pytest.param(lambda exe: next((exe.parents[1] / "lib").rglob("_sysconfigdata_*")).unlink(), id="no-config"),
+    ],
+)
+def test_identify_from_layout_unrecognized(install, alter):
+    alter(install)
+
+    assert PythonIdentity.from_layout(PythonInfo, str(install)) is None
@@ -113,3 +113,30 @@ def test_relative_spec(tmp_path, monkeypatch):
     a_relative_path = str((tmp_path / "a" / "b").relative_to(tmp_path))
     spec = PythonSpec.from_string_spec(a_relative_path)
     assert spec.path == a_relative_path
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("python", (None, None, None, None, None)),
+        ("py3", (None, 3, None, None, None)),
+        ("python3.12-64", (None, 3, 12, None, 64)),
+        ("cpython3.12.1-32", ("cpython", 3, 12, 1, 32)),
+        ("pypy312", ("pypy", 3, 12, None, None)),
+    ],
+)
+def test_from_string_spec(text, expected):
+    spec = PythonSpec.from_string_spec(text)
+
+    assert spec.str_spec == text
+    assert (spec.implementation, spec.major, spec.minor, spec.micro, spec.architecture) == expected
+    assert spec.path is None
+    assert spec.is_abs is False
+
+
+def test_spec_is_abs(tmp_path):
+    spec = PythonSpec.from_string_spec(str(tmp_path))
+
+    assert spec.path == str(tmp_path)
+    assert spec.is_abs is True
+    assert PythonSpec.from_string_spec("a/b").is_abs is False
@@ -247,3 +247,92 @@ def _run_parallel_threads(tmp_path):
     for thread in threads:
         thread.join()
     return exceptions
+
+
+@pytest.mark.slow()
+def test_seed_hardlink_via_app_data(tmp_path, current_fastest):
+    result = cli_run([
+        str(tmp_path / "venv"),
+        "--no-periodic-update",
+        "--seeder",
+        "app-data",
+        "--hardlink-app-data",
+        "--app-data",
+        str(tmp_path / "app-data"),
+        "--creator",
+        current_fastest,
+    ])
+    pip_init = result.creator.purelib / "pip" / "__init__.py"
+    assert pip_init.stat().st_nlink == 2  # one in the image, one in the environment
+
+    safe_delete(tmp_path / "app-data")
+    assert pip_init.stat().st_nlink == 1
+    check_call([str(result.creator.exe), "-c", "import pip"])
+
+
+@pytest.mark.slow()
+@pytest.mark.skipif(not fs_supports_symlink(), reason="symlink is not supported")
+def test_seed_symlink_via_app_data(tmp_path, current_fastest):
+    app_data = tmp_path / "app-data"
+    for name in ("venv", "venv-2"):  # the second one installs from the image the first one built
+        result = cli_run([
+            str(tmp_path / name),
+            "--no-periodic-update",
+            "--seeder",
+            "app-data",
+            "--symlink-app-data",
+            "--app-data",
+            str(app_data),
+            "--creator",
+            current_fastest,
+        ])
+        pip = result.creator.purelib / "pip"
+        assert pip.is_symlink()
+        assert str(pip.resolve()).startswith(str(app_data.resolve()))
+        check_call([str(result.creator.exe), "-c", "import pip"])
+
+
+@pytest.mark.slow()
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_seed_jobs_records_stage_timings(tmp_path, current_fastest, jobs):
+    result = cli_run([
+        str(tmp_path / "venv"),
+        "--no-periodic-update",
+        "--seeder",
+        "app-data",
+        "--seed-jobs",
+        str(jobs),
+        "--app-data",
+        str(tmp_path / "app-data"),
+        "--creator",
+        current_fastest,
+    ])
+    timings = result.seeder.timings
+    assert set(timings) == {"acquire", "image", "install", "scripts"}
+    assert all("pip" in stage for stage in timings.values())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows launchers are always generated via distlib")
+def test_seed_console_scripts_from_rendered_image(tmp_path, current_fastest):
+    from virtualenv.seed.embed.via_app_data.pip_install.base import CONSOLE_SCRIPTS  # noqa: PLC0415
+
+    def _create(name):
+        return cli_run([
+            str(tmp_path / name),
+            "--no-periodic-update",
+            "--seeder",
+            "app-data",
+            "--app-data",
+            str(tmp_path / "app-data"),
+            "--creator",
+            current_fastest,
+        ])
+
+    first, second = _create("first"), _create("second")  # the second installs the scripts rendered by the first
+    assert next((tmp_path / "app-data").rglob(CONSOLE_SCRIPTS), None) is not None
+    assert not (second.creator.purelib / CONSOLE_SCRIPTS).exists()
+    for result in (first, second):
+        pip = result.creator.script_dir / "pip"
+        assert pip.read_text(encoding="utf-8").startswith(f"#!{result.creator.exe}\n")
+        assert os.access(str(pip), os.X_OK)
+        check_call([str(pip), "--version"])
@@ -29,3 +29,32 @@ def test_wheel_not_support():
 def test_wheel_repr():
     wheel = get_embed_wheel("setuptools", MAX)
     assert str(wheel.path) in repr(wheel)
+
+
+def test_wheel_index_persisted_until_folder_changes(tmp_path, mocker):
+    import os  # noqa: PLC0415
+    import time  # noqa: PLC0415
+
+    from virtualenv.app_data import AppDataDiskFolder  # noqa: PLC0415
+    from virtualenv.seed.wheels import util  # noqa: PLC0415
+
+    folder = tmp_path / "wheels"
+    folder.mkdir()
+    for name in ("pip-24.0-py3-none-any.whl", "pip-23.1-py3-none-any.whl", "setuptools-70.0-py3-none-any.whl"):
+        (folder / name).touch()
+    past = time.time() - 60
+    os.utime(str(folder), (past, past))  # not modified within the racy window
+    app_data = AppDataDiskFolder(str(tmp_path / "app-data"))
+
+    index = util.wheel_index(folder, app_data)
+    assert index["pip"] == {"24.0": ["pip-24.0-py3-none-any.whl"], "23.1": ["pip-23.1-py3-none-any.whl"]}
+    assert app_data.wheel_index(folder).exists()
+
+    util._INDEXES.clear()  # noqa: SLF001
+    scan = mocker.spy(util, "_scan")
+    assert util.wheel_index(folder, app_data) == index  # served from the app data, without listing the folder
+    assert scan.call_count == 0
+
+    (folder / "pip-24.1-py3-none-any.whl").touch()
+    assert "24.1" in util.wheel_index(folder, app_data)["pip"]
+    assert scan.call_count == 1
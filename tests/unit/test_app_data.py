@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import zipfile
+
+import pytest
+
+from virtualenv.app_data import AppDataDiskFolder, OverlayAppData, make_app_data
+from virtualenv.app_data.trim import parse_size, trim
+from virtualenv.app_data.wheel_store import WheelReader, wheel_digest
+from virtualenv.util.lock import ReentrantFileLock
+
+
+@pytest.fixture
+def demo_wheel(tmp_path):
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(str(wheel), "w") as zip_file:
+        zip_file.writestr("demo/__init__.py", "")
+        zip_file.writestr("demo/empty.py", "")
+        zip_file.writestr("demo-1.0.dist-info/entry_points.txt", "[console_scripts]\ndemo = demo:main\n")
+        zip_file.writestr("demo-1.0.dist-info/RECORD", "")
+    return wheel
+
+
+def test_make_app_data_with_shared(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    app_data = make_app_data(str(tmp_path / "user"), read_only=False, env={}, shared=str(shared))
+    assert isinstance(app_data, OverlayAppData)
+
+    app_data = make_app_data(str(tmp_path / "user"), read_only=False, env={}, shared=str(tmp_path / "missing"))
+    assert type(app_data) is AppDataDiskFolder
+
+
+def test_overlay_wheel_image_falls_through_to_user(tmp_path):
+    shared = tmp_path / "shared"
+    AppDataDiskFolder(str(shared)).wheel_image("3.12", "pip-24.0-py3-none-any").mkdir(parents=True)
+    app_data = OverlayAppData(str(tmp_path / "user"), str(shared))
+
+    assert str(app_data.wheel_image("3.12", "pip-24.0-py3-none-any")).startswith(str(shared.resolve()))
+    assert str(app_data.wheel_image("3.11", "pip-24.0-py3-none-any")).startswith(str(app_data.lock.path))
+
+
+def test_overlay_py_info_index_falls_through_to_user(tmp_path):
+    shared, user = AppDataDiskFolder(str(tmp_path / "shared")), str(tmp_path / "user")
+    shared.py_info_index.put(sys.executable, {"from": "shared"})
+    shared.close()
+
+    app_data = OverlayAppData(user, str(tmp_path / "shared"))
+    assert app_data.py_info_index.get(sys.executable) == {"from": "shared"}
+    app_data.py_info_index.put(__file__, {"from": "user"})
+    app_data.close()
+    assert not (tmp_path / "shared" / "py" / "index.json").read_text(encoding="utf-8").count(__file__)
+
+    app_data = OverlayAppData(user, str(tmp_path / "shared"))
+    assert app_data.py_info_index.validate([sys.executable, __file__]) == {
+        sys.executable: {"from": "shared"},
+        __file__: {"from": "user"},
+    }
+
+
+def test_overlay_plugins_read_shared_write_user(tmp_path):
+    shared = AppDataDiskFolder(str(tmp_path / "shared"))
+    shared.plugins().write({"from": "shared"})
+    app_data = OverlayAppData(str(tmp_path / "user"), str(tmp_path / "shared"))
+
+    store = app_data.plugins()
+    assert store.read() == {"from": "shared"}
+    store.write({"from": "user"})
+    assert store.read() == {"from": "user"}
+    assert shared.plugins().read() == {"from": "shared"}
+
+
+def test_wheel_content_store_shares_blobs_between_images(tmp_path, demo_wheel):
+    store = AppDataDiskFolder(str(tmp_path / "app-data")).wheel_store()
+    digest = wheel_digest(demo_wheel)
+
+    def in_place(name):
+        return ".dist-info/" in name
+
+    for version in ("3.11", "3.12"):
+        store.materialize(demo_wheel, digest, tmp_path / version, in_place)
+
+    assert store.has(digest)
+    blobs = [i for i in (store.folder / "blob").rglob("*") if i.is_file()]
+    assert len(blobs) == 2  # the empty files of the wheel share one, the entry points take the other
+    empty = next(i for i in blobs if not i.stat().st_size)
+    assert os.stat(str(empty)).st_nlink == 5  # the blob plus the two python files of both images
+    assert os.stat(str(tmp_path / "3.12" / "demo-1.0.dist-info" / "RECORD")).st_nlink == 1
+
+    for blob in blobs:  # removed blobs are restored from the wheel
+        blob.unlink()
+    store.materialize(demo_wheel, digest, tmp_path / "3.13", in_place)
+    assert (tmp_path / "3.13" / "demo" / "empty.py").exists()
+
+
+def test_wheel_reader_streams_members_and_reads_metadata(tmp_path, demo_wheel):
+    with WheelReader(demo_wheel) as reader:
+        assert reader.dist_info == "demo-1.0.dist-info"
+        assert reader.metadata("entry_points.txt") == "[console_scripts]\ndemo = demo:main\n"
+        assert reader.metadata("METADATA") is None
+        reader.extract_all(tmp_path / "image")
+    extracted = tmp_path / "image" / "demo-1.0.dist-info" / "entry_points.txt"
+    assert extracted.read_text(encoding="utf-8") == "[console_scripts]\ndemo = demo:main\n"
+
+
+def test_trim_evicts_least_recently_used_first(tmp_path):
+    images, now = [], time.time()
+    for at, version in enumerate(("3.10", "3.11", "3.12", "3.13")):
+        image = AppDataDiskFolder(str(tmp_path)).wheel_image(version, "CopyPipInstall/pip-24.0-py3-none-any")
+        image.mkdir(parents=True)
+        (image / "pip.py").write_bytes(b"1" * 1000)
+        os.utime(str(image), (now - 3 * 60 * 60 + at, now - 3 * 60 * 60 + at))
+        images.append(image)
+    os.utime(str(images[3]), None)  # just used, so within the grace period
+
+    assert trim(tmp_path, 3000) == 1000
+    assert [i.exists() for i in images] == [False, True, True, True]
+
+    held, release = threading.Event(), threading.Event()
+
+    def _hold():
+        with ReentrantFileLock(images[1].parent).lock_for_key(images[1].name):
+            held.set()
+            release.wait()
+
+    thread = threading.Thread(target=_hold)
+    thread.start()
+    held.wait()
+    try:
+        assert trim(tmp_path, 0) == 1000  # the locked one is skipped, the one within the grace period kept
+    finally:
+        release.set()
+        thread.join()
+    assert [i.exists() for i in images] == [False, True, False, True]
+
+
+def test_parse_size():
+    assert parse_size("1024") == 1024
+    assert parse_size("500M") == 500 * 1024 * 1024
+    assert parse_size("1.5gb") == 3 * 1024 * 1024 * 1024 // 2
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import json
 import logging
+import subprocess
+import sys
 
 import pytest
 
 from virtualenv import __version__
-from virtualenv.run import cli_run, session_via_cli
+from virtualenv.activation import via_template
+from virtualenv.app_data import AppDataDiskFolder
+from virtualenv.discovery.builtin import Builtin
+from virtualenv.info import IS_WIN
+from virtualenv.run import cli_run, cli_run_many, session_via_cli
+from virtualenv.run.plugin import base
+from virtualenv.run.plugin.base import LazyEntryPoint
+from virtualenv.run.template import EnvTemplate
+from virtualenv.run.timings import Timings
 
 
 def test_help(capsys):
@@ -41,3 +52,146 @@ def test_logging_setup(caplog, on):
         assert not caplog.records
     else:
         assert caplog.records
+
+
+@pytest.mark.slow()
+def test_template_cache_materializes_relocated_env(tmp_path, mocker):
+    app_data = str(tmp_path / "app-data")
+    args = ["--template-cache", "--app-data", app_data, "--no-periodic-update", "--activators", "bash"]
+    first = cli_run([str(tmp_path / "a"), *args])
+    build = mocker.spy(EnvTemplate, "build")
+    second = cli_run([str(tmp_path / "b"), *args])
+    assert build.call_count == 0
+
+    for session in (first, second):
+        dest = session.creator.dest
+        activate = (session.creator.bin_dir / "activate").read_text(encoding="utf-8")
+        assert str(dest) in activate
+        assert "_virtualenv_template_" not in activate
+        out = subprocess.check_output([str(session.creator.exe), "-c", "import sys, pip; print(sys.prefix)"], text=True)
+        assert out.strip() == str(dest)
+
+
+@pytest.mark.slow()
+@pytest.mark.skipif(IS_WIN, reason="console scripts are executables on Windows")
+def test_template_cache_skips_destination_with_space(tmp_path, mocker):
+    args = ["--template-cache", "--app-data", str(tmp_path / "app-data"), "--no-periodic-update"]
+    cli_run([str(tmp_path / "a"), *args])
+    materialize = mocker.spy(EnvTemplate, "materialize")
+    session = cli_run([str(tmp_path / "with space"), *args])
+    assert materialize.call_count == 0  # a plain shebang can't hold the path, created regularly
+
+    pip = session.creator.bin_dir / "pip"
+    assert not pip.read_text(encoding="utf-8").startswith(f"#!{session.creator.dest}")
+    assert str(session.creator.dest) in subprocess.check_output([str(pip), "--version"], text=True)
+
+
+@pytest.mark.slow()
+def test_template_cache_remembers_not_relocatable(tmp_path, mocker):
+    walk = EnvTemplate._walk  # noqa: SLF001
+
+    def _walk(self):
+        (self.root / "embeds.bin").write_bytes(b"\0" + self.placeholder.encode("utf-8"))  # e.g. a compiled extension
+        yield from walk(self)
+
+    mocker.patch.object(EnvTemplate, "_walk", autospec=True, side_effect=_walk)
+    build = mocker.spy(EnvTemplate, "build")
+    args = ["--template-cache", "--app-data", str(tmp_path / "app-data"), "--no-periodic-update", "--no-seed"]
+    for name in ("a", "b"):
+        session = cli_run([str(tmp_path / name), *args])
+        assert session.creator.exe.exists()
+        assert not (session.creator.dest / "embeds.bin").exists()  # created regularly, not from the template
+    assert build.call_count == 1
+
+
+@pytest.mark.slow()
+def test_cli_run_many(tmp_path, mocker):
+    discover = mocker.spy(Builtin, "run")
+    dests = [tmp_path / str(i) for i in range(3)]
+    results = cli_run_many(dests, ["--no-seed"], jobs=2)
+    assert discover.call_count == 1
+
+    assert [r.dest for r in results] == [str(i) for i in dests]
+    for result in results:
+        assert result.error is None
+        assert result.elapsed > 0
+        assert (result.session.creator.dest / "pyvenv.cfg").exists()
+
+
+@pytest.mark.slow()
+def test_cli_run_many_activators_read_templates_once(tmp_path, mocker):
+    via_template._read_template.cache_clear()  # noqa: SLF001
+    read = mocker.spy(via_template, "read_binary")
+    dests = [tmp_path / str(i) for i in range(2)]
+    results = cli_run_many(dests, ["--no-seed", "--activators", "bash,python"], jobs=1)
+
+    for result in results:
+        assert result.error is None
+        creator = result.session.creator
+        assert str(creator.dest) in (creator.bin_dir / "activate").read_text(encoding="utf-8")
+        assert (creator.bin_dir / "activate_this.py").exists()
+    assert read.call_count == 2  # one per template, not per environment
+
+
+def test_timings_json(tmp_path):
+    timings_file = tmp_path / "timings.json"
+    session = cli_run([str(tmp_path / "env"), "--no-seed", "--activators", "bash", "--timings-json", str(timings_file)])
+
+    content = json.loads(timings_file.read_text(encoding="utf-8"))
+    assert content["dest"] == str(session.creator.dest)
+    assert content["virtualenv"] == __version__
+    assert list(content["phases_ms"]) == ["discovery", "create", "activate", "activate.bash"]
+    assert content["total_ms"] >= sum(v for k, v in content["phases_ms"].items() if "." not in k)
+    assert [name for name, _ in session.timings.items()] == list(content["phases_ms"])
+
+
+@pytest.mark.slow()
+def test_cli_run_many_timings_json_per_destination(tmp_path):
+    dests = [tmp_path / str(i) for i in range(2)]
+    cli_run_many(dests, ["--no-seed", "--timings-json", str(tmp_path / "timings.json")], jobs=1)
+
+    assert not (tmp_path / "timings.json").exists()
+    for at, dest in enumerate(dests):
+        content = json.loads((tmp_path / f"timings-{at}.json").read_text(encoding="utf-8"))
+        assert content["dest"] == str(dest)
+        assert "create" in content["phases_ms"]
+
+
+def test_timings_accumulate_and_copy():
+    timings = Timings()
+    timings.add("seed.install.pip", 1)
+    timings.add("seed.install.pip", 2)
+    with timings.phase("create"):
+        pass
+    duplicate = timings.copy()
+    duplicate.add("seed.install.pip", 1)
+
+    assert dict(timings.items())["seed.install.pip"] == 3
+    assert dict(duplicate.items())["seed.install.pip"] == 4
+    assert [name for name, _ in timings.items()] == ["seed.install.pip", "create"]
+
+
+def test_plugin_entry_points_cached_in_app_data(tmp_path, mocker):
+    app_data = AppDataDiskFolder(str(tmp_path))
+    scan = mocker.spy(base, "_scan_entry_points")
+    first = base._load_entry_points(app_data)  # noqa: SLF001
+    second = base._load_entry_points(app_data)  # noqa: SLF001
+    assert first == second
+    assert "builtin" in dict(first["virtualenv.discovery"])
+    assert scan.call_count == 1
+
+    mocker.patch.object(base, "_path_signature", return_value=[["changed", 1]])
+    base._load_entry_points(app_data)  # noqa: SLF001
+    assert scan.call_count == 2
+
+
+def test_plugin_lazy_entry_point_imports_on_load():
+    entry_point = LazyEntryPoint("builtin", "virtualenv.discovery.builtin:Builtin")
+    assert entry_point.load() is Builtin
+
+
+def test_import_does_not_load_network_or_seed_stack():
+    # virtualenv itself keeps these slow imports out of the start-up, only downloading wheels or seeding needs them
+    code = "import sys, virtualenv.run; print(' '.join(sorted(sys.modules)))"
+    loaded = set(subprocess.check_output([sys.executable, "-c", code], text=True).split())
+    assert not loaded & {"urllib.request", "distlib.scripts", "virtualenv.seed.wheels.periodic_update"}
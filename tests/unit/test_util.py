@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import concurrent.futures
+import errno
+import os
+import sys
 import traceback
 
 import pytest
 
-from virtualenv.util.lock import ReentrantFileLock
+from virtualenv.util.lock import LOCK_WAITS, ReentrantFileLock, Timeout
 from virtualenv.util.subprocess import run_cmd
 
 
@@ -34,3 +37,100 @@ def test_reentrant_file_lock_is_thread_safe(tmp_path):
                 task.result()
             except Exception:  # noqa: BLE001, PERF203
                 pytest.fail(traceback.format_exc())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared locks fallback to exclusive ones on Windows")
+def test_shared_lock_admits_readers_but_not_writers(tmp_path):
+    lock = ReentrantFileLock(tmp_path)
+    with lock.shared_lock_for_key("image"), lock.shared_lock_for_key("image", no_block=True):
+        with pytest.raises(Timeout), lock.lock_for_key("image", no_block=True):
+            pass  # pragma: no cover
+    with lock.lock_for_key("image", no_block=True):
+        waits = LOCK_WAITS.count
+        with pytest.raises(Timeout), lock.shared_lock_for_key("image", no_block=True):
+            pass  # pragma: no cover
+        assert LOCK_WAITS.count == waits
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path):
+    from virtualenv.util.path import write_atomic  # noqa: PLC0415
+
+    target = tmp_path / "folder" / "data.json"
+    write_atomic(target, b"old")
+    write_atomic(target, b"new")
+    assert target.read_bytes() == b"new"
+    assert [i.name for i in target.parent.iterdir()] == ["data.json"]
+
+
+def test_copy_file_clones_content(tmp_path):
+    from virtualenv.util.path import clone_method, copy_file  # noqa: PLC0415
+
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    src.chmod(0o750)
+    copy_file(str(src), str(dest))
+    assert dest.read_bytes() == src.read_bytes()
+    assert dest.stat().st_mode == src.stat().st_mode
+    device = src.stat().st_dev
+    assert clone_method(device, device) in {"reflink", "copy_file_range", "sendfile", "buffered"}
+
+
+def test_copy_file_falls_back_when_not_supported(tmp_path, mocker):
+    from virtualenv.util.path import _clone  # noqa: PLC0415
+
+    def _unsupported(*args):  # noqa: ARG001
+        raise OSError(errno.EXDEV, "cross device")
+
+    mocker.patch.object(_clone, "METHODS", [_unsupported, _clone._buffered])  # noqa: SLF001
+    mocker.patch.dict(_clone._METHOD_FOR_DEVICES, clear=True)  # noqa: SLF001
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.write_bytes(b"content")
+    _clone.clone_file(str(src), str(dest))
+    assert dest.read_bytes() == b"content"
+    assert _clone.clone_method(src.stat().st_dev, dest.stat().st_dev) == "buffered"
+
+
+def test_copy_file_falls_back_on_short_copy(tmp_path, mocker):
+    from virtualenv.util.path import _clone  # noqa: PLC0415
+
+    def _short(src_fd, dst_fd, size):
+        os.write(dst_fd, os.read(src_fd, 3))  # moves the offset of both files, as copy_file_range does
+        raise _clone._ShortCopyError("short", 3, size)  # noqa: SLF001
+
+    mocker.patch.object(_clone, "METHODS", [_short, _clone._buffered])  # noqa: SLF001
+    mocker.patch.dict(_clone._METHOD_FOR_DEVICES, clear=True)  # noqa: SLF001
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.write_bytes(b"content")
+    _clone.clone_file(str(src), str(dest))
+    assert dest.read_bytes() == b"content"
+
+    if hasattr(os, "copy_file_range"):
+        mocker.patch.object(os, "copy_file_range", return_value=0)
+        with src.open("rb") as source, dest.open("wb") as target, pytest.raises(OSError, match="copied only 0 of 7"):
+            _clone._copy_file_range(source.fileno(), target.fileno(), 7)  # noqa: SLF001
+
+
+def test_profile_writes_stats_summary_and_probes(tmp_path):
+    import pstats  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+
+    from virtualenv.util.profiling import probe_cmd, profile, profile_target  # noqa: PLC0415
+
+    out = tmp_path / "run.pstats"
+    assert profile_target(["--profile", str(out), "venv"], {}) == str(out)
+    assert profile_target(["venv"], {"VIRTUALENV_PROFILE": str(out)}) == str(out)
+    assert profile_target(["venv"], {}) is None
+    script = tmp_path / "probe.py"
+    script.write_text("import sys; assert sys.argv[1:] == ['a']", encoding="utf-8")
+    cmd = [sys.executable, str(script), "a"]
+    assert probe_cmd(cmd) == cmd
+
+    with profile(str(out)):
+        subprocess.check_call(probe_cmd(cmd))
+    assert probe_cmd(cmd) == cmd
+
+    assert pstats.Stats(str(out)).total_calls
+    assert "cumulative" in (tmp_path / "run.pstats.txt").read_text(encoding="utf-8")
+    probes = list((tmp_path / "run.pstats.probes").iterdir())
+    assert len(probes) == 1
+    assert pstats.Stats(str(probes[0])).total_calls